@@ -1 +1 @@
-from . import linters, pre_commit, printing, project, system
+from . import api, linters, pages, pre_commit, printing, project, system
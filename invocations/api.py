@@ -0,0 +1,30 @@
+import invoke
+
+from . import printing
+
+
+@invoke.task
+def sweep_orphans(
+    context: invoke.Context,
+    dry_run: bool = False,
+    min_age: float = 24,
+    legacy_names: bool = False,
+) -> None:
+    """Remove old posts generated by tests from API.
+
+    Args:
+    ----
+        context: invoke's context
+        dry_run: only prepare report without removing posts
+        min_age: remove only posts older than this number of hours
+        legacy_names: also process posts with names of old format
+
+    """
+    printing.print_success("Sweeping orphan posts")
+    command = f"python -m plugins.api_plugin.sweeper --min-age {min_age}"
+    if dry_run:
+        command += " --dry-run"
+    if legacy_names:
+        command += " --legacy-names"
+    with context.cd("src"):
+        context.run(command)
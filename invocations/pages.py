@@ -0,0 +1,26 @@
+import invoke
+
+from . import printing
+
+
+@invoke.task
+def validate_locators(
+    context: invoke.Context,
+    snapshots_dir: str = "../html_snapshots",
+    slow_threshold: float = 5.0,
+) -> None:
+    """Validate locators of page objects against saved HTML of pages.
+
+    Args:
+    ----
+        context: invoke's context
+        snapshots_dir: folder with HTML snapshots saved by `HTML_SNAPSHOTS_DIR`
+        slow_threshold: report locators evaluated longer than this number of ms
+
+    """
+    printing.print_success("Validating locators of page objects")
+    with context.cd("src"):
+        context.run(
+            "python -m pages.locators_validation "
+            f"--snapshots-dir {snapshots_dir} --slow-threshold {slow_threshold}",
+        )
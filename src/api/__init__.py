@@ -1 +1,10 @@
-from .posts import delete_post, get_post_by_id, get_post_by_name, is_post_exists
+from .posts import (
+    delete_post,
+    get_post_by_id,
+    get_post_by_name,
+    is_post_exists,
+    iter_posts,
+    wait_for_post_by_name,
+    wait_until_post_exists,
+    wait_until_post_gone,
+)
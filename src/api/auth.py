@@ -0,0 +1,28 @@
+import os
+
+from phuongpv_blog_api_client import AuthenticatedClient, Client, models
+from phuongpv_blog_api_client.api.auth import auth_login_create
+
+
+def get_api_token() -> str:
+    """Log in as super user and get API token."""
+    token = auth_login_create.sync(
+        client=Client(f"{os.environ['APP_BASE_URL']}"),  # type: ignore
+        body=models.AuthTokenRequest(
+            email=os.environ["SUPER_USER_EMAIL"],
+            password=os.environ["SUPER_USER_PASSWORD"],
+        ),
+    )
+    if not isinstance(token, models.Token):
+        raise ValueError(f"Failed to get a token. Got: {token}")
+    return token.token
+
+
+def get_api_client(token: str) -> AuthenticatedClient:
+    """Prepare authenticated phuongpv client for sdk."""
+    return AuthenticatedClient(
+        base_url=os.environ["APP_BASE_URL"],
+        prefix="token",
+        token=token,
+        raise_on_unexpected_status=True,
+    )
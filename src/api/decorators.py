@@ -1,11 +1,28 @@
+import logging
+import os
+import time
+from collections import defaultdict
 from collections.abc import Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar
 
+import tenacity
+
 APIObject = TypeVar("APIObject")
 FunctionParams = ParamSpec("FunctionParams")
 AttrValue = TypeVar("AttrValue")
 
+LOGGER = logging.getLogger(__name__)
+
+# How much to wait until changes become visible in API
+API_WAIT_TIMEOUT = float(os.environ.get("API_WAIT_TIMEOUT", 10))
+# Delay before the first re-check, next ones grow exponentially up to max delay
+API_POLL_INITIAL_DELAY = 0.05
+API_POLL_MAX_DELAY = 1.0
+
+# How much time it took for changes to become visible, grouped by function name
+CONSISTENCY_TIMINGS: defaultdict[str, list[float]] = defaultdict(list)
+
 
 def is_exists(
     api_function: Callable[FunctionParams, APIObject],
@@ -40,3 +57,115 @@ def is_exists(
         return True
 
     return wrapper
+
+
+def wait_for(
+    api_function: Callable[FunctionParams, APIObject],
+    timeout: float = API_WAIT_TIMEOUT,
+) -> Callable[FunctionParams, APIObject]:
+    """Decorate `get_{model}_by_something` functions to wait until object is visible in API.
+
+    API is eventually consistent, so object created via UI may be not found by
+    search right away. Function is called until it stops raising
+    `AssertionError` or `timeout` is reached. Delay between calls starts small
+    and grows exponentially with jitter.
+
+    Time which it took for object to become visible is stored in
+    `CONSISTENCY_TIMINGS`.
+
+    Example:
+        wait_for_post_by_name = wait_for(get_post_by_name)
+
+    """
+
+    @wraps(api_function)
+    def wrapper(
+        *args: FunctionParams.args,
+        **kwargs: FunctionParams.kwargs,
+    ) -> APIObject:
+        started_at = time.monotonic()
+        result = _get_retrying(
+            timeout=timeout,
+            retry=tenacity.retry_if_exception_type(AssertionError),
+        )(api_function, *args, **kwargs)
+        _record_consistency_time(api_function, started_at)
+        return result
+
+    return wrapper
+
+
+def wait_until_exists(
+    api_function: Callable[FunctionParams, APIObject],
+    timeout: float = API_WAIT_TIMEOUT,
+) -> Callable[FunctionParams, bool]:
+    """Decorate `get_{model}_by_something` functions to wait until object appears in API.
+
+    Unlike `wait_for` return boolean indicating if `{APIObject}` exists.
+
+    Example:
+        wait_until_post_exists = wait_until_exists(get_post_by_name)
+
+    """
+    return _wait_until(is_exists(api_function), expected=True, timeout=timeout)
+
+
+def wait_until_gone(
+    api_function: Callable[FunctionParams, APIObject],
+    timeout: float = API_WAIT_TIMEOUT,
+) -> Callable[FunctionParams, bool]:
+    """Decorate `get_{model}_by_something` functions to wait until object disappears from API.
+
+    Return boolean indicating if `{APIObject}` is removed.
+
+    Example:
+        wait_until_post_gone = wait_until_gone(get_post_by_name)
+
+    """
+    return _wait_until(is_exists(api_function), expected=False, timeout=timeout)
+
+
+def _wait_until(
+    is_exists_function: Callable[FunctionParams, bool],
+    expected: bool,
+    timeout: float,
+) -> Callable[FunctionParams, bool]:
+    """Call `is_{model}_exists` function until it returns expected value."""
+
+    @wraps(is_exists_function)
+    def wrapper(
+        *args: FunctionParams.args,
+        **kwargs: FunctionParams.kwargs,
+    ) -> bool:
+        started_at = time.monotonic()
+        try:
+            _get_retrying(
+                timeout=timeout,
+                retry=tenacity.retry_if_result(lambda is_exists: is_exists != expected),
+            )(is_exists_function, *args, **kwargs)
+        except tenacity.RetryError:
+            return False
+        _record_consistency_time(is_exists_function, started_at)
+        return True
+
+    return wrapper
+
+
+def _get_retrying(timeout: float, retry: tenacity.retry_base) -> tenacity.Retrying:
+    """Prepare deadline-based polling with exponential backoff and jitter."""
+    return tenacity.Retrying(
+        stop=tenacity.stop_after_delay(timeout),
+        wait=tenacity.wait_exponential_jitter(
+            initial=API_POLL_INITIAL_DELAY,
+            max=API_POLL_MAX_DELAY,
+            jitter=API_POLL_INITIAL_DELAY,
+        ),
+        retry=retry,
+        reraise=True,
+    )
+
+
+def _record_consistency_time(api_function: Callable[..., object], started_at: float) -> None:
+    """Save time which it took for changes to become visible in API."""
+    consistency_time = time.monotonic() - started_at
+    CONSISTENCY_TIMINGS[api_function.__name__].append(consistency_time)
+    LOGGER.debug(msg=f"`{api_function.__name__}` got consistent in {consistency_time:.2f}s")
@@ -0,0 +1,71 @@
+from collections.abc import Callable, Iterator
+from concurrent import futures
+from typing import Any, Protocol, TypeVar
+
+from phuongpv_blog_api_client.types import Unset
+
+Item = TypeVar("Item")
+
+
+class PaginatedList(Protocol[Item]):
+    """Represent interface of generated paginated lists from SDK, e.g. `PaginatedPostList`."""
+
+    @property
+    def next(self) -> str | None | Unset: ...
+
+    @property
+    def results(self) -> list[Item]: ...
+
+
+def iterate_list(
+    list_function: Callable[..., PaginatedList[Item] | Any],
+    max_items: int | None = None,
+    **params,
+) -> Iterator[Item]:
+    """Lazily iterate over all items of paginated `*_list` endpoint.
+
+    Next page is requested in background while items of current one are
+    consumed, only these two pages are kept in memory.
+
+    Example:
+        for post in iterate_list(posts_list.sync, client=client, search="Blog"):
+            ...
+
+    Args:
+        list_function: `sync` function of `*_list` endpoint.
+        max_items: Stop iteration after this number of items.
+        params: Arguments for `list_function` (except `page`).
+
+    """
+
+    def _get_page(page_number: int) -> PaginatedList[Item]:
+        page = list_function(page=page_number, **params)
+        assert isinstance(getattr(page, "results", None), list), page
+        return page
+
+    if max_items is not None and max_items <= 0:
+        return
+
+    items_count = 0
+    page_number = 1
+    executor = futures.ThreadPoolExecutor(max_workers=1)
+    next_page: futures.Future[PaginatedList[Item]] | None = executor.submit(
+        _get_page,
+        page_number,
+    )
+    try:
+        while next_page:
+            page = next_page.result()
+            next_page = None
+            if page.next:
+                page_number += 1
+                next_page = executor.submit(_get_page, page_number)
+            for item in page.results:
+                yield item
+                items_count += 1
+                if items_count == max_items:
+                    return
+    finally:
+        # Don't wait for prefetched page if iteration is stopped, its request
+        # is finished in background and its result is dropped
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,10 +1,12 @@
+from collections.abc import Iterator
 from http import HTTPStatus
 
 from phuongpv_blog_api_client import AuthenticatedClient, models
 from phuongpv_blog_api_client.api.posts import posts_destroy, posts_list, posts_retrieve
 from phuongpv_blog_api_client.types import Unset
 
-from .decorators import is_exists
+from .decorators import is_exists, wait_for, wait_until_exists, wait_until_gone
+from .pagination import iterate_list
 
 
 def get_post_by_name(client: AuthenticatedClient, post_name: str) -> models.Post | None:
@@ -19,6 +21,18 @@ def get_post_by_name(client: AuthenticatedClient, post_name: str) -> models.Post
 
 
 is_post_exists = is_exists(get_post_by_name)
+wait_for_post_by_name = wait_for(get_post_by_name)
+wait_until_post_exists = wait_until_exists(get_post_by_name)
+wait_until_post_gone = wait_until_gone(get_post_by_name)
+
+
+def iter_posts(
+    client: AuthenticatedClient,
+    max_items: int | None = None,
+    **params,
+) -> Iterator[models.Post]:
+    """Lazily iterate over all blog posts matching `params`, e.g. `search`."""
+    return iterate_list(posts_list.sync, max_items=max_items, client=client, **params)
 
 
 def get_post_by_id(client: AuthenticatedClient, post_id: int) -> models.Post | None:
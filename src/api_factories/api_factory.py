@@ -1,11 +1,14 @@
+import inspect
 import typing
 from collections.abc import Callable, Generator
 from contextlib import suppress
-from functools import wraps
-from typing import Concatenate, ParamSpec, TypeVar
+from functools import update_wrapper, wraps
+from typing import Concatenate, Generic, ParamSpec, TypeVar
 
 from _pytest.fixtures import SubRequest
 
+from plugins.api_plugin.cleanup_queue import schedule_cleanup
+from plugins.api_plugin.object_pools import ObjectPool, get_object_pools
 from plugins.selenium_plugin.cache_decorators import get_cache
 
 APIObject = TypeVar("APIObject")
@@ -41,6 +44,8 @@ def api_factory(
 
     Decorated function requires `request` argument and will be finished after
     the last test within the requesting test context finished execution.
+    If `--deferred-cleanup` is enabled, the code after `yield` is run in
+    background cleanup queue instead.
 
     There was an attempt to implement the `delete_from_api` logic that we write in each factory
     directly in the decorator.
@@ -57,30 +62,172 @@ def api_factory(
         **kwargs: FactoryParams.kwargs,
     ) -> APIObject:
         factory_generator = factory(*args, **kwargs)
+        created_object = next(factory_generator)
+        _add_finalizer(request, factory, factory_generator, created_object)
+        return created_object
 
-        def _finalize_generator(generator: FactoryGenerator[APIObject]) -> None:
-            """Suppress exception to allow running code after `yield`.
+    return wrapper
+
+
+class PooledApiFactory(Generic[FactoryParams, APIObject]):
+    """API factory which hands out pre-created objects from pool.
 
-            Function-based factory is generator object with just one yielded
-            object that should have the following structure:
+    Use it for factories which are used by tests that just need "some existing
+    object", e.g.:
 
-                Init object -> yield object -> remove object
+    ```
+    @pooled_api_factory(pool_size=5, key_params=("title",))
+    def post_factory(
+        client: AuthenticatedClient,
+        title: str = Default,
+    ) -> FactoryGenerator[models.Post]:
+        ...
 
-            To make possible to run the code after `yield` just suppress
-            `StopIteration` exception and call `next`.
+    ```
 
-            """
-            # When caching enabled do not delete objects from API
-            if get_cache(request):
-                return
-            with suppress(StopIteration):
-                next(generator)
+    When `--api-pools` is enabled, `pool_size` objects are created in bulk
+    for each combination of `key_params` values (use `prefill` to do it at
+    session start), each call takes one object from the pool and the pool is
+    topped up in background. Taken objects are removed like in usual
+    `api_factory`, and unused ones are removed in bulk at the end of session.
 
-        request.addfinalizer(lambda: _finalize_generator(factory_generator))
+    Values of `key_params` have to be hashable. Other arguments, e.g. API
+    client of session, aren't part of the key: pool creates all its objects
+    with arguments of the call which created the pool.
 
-        return next(factory_generator)
+    When `--api-pools` is disabled, it works as usual `api_factory`.
 
-    return wrapper
+    """
+
+    def __init__(
+        self,
+        factory: Callable[FactoryParams, FactoryGenerator[APIObject]],
+        pool_size: int,
+        key_params: tuple[str, ...] = (),
+    ) -> None:
+        self.factory = factory
+        self.pool_size = pool_size
+        self.key_params = key_params
+        self.signature = inspect.signature(factory)
+        if unknown_params := set(key_params) - set(self.signature.parameters):
+            raise ValueError(
+                f"Unknown key params of `{factory.__name__}`: {', '.join(sorted(unknown_params))}",
+            )
+        self.api_factory = api_factory(factory)
+        update_wrapper(self, factory)
+
+    def __call__(
+        self,
+        request: SubRequest,
+        *args: FactoryParams.args,
+        **kwargs: FactoryParams.kwargs,
+    ) -> APIObject:
+        pool = self.get_pool(request, *args, **kwargs)
+        if not pool:
+            return self.api_factory(request, *args, **kwargs)
+
+        factory_generator, created_object = pool.checkout()
+        _add_finalizer(request, self.factory, factory_generator, created_object)
+        return created_object
+
+    def prefill(
+        self,
+        request: SubRequest,
+        *args: FactoryParams.args,
+        **kwargs: FactoryParams.kwargs,
+    ) -> None:
+        """Start creating objects for pool with passed arguments."""
+        self.get_pool(request, *args, **kwargs)
+
+    def get_pool(
+        self,
+        request: SubRequest,
+        *args: FactoryParams.args,
+        **kwargs: FactoryParams.kwargs,
+    ) -> ObjectPool[tuple[FactoryGenerator[APIObject], APIObject]] | None:
+        """Get pool for passed arguments if object pools are enabled."""
+        object_pools = get_object_pools(request)
+        if not object_pools:
+            return None
+
+        def _create() -> tuple[FactoryGenerator[APIObject], APIObject]:
+            factory_generator = self.factory(*args, **kwargs)
+            return factory_generator, next(factory_generator)
+
+        key_values = self.get_key_values(*args, **kwargs)
+        factory_name = f"{self.factory.__module__}.{self.factory.__name__}"
+        params = ", ".join(f"{param}={value!r}" for param, value in key_values.items())
+        return object_pools.get_pool(
+            key=(factory_name, *key_values.items()),
+            name=f"{factory_name}({params})",
+            size=self.pool_size,
+            create=_create,
+            destroy=lambda pooled_object: _finalize_generator(pooled_object[0]),
+        )
+
+    def get_key_values(
+        self,
+        *args: FactoryParams.args,
+        **kwargs: FactoryParams.kwargs,
+    ) -> dict[str, typing.Hashable]:
+        """Get values of `key_params` which identify pool, including default ones."""
+        arguments = self.signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        return {name: arguments.arguments[name] for name in self.key_params}
+
+
+def pooled_api_factory(
+    pool_size: int,
+    key_params: tuple[str, ...] = (),
+) -> Callable[
+    [Callable[FactoryParams, FactoryGenerator[APIObject]]],
+    PooledApiFactory[FactoryParams, APIObject],
+]:
+    """Prepare pooled API factory from generator function, see `PooledApiFactory`."""
+
+    def decorator(
+        factory: Callable[FactoryParams, FactoryGenerator[APIObject]],
+    ) -> PooledApiFactory[FactoryParams, APIObject]:
+        return PooledApiFactory(factory, pool_size=pool_size, key_params=key_params)
+
+    return decorator
+
+
+def _finalize_generator(generator: FactoryGenerator[APIObject]) -> None:
+    """Suppress exception to allow running code after `yield`.
+
+    Function-based factory is generator object with just one yielded
+    object that should have the following structure:
+
+        Init object -> yield object -> remove object
+
+    To make possible to run the code after `yield` just suppress
+    `StopIteration` exception and call `next`.
+
+    """
+    with suppress(StopIteration):
+        next(generator)
+
+
+def _add_finalizer(
+    request: SubRequest,
+    factory: Callable[..., FactoryGenerator[APIObject]],
+    factory_generator: FactoryGenerator[APIObject],
+    created_object: APIObject,
+) -> None:
+    """Remove created object right away or in deferred cleanup queue after test."""
+
+    def _cleanup() -> None:
+        # When caching enabled do not delete objects from API
+        if get_cache(request):
+            return
+        schedule_cleanup(
+            request=request,
+            callback=lambda: _finalize_generator(factory_generator),
+            description=f"{factory.__module__}.{factory.__name__}: {created_object!r}",
+        )
+
+    request.addfinalizer(_cleanup)
 
 
 class _Default:
@@ -108,5 +255,8 @@ class _Default:
         """Allow `Default` to be used like `None`/`False` in bool expressions."""
         return False
 
+    def __repr__(self) -> str:
+        return "Default"
+
 
 Default: typing.Any = _Default()
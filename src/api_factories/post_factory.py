@@ -0,0 +1,31 @@
+from phuongpv_blog_api_client import AuthenticatedClient, models
+from phuongpv_blog_api_client.api.posts import posts_create
+
+import api
+
+from .api_factory import Default, FactoryGenerator, pooled_api_factory
+from .utils import generate_name_with_uuid
+
+
+@pooled_api_factory(pool_size=5, key_params=("title", "description", "content"))
+def post_factory(
+    client: AuthenticatedClient,
+    title: str = Default,
+    description: str = "Blog post description.",
+    content: str = "Blog post content.",
+) -> FactoryGenerator[models.Post]:
+    """Create blog post via API and remove it after test."""
+    if title is Default:
+        title = generate_name_with_uuid("Blog Post")
+
+    post = posts_create.sync(
+        client=client,
+        body=models.PostRequest(
+            title=title,
+            description=description,
+            content=content,
+        ),
+    )
+    assert isinstance(post, models.Post), post
+    yield post
+    api.delete_post(client, post.id)
@@ -1,8 +1,41 @@
+import re
 import uuid
 
-MAX_NAME_LENGTH = 20
+MAX_NAME_LENGTH = 64
+
+# Separates name from uuid in names generated by `generate_name_with_uuid`,
+# together with full uuid it doesn't match names created by real users
+GENERATED_NAME_MARKER = " e2e-"
+GENERATED_NAME_PATTERN = re.compile(rf"{re.escape(GENERATED_NAME_MARKER)}[0-9a-f]{{32}}$")
+
+# Names generated before marker was added: `f"{name} {uuid}"` truncated to 20
+# characters, so they end with space and (part of) uuid hex. It matches names
+# of real users too (e.g. "Release notes 2024 a"), so such names are only
+# processed on request, see `plugins.api_plugin.sweeper`.
+LEGACY_GENERATED_NAME_LENGTH = 20
+LEGACY_GENERATED_NAME_PATTERN = re.compile(r" [0-9a-f]+$")
 
 
 def generate_name_with_uuid(name: str, max_length: int = MAX_NAME_LENGTH) -> str:
-    """Generate name with uuid as postfix."""
-    return f"{name} {uuid.uuid4().hex}"[:max_length]
+    """Generate name with uuid as postfix.
+
+    Name is truncated to fit `max_length`, postfix is always kept whole, so
+    generated names are recognized by `is_generated_name`.
+
+    """
+    postfix = f"{GENERATED_NAME_MARKER}{uuid.uuid4().hex}"
+    if max_length <= len(postfix):
+        raise ValueError(f"`max_length` should be greater than {len(postfix)}, got {max_length}")
+    return f"{name[: max_length - len(postfix)]}{postfix}"
+
+
+def is_generated_name(name: str) -> bool:
+    """Check if name was generated by `generate_name_with_uuid`."""
+    return bool(GENERATED_NAME_PATTERN.search(name))
+
+
+def is_legacy_generated_name(name: str) -> bool:
+    """Check if name could be generated by old version of `generate_name_with_uuid`."""
+    return len(name) == LEGACY_GENERATED_NAME_LENGTH and bool(
+        LEGACY_GENERATED_NAME_PATTERN.search(name),
+    )
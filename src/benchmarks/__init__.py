@@ -0,0 +1,7 @@
+"""Benchmarks of framework code, they are run separately from tests.
+
+Each benchmark is a module which can be run as script from `src` folder:
+
+    python -m benchmarks.label_index
+
+"""
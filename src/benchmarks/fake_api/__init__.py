@@ -0,0 +1,20 @@
+"""Local stand-in of blog API which keeps data in memory.
+
+Operations are taken from OpenAPI schema of blog API (the one which is used
+to generate `phuongpv_blog_api_client`), fake API handles posts CRUD, search,
+pagination and token auth. Responses can be delayed by latency distribution,
+failed with given rate and throttled, so concurrency and retries of API layer
+can be benchmarked offline. Latencies and errors are seeded per request of
+operation (see `FaultInjector`), so they repeat between runs.
+
+Schema is required, fake API doesn't guess layout of blog API. Run from
+`src` folder with schema which `phuongpv_blog_api_client` is generated from:
+
+    python -m benchmarks.fake_api --schema schema.json \
+        --api-latency lognormal:0.05:0.5 --api-error-rate 0.05
+
+and point tests to it (`API_URL` separates fixtures cache of fake API):
+
+    APP_BASE_URL=http://localhost:8001 API_URL=http://localhost:8001 pytest
+
+"""
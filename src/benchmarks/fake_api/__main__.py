@@ -0,0 +1,110 @@
+import argparse
+import logging
+
+from ..fake_webdriver.blog import FakeUser
+from .faults import FaultInjector, LatencyDistribution
+from .schema import load_schema
+from .server import DEFAULT_PAGE_SIZE, BlogApi, FakeApiServer
+from .store import PostsStore
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_latency(value: str) -> LatencyDistribution:
+    try:
+        return LatencyDistribution.parse(value)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(str(error)) from error
+
+
+def parse_operation_latency(value: str) -> tuple[str, LatencyDistribution]:
+    """Parse latency of operation in `<operationId>=<distribution>` format."""
+    operation_id, _, latency = value.partition("=")
+    if not latency:
+        raise argparse.ArgumentTypeError(f"Expected `<operationId>=<distribution>`, got {value}")
+    return operation_id, parse_latency(latency)
+
+
+def add_faults_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add options of faults which are injected by fake API."""
+    parser.add_argument(
+        "--api-latency",
+        type=parse_latency,
+        default=LatencyDistribution.parse("0"),
+        help="Latency distribution of each request, e.g. `0.05` or `lognormal:0.05:0.5`",
+    )
+    parser.add_argument(
+        "--api-operation-latency",
+        type=parse_operation_latency,
+        action="append",
+        default=[],
+        help="Latency of specific operation, e.g. `posts_list=uniform:0.1:0.3`, can be repeated",
+    )
+    parser.add_argument(
+        "--api-error-rate",
+        type=float,
+        default=0.0,
+        help="Share of requests which fail with one of `--api-error-status`",
+    )
+    parser.add_argument(
+        "--api-error-status",
+        type=int,
+        action="append",
+        default=[],
+        help="Status of injected errors (500, 502 and 503 by default), can be repeated",
+    )
+    parser.add_argument(
+        "--api-rate-limit",
+        type=float,
+        help="Allowed requests per second for each client, exceeding ones get 429",
+    )
+    parser.add_argument("--api-rate-limit-burst", type=int, default=1)
+    parser.add_argument("--api-seed", type=int, default=0, help="Seed of injected faults")
+
+
+def get_fault_injector(args: argparse.Namespace) -> FaultInjector:
+    return FaultInjector(
+        latency=args.api_latency,
+        operation_latencies=dict(args.api_operation_latency),
+        error_rate=args.api_error_rate,
+        error_statuses=tuple(args.api_error_status) or (500, 502, 503),
+        rate_limit=args.api_rate_limit,
+        rate_limit_burst=args.api_rate_limit_burst,
+        seed=args.api_seed,
+    )
+
+
+def main() -> None:
+    """Run fake API server from command line."""
+    parser = argparse.ArgumentParser(description="Run fake blog API server")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument(
+        "--schema",
+        required=True,
+        help="Path or url of OpenAPI schema (JSON) which blog API client is generated from",
+    )
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    add_faults_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    server = FakeApiServer(
+        (args.host, args.port),
+        api=BlogApi(
+            schema=load_schema(args.schema),
+            store=PostsStore(),
+            user=FakeUser.from_env(),
+            page_size=args.page_size,
+        ),
+        faults=get_fault_injector(args),
+    )
+    LOGGER.info(f"Fake API is listening on {server.url}, set APP_BASE_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
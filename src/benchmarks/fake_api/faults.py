@@ -0,0 +1,161 @@
+import dataclasses
+import random
+import threading
+import time
+from collections import Counter
+
+# Distribution name -> number of its parameters
+DISTRIBUTIONS = {
+    "constant": 1,
+    "uniform": 2,
+    "normal": 2,
+    "lognormal": 2,
+    "exponential": 1,
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class LatencyDistribution:
+    """Represent distribution of response latency in seconds.
+
+    Distributions are parsed from `<name>:<params>` format:
+
+    * `0.05` or `constant:0.05` - always 50ms
+    * `uniform:0.01:0.1` - between 10ms and 100ms
+    * `normal:0.05:0.01` - mean 50ms with standard deviation 10ms
+    * `lognormal:0.05:0.5` - median 50ms with sigma 0.5, i.e. with long tail
+    * `exponential:0.05` - mean 50ms
+
+    """
+
+    name: str
+    params: tuple[float, ...]
+
+    @classmethod
+    def parse(cls, value: str) -> "LatencyDistribution":
+        name, *raw_params = value.split(":")
+        if not raw_params:
+            name, raw_params = "constant", [name]
+        if DISTRIBUTIONS.get(name) != len(raw_params):
+            raise ValueError(
+                f"Expected one of {', '.join(DISTRIBUTIONS)} with its params, got {value}",
+            )
+        return cls(name=name, params=tuple(map(float, raw_params)))
+
+    def sample(self, generator: random.Random) -> float:
+        match self.name, self.params:
+            case "uniform", (low, high):
+                latency = generator.uniform(low, high)
+            case "normal", (mean, deviation):
+                latency = generator.gauss(mean, deviation)
+            case "lognormal", (median, sigma):
+                latency = median * generator.lognormvariate(0, sigma)
+            case "exponential", (mean,):
+                latency = generator.expovariate(1 / mean) if mean else 0
+            case _:
+                latency = self.params[0]
+        return max(latency, 0)
+
+
+NO_LATENCY = LatencyDistribution(name="constant", params=(0,))
+
+
+class TokenBucket:
+    """Limit rate of requests, allowing bursts up to `burst` requests."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take token if it's available, otherwise return seconds until next one."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+
+@dataclasses.dataclass
+class InjectedFault:
+    """Represent response which replaces handling of request."""
+
+    status: int
+    detail: str
+    headers: dict[str, str] = dataclasses.field(default_factory=dict)
+
+
+class FaultInjector:
+    """Delay requests and fail some of them like overloaded API does.
+
+    Each request gets its own random generator which is seeded by `seed`,
+    operation and number of request among requests of this operation. So
+    n-th request of operation gets same latency and error in every run with
+    same options, no matter how requests of different operations interleave
+    in threads of server. Concurrent requests of same operation can still
+    swap their numbers. Rate limit depends on timing, so throttled requests
+    aren't repeatable and don't take numbers. Rate limit is applied per
+    client (token or address of anonymous client).
+
+    """
+
+    def __init__(
+        self,
+        latency: LatencyDistribution = NO_LATENCY,
+        operation_latencies: dict[str, LatencyDistribution] | None = None,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = (500, 502, 503),
+        rate_limit: float | None = None,
+        rate_limit_burst: int = 1,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.operation_latencies = operation_latencies or {}
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.seed = seed
+        self._requests: Counter[str] = Counter()
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get_generator(self, operation_id: str) -> random.Random:
+        """Get random generator of next request of operation."""
+        with self._lock:
+            number = self._requests[operation_id]
+            self._requests[operation_id] += 1
+        return random.Random(f"{self.seed}:{operation_id}:{number}")
+
+    def get_latency(self, operation_id: str, generator: random.Random) -> float:
+        """Sample delay of operation, per operation latency takes precedence over global one."""
+        distribution = self.operation_latencies.get(operation_id, self.latency)
+        return distribution.sample(generator)
+
+    def check_rate_limit(self, client: str) -> InjectedFault | None:
+        if not self.rate_limit:
+            return None
+        with self._lock:
+            bucket = self._buckets.setdefault(
+                client,
+                TokenBucket(self.rate_limit, self.rate_limit_burst),
+            )
+        if retry_after := bucket.acquire():
+            return InjectedFault(
+                status=429,
+                detail=f"Request was throttled. Expected available in {retry_after:.2f} seconds.",
+                headers={"Retry-After": str(max(round(retry_after), 1))},
+            )
+        return None
+
+    def pick_error(self, generator: random.Random) -> InjectedFault | None:
+        if generator.random() >= self.error_rate:
+            return None
+        status = generator.choice(self.error_statuses)
+        return InjectedFault(status=status, detail="Error injected by fake API.")
@@ -0,0 +1,159 @@
+import dataclasses
+import json
+import pathlib
+import re
+import urllib.request
+from typing import Any
+
+# Operations of blog API which are emulated, they are named by `operationId`
+# of schema like modules of `phuongpv_blog_api_client.api`
+SUPPORTED_OPERATIONS = frozenset(
+    (
+        "auth_login_create",
+        "posts_list",
+        "posts_create",
+        "posts_retrieve",
+        "posts_update",
+        "posts_partial_update",
+        "posts_destroy",
+    ),
+)
+
+# Default values of fields which are required by schema, but aren't known by
+# fake API
+TYPE_DEFAULTS: dict[str, Any] = {
+    "string": "",
+    "integer": 0,
+    "number": 0,
+    "boolean": False,
+    "array": [],
+    "object": {},
+}
+
+
+@dataclasses.dataclass
+class Operation:
+    """Represent operation of API described by schema."""
+
+    operation_id: str
+    method: str
+    pattern: re.Pattern[str]
+    requires_auth: bool
+    # Schema of request body with resolved references
+    request_schema: dict[str, Any] | None
+
+
+def load_schema(source: str) -> dict[str, Any]:
+    """Load OpenAPI schema in JSON format from file or url, e.g. from running API.
+
+    Fake API has to use the same schema as `phuongpv_blog_api_client` was
+    generated from, otherwise it can accept requests which real API rejects.
+
+    """
+    if source.startswith(("http://", "https://")):
+        request = urllib.request.Request(source, headers={"Accept": "application/json"})  # noqa: S310
+        with urllib.request.urlopen(request) as response:  # noqa: S310
+            return json.load(response)
+    return json.loads(pathlib.Path(source).read_text())
+
+
+def resolve(schema: dict[str, Any], value: dict[str, Any]) -> dict[str, Any]:
+    """Resolve `$ref` of schema object, e.g. `#/components/schemas/Post`."""
+    while "$ref" in value:
+        reference = value["$ref"]
+        value = schema
+        for key in reference.removeprefix("#/").split("/"):
+            value = value[key]
+    return value
+
+
+def build_operations(schema: dict[str, Any]) -> list[Operation]:
+    """Collect supported operations of schema with patterns of their paths."""
+    global_security = schema.get("security", [])
+    operations = []
+    for path, path_item in schema.get("paths", {}).items():
+        pattern = re.compile(re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(path)))
+        for method, operation in path_item.items():
+            if operation.get("operationId") not in SUPPORTED_OPERATIONS:
+                continue
+            security = operation.get("security", global_security)
+            request_schema = (
+                operation.get("requestBody", {})
+                .get("content", {})
+                .get("application/json", {})
+                .get("schema")
+            )
+            operations.append(
+                Operation(
+                    operation_id=operation["operationId"],
+                    method=method.upper(),
+                    pattern=pattern,
+                    # Empty requirement means that anonymous requests are allowed
+                    requires_auth=bool(security) and {} not in security,
+                    request_schema=resolve(schema, request_schema) if request_schema else None,
+                ),
+            )
+    return operations
+
+
+def get_required_fields(request_schema: dict[str, Any]) -> list[str]:
+    """Get fields required in request body.
+
+    Read-only fields are skipped: schema marks them as required for
+    responses, e.g. `id` and `slug` of `Post` model, but API ignores them in
+    requests.
+
+    """
+    properties = request_schema.get("properties", {})
+    return [
+        name
+        for name in request_schema.get("required", [])
+        if not properties.get(name, {}).get("readOnly")
+    ]
+
+
+def validate_body(
+    request_schema: dict[str, Any] | None,
+    body: dict[str, Any],
+    partial: bool = False,
+) -> tuple[dict[str, Any], dict[str, list[str]]]:
+    """Validate request body like API does, return writable fields and errors by field."""
+    if request_schema is None:
+        return body, {}
+    properties = request_schema.get("properties", {})
+    errors: dict[str, list[str]] = {}
+    if not partial:
+        for name in get_required_fields(request_schema):
+            if name not in body:
+                errors[name] = ["This field is required."]
+    data = {}
+    for name, value in body.items():
+        field = properties.get(name)
+        if field is None or field.get("readOnly"):
+            continue
+        if isinstance(value, str):
+            if len(value) < field.get("minLength", 0):
+                errors[name] = ["This field may not be blank."]
+            elif len(value) > field.get("maxLength", len(value)):
+                errors[name] = [
+                    f"Ensure this field has no more than {field['maxLength']} characters.",
+                ]
+        data[name] = value
+    return data, errors
+
+
+def shape_response(schema: dict[str, Any], name: str, data: dict[str, Any]) -> dict[str, Any]:
+    """Shape data as response model of schema, e.g. `Post`.
+
+    Fields which aren't described by model are dropped, required fields
+    which aren't known by fake API are filled with defaults of their types.
+
+    """
+    model = resolve(schema, schema["components"]["schemas"][name])
+    properties = model.get("properties", {})
+    response = {name: value for name, value in data.items() if name in properties}
+    for field_name in model.get("required", []):
+        if field_name not in response:
+            field_type = resolve(schema, properties.get(field_name, {})).get("type", "")
+            response[field_name] = TYPE_DEFAULTS.get(field_type)
+    return response
@@ -0,0 +1,354 @@
+import dataclasses
+import json
+import logging
+import threading
+import time
+import urllib.parse
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from ..fake_webdriver.blog import FakeUser
+from . import schema as api_schema
+from .faults import FaultInjector
+from .store import PostsStore
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+# Path of schema of fake API, like in drf-spectacular
+SCHEMA_PATH = "/api/schema/"
+
+
+class ApiError(Exception):
+    """Represent error response of API."""
+
+    def __init__(self, status: int, payload: dict[str, Any]) -> None:
+        super().__init__(payload)
+        self.status = status
+        self.payload = payload
+
+
+@dataclasses.dataclass
+class ApiRequest:
+    """Represent request to operation of API."""
+
+    operation: api_schema.Operation
+    params: dict[str, str]
+    query: dict[str, str]
+    body: dict[str, Any]
+    # Url of API as it's seen by client, used for pagination links
+    base_url: str
+    username: str | None
+
+
+class BlogApi:
+    """Handlers of blog API operations.
+
+    Operation is handled by method named like its `operationId`, handler
+    returns HTTP status and payload of response.
+
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, Any],
+        store: PostsStore,
+        user: FakeUser,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        self.schema = schema
+        self.store = store
+        self.user = user
+        self.page_size = page_size
+        # Token -> username
+        self.tokens: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def authenticate(self, authorization: str | None) -> str | None:
+        """Get username by `Authorization: Token <token>` header."""
+        if not authorization:
+            return None
+        prefix, _, token = authorization.partition(" ")
+        if prefix.lower() != "token" or token not in self.tokens:
+            raise ApiError(401, {"detail": "Invalid token."})
+        return self.tokens[token]
+
+    def auth_login_create(self, request: ApiRequest) -> tuple[int, Any]:
+        credentials = (request.body.get("email"), request.body.get("password"))
+        if credentials != (self.user.email, self.user.password):
+            raise ApiError(
+                400,
+                {"non_field_errors": ["Unable to log in with provided credentials."]},
+            )
+        with self._lock:
+            token = next(
+                (token for token, user in self.tokens.items() if user == self.user.username),
+                None,
+            )
+            if not token:
+                token = uuid.uuid4().hex
+                self.tokens[token] = self.user.username
+        return 200, api_schema.shape_response(self.schema, "Token", {"token": token})
+
+    def posts_list(self, request: ApiRequest) -> tuple[int, Any]:
+        posts = self.store.search(request.query.get("search", ""))
+        try:
+            page = int(request.query.get("page", 1))
+            page_size = min(int(request.query.get("page_size", self.page_size)), MAX_PAGE_SIZE)
+        except ValueError as error:
+            raise ApiError(404, {"detail": "Invalid page."}) from error
+        pages_count = max((len(posts) + page_size - 1) // page_size, 1)
+        if not 1 <= page <= pages_count or page_size < 1:
+            raise ApiError(404, {"detail": "Invalid page."})
+        results = posts[(page - 1) * page_size : page * page_size]
+        return 200, {
+            "count": len(posts),
+            "next": self.get_page_url(request, page + 1) if page < pages_count else None,
+            "previous": self.get_page_url(request, page - 1) if page > 1 else None,
+            "results": [api_schema.shape_response(self.schema, "Post", post) for post in results],
+        }
+
+    def posts_create(self, request: ApiRequest) -> tuple[int, Any]:
+        data = self.validate(request)
+        post = self.store.create(data, author=request.username or "")
+        return 201, api_schema.shape_response(self.schema, "Post", post)
+
+    def posts_retrieve(self, request: ApiRequest) -> tuple[int, Any]:
+        post = self.store.get(self.get_post_id(request))
+        if not post:
+            raise ApiError(404, {"detail": "No Post matches the given query."})
+        return 200, api_schema.shape_response(self.schema, "Post", post)
+
+    def posts_update(self, request: ApiRequest) -> tuple[int, Any]:
+        data = self.validate(request)
+        post = self.store.update(self.get_post_id(request), data)
+        if not post:
+            raise ApiError(404, {"detail": "No Post matches the given query."})
+        return 200, api_schema.shape_response(self.schema, "Post", post)
+
+    def posts_partial_update(self, request: ApiRequest) -> tuple[int, Any]:
+        return self.posts_update(request)
+
+    def posts_destroy(self, request: ApiRequest) -> tuple[int, Any]:
+        if not self.store.delete(self.get_post_id(request)):
+            raise ApiError(404, {"detail": "No Post matches the given query."})
+        return 204, None
+
+    def validate(self, request: ApiRequest) -> dict[str, Any]:
+        data, errors = api_schema.validate_body(
+            request.operation.request_schema,
+            request.body,
+            partial=request.operation.operation_id == "posts_partial_update",
+        )
+        if errors:
+            raise ApiError(400, errors)
+        return data
+
+    def get_post_id(self, request: ApiRequest) -> int:
+        try:
+            return int(request.params["id"])
+        except ValueError as error:
+            raise ApiError(404, {"detail": "No Post matches the given query."}) from error
+
+    def get_page_url(self, request: ApiRequest, page: int) -> str:
+        query = urllib.parse.urlencode({**request.query, "page": page})
+        return f"{request.base_url}?{query}"
+
+
+class FakeApiServer(ThreadingHTTPServer):
+    """Blog API server which handles operations of OpenAPI schema in memory.
+
+    Requests are delayed, throttled and failed by `FaultInjector`. Requests
+    are counted by operation and status, stats can be read by
+    `GET /fake/stats` request and reset by `DELETE /fake/stats`.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        api: BlogApi,
+        faults: FaultInjector | None = None,
+    ) -> None:
+        super().__init__(address, FakeApiRequestHandler)
+        self.host = address[0]
+        self.api = api
+        self.faults = faults or FaultInjector()
+        self.operations = api_schema.build_operations(api.schema)
+        self.operations_counter: Counter[str] = Counter()
+        self.statuses_counter: Counter[int] = Counter()
+        self.injected_errors = 0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.server_port}"
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "operations": dict(self.operations_counter),
+                "statuses": {str(status): count for status, count in self.statuses_counter.items()},
+                "total": sum(self.operations_counter.values()),
+                "injected_errors": self.injected_errors,
+                "throttled": self.throttled,
+                "posts": len(self.api.store),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.operations_counter.clear()
+            self.statuses_counter.clear()
+            self.injected_errors = 0
+            self.throttled = 0
+
+    def resolve_operation(
+        self,
+        method: str,
+        path: str,
+    ) -> tuple[api_schema.Operation, dict[str, str]] | None:
+        for operation in self.operations:
+            if operation.method == method and (match := operation.pattern.fullmatch(path)):
+                return operation, match.groupdict()
+        return None
+
+    def dispatch(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        body: dict[str, Any],
+        client_address: str = "",
+    ) -> tuple[int, Any, dict[str, str]]:
+        """Handle request and return HTTP status, payload and headers of response.
+
+        Names of `headers` are expected in lower case.
+
+        """
+        split_url = urllib.parse.urlsplit(url)
+        resolved_operation = self.resolve_operation(method, split_url.path)
+        if not resolved_operation:
+            return 404, {"detail": "Not found."}, {}
+
+        operation, params = resolved_operation
+        authorization = headers.get("authorization")
+        status, payload, response_headers = self.handle(
+            operation,
+            ApiRequest(
+                operation=operation,
+                params=params,
+                query=dict(urllib.parse.parse_qsl(split_url.query)),
+                body=body,
+                base_url=f"http://{headers.get('host', self.url)}{split_url.path}",
+                username=None,
+            ),
+            client=authorization or client_address,
+            authorization=authorization,
+        )
+        with self._lock:
+            self.operations_counter[operation.operation_id] += 1
+            self.statuses_counter[status] += 1
+        return status, payload, response_headers
+
+    def handle(
+        self,
+        operation: api_schema.Operation,
+        request: ApiRequest,
+        client: str,
+        authorization: str | None,
+    ) -> tuple[int, Any, dict[str, str]]:
+        # Throttled requests are rejected before handling, so they are fast
+        if fault := self.faults.check_rate_limit(client):
+            with self._lock:
+                self.throttled += 1
+            return fault.status, {"detail": fault.detail}, fault.headers
+        generator = self.faults.get_generator(operation.operation_id)
+        time.sleep(self.faults.get_latency(operation.operation_id, generator))
+        if fault := self.faults.pick_error(generator):
+            with self._lock:
+                self.injected_errors += 1
+            return fault.status, {"detail": fault.detail}, fault.headers
+        try:
+            request.username = self.api.authenticate(authorization)
+            if operation.requires_auth and not request.username:
+                raise ApiError(401, {"detail": "Authentication credentials were not provided."})
+            status, payload = getattr(self.api, operation.operation_id)(request)
+        except ApiError as error:
+            return error.status, error.payload, {}
+        return status, payload, {}
+
+
+class FakeApiRequestHandler(BaseHTTPRequestHandler):
+    """Handle HTTP requests of API clients."""
+
+    # Keep connections alive like real API does
+    protocol_version = "HTTP/1.1"
+    # Headers and body of response are written separately, with Nagle's
+    # algorithm body waits for delayed ACK of headers (~40ms on Linux)
+    disable_nagle_algorithm = True
+    server: FakeApiServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.handle_request("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.handle_request("POST")
+
+    def do_PUT(self) -> None:  # noqa: N802
+        self.handle_request("PUT")
+
+    def do_PATCH(self) -> None:  # noqa: N802
+        self.handle_request("PATCH")
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        self.handle_request("DELETE")
+
+    def handle_request(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length)) if length else {}
+        except ValueError:
+            self.send_json(400, {"detail": "JSON parse error."})
+            return
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/fake/stats":
+            if method == "DELETE":
+                self.server.reset_stats()
+            self.send_json(200, self.server.get_stats())
+            return
+        if path == SCHEMA_PATH and method == "GET":
+            self.send_json(200, self.server.api.schema)
+            return
+        status, payload, response_headers = self.server.dispatch(
+            method,
+            self.path,
+            headers={name.lower(): value for name, value in self.headers.items()},
+            body=body if isinstance(body, dict) else {},
+            client_address=self.client_address[0],
+        )
+        self.send_json(status, payload, response_headers)
+
+    def send_json(
+        self,
+        status: int,
+        payload: Any,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        data = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        LOGGER.debug(format, *args)
@@ -0,0 +1,82 @@
+import datetime
+import itertools
+import re
+import threading
+from typing import Any
+
+from slugify import slugify
+
+# Fields which are matched by `search` param, like in `SearchFilter` of API
+SEARCH_FIELDS = ("title", "description", "content")
+
+
+class PostsStore:
+    """Thread-safe in-memory storage of blog posts.
+
+    Storage is shared by fake API and fake blog pages, so post created via UI
+    is visible in API and vice versa.
+
+    """
+
+    def __init__(self) -> None:
+        self._posts: dict[int, dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._posts)
+
+    def create(self, data: dict[str, Any], author: str = "") -> dict[str, Any]:
+        now = datetime.datetime.now(tz=datetime.UTC).isoformat()
+        with self._lock:
+            post = {
+                "description": "",
+                "content": "",
+                **data,
+                "id": next(self._ids),
+                "slug": slugify(data.get("title", "")),
+                "author": author,
+                "created_at": now,
+                "updated_at": now,
+            }
+            self._posts[post["id"]] = post
+            return dict(post)
+
+    def get(self, post_id: int) -> dict[str, Any] | None:
+        with self._lock:
+            post = self._posts.get(post_id)
+            return dict(post) if post else None
+
+    def get_by_slug(self, slug: str) -> dict[str, Any] | None:
+        with self._lock:
+            post = next((post for post in self._posts.values() if post["slug"] == slug), None)
+            return dict(post) if post else None
+
+    def update(self, post_id: int, data: dict[str, Any]) -> dict[str, Any] | None:
+        with self._lock:
+            post = self._posts.get(post_id)
+            if not post:
+                return None
+            post.update(data)
+            if "title" in data:
+                post["slug"] = slugify(data["title"])
+            post["updated_at"] = datetime.datetime.now(tz=datetime.UTC).isoformat()
+            return dict(post)
+
+    def delete(self, post_id: int) -> bool:
+        with self._lock:
+            return self._posts.pop(post_id, None) is not None
+
+    def search(self, search: str = "") -> list[dict[str, Any]]:
+        """Find posts which contain each term of `search` in any of `SEARCH_FIELDS`."""
+        terms = [term.lower() for term in re.split(r"[\s,]+", search) if term]
+        with self._lock:
+            posts = [dict(post) for post in self._posts.values()]
+        return [
+            post
+            for post in posts
+            if all(
+                any(term in str(post.get(field, "")).lower() for field in SEARCH_FIELDS)
+                for term in terms
+            )
+        ]
@@ -0,0 +1,232 @@
+"""Measure throughput and latency of tests run with fake WebDriver server.
+
+Tests are run by pytest in subprocess against `benchmarks.fake_webdriver`,
+so there is no browser and network, and results show overhead of framework
+and of WebDriver protocol. Latency of real browser can be emulated with
+`--latency` and `--command-latency` options.
+
+Blog API is replaced by `benchmarks.fake_api` which shares posts with fake
+blog pages, its faults are set by `--api-*` options and its operations are
+taken from `--api-schema`. Use `--real-api` to send API requests to
+`APP_BASE_URL` instead.
+
+Run from `src` folder:
+
+    python -m benchmarks.fake_browser_tests --api-schema schema.json --rounds 5 --latency 0.005
+
+"""
+
+import argparse
+import collections
+import contextlib
+import logging
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from http.server import ThreadingHTTPServer
+
+from defusedxml import ElementTree
+
+from .fake_api.__main__ import add_faults_arguments, get_fault_injector
+from .fake_api.schema import load_schema
+from .fake_api.server import BlogApi, FakeApiServer
+from .fake_api.store import PostsStore
+from .fake_webdriver.__main__ import parse_command_latency
+from .fake_webdriver.blog import BlogApp, FakeUser
+from .fake_webdriver.server import FakeWebDriverServer
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_TESTS = (
+    "tests/auth/test_login.py::test_successful_login",
+    "tests/posts/test_create_post.py::test_create_post",
+)
+DEFAULT_ROUNDS = 3
+
+
+@contextlib.contextmanager
+def run_server[Server: ThreadingHTTPServer](server: Server) -> Iterator[Server]:
+    """Run server in background thread."""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def run_tests(
+    tests: list[str],
+    server: FakeWebDriverServer,
+    environment: dict[str, str],
+    workers: int,
+    report_path: pathlib.Path,
+    output_path: pathlib.Path,
+    cache_dir: pathlib.Path,
+) -> int:
+    """Run tests against fake server and return pytest exit code.
+
+    Output of pytest is saved to `output_path`, so it doesn't mix with
+    results of benchmark. Each round gets empty `cache_dir`, so rounds don't
+    reuse cached tokens and urls of each other.
+
+    """
+    command = [
+        sys.executable,
+        "-m",
+        "pytest",
+        *tests,
+        "--webdriver-remote",
+        f"--webdriver-remote-url={server.url}",
+        f"--junitxml={report_path}",
+        "-o",
+        f"cache_dir={cache_dir}",
+        "-q",
+    ]
+    if workers:
+        command.extend(("-n", str(workers)))
+    with output_path.open("wb") as output:
+        return subprocess.run(  # noqa: S603
+            command,
+            env={**os.environ, **environment},
+            stdout=output,
+            stderr=subprocess.STDOUT,
+            check=False,
+        ).returncode
+
+
+def read_durations(report_path: pathlib.Path) -> dict[str, float]:
+    """Read durations of passed tests from JUnit XML report."""
+    durations: dict[str, float] = {}
+    # Report isn't saved if pytest failed before tests run, e.g. on bad args
+    if not report_path.exists():
+        return durations
+    for testcase in ElementTree.parse(report_path).iter("testcase"):
+        if any(child.tag in ("failure", "error", "skipped") for child in testcase):
+            continue
+        durations[testcase.get("name", "")] = float(testcase.get("time", 0))
+    return durations
+
+
+def log_results(
+    durations: dict[str, list[float]],
+    commands: list[int],
+    api_requests: list[int],
+    wall_times: list[float],
+) -> None:
+    for name, times in durations.items():
+        LOGGER.info(
+            f"{name}: median {statistics.median(times):.3f}s, "
+            f"min {min(times):.3f}s, max {max(times):.3f}s ({len(times)} passed)",
+        )
+    passed = sum(len(times) for times in durations.values())
+    LOGGER.info(f"WebDriver commands per round: {statistics.median(commands):.0f}")
+    if api_requests:
+        LOGGER.info(f"API requests per round: {statistics.median(api_requests):.0f}")
+    LOGGER.info(f"Throughput: {passed / sum(wall_times):.2f} tests/s")
+
+
+def main() -> None:
+    """Run benchmark from command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("tests", nargs="*", default=list(DEFAULT_TESTS))
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument("--workers", "-n", type=int, default=0, help="Number of xdist workers")
+    parser.add_argument("--app-root", default=os.environ.get("APP_ROOT", "http://blog.local/blog/"))
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Delay of each command in seconds",
+    )
+    parser.add_argument(
+        "--command-latency",
+        type=parse_command_latency,
+        action="append",
+        default=[],
+        help="Delay of specific command, e.g. `Navigate To=0.5`, can be repeated",
+    )
+    parser.add_argument("--real-api", action="store_true", help="Use API of `APP_BASE_URL`")
+    parser.add_argument(
+        "--api-schema",
+        help="Path or url of OpenAPI schema (JSON) of blog API, required without `--real-api`",
+    )
+    add_faults_arguments(parser)
+    args = parser.parse_args()
+    if not args.real_api and not args.api_schema:
+        parser.error("--api-schema is required to run fake API, use --real-api to skip it")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    durations: dict[str, list[float]] = collections.defaultdict(list)
+    commands: list[int] = []
+    api_requests: list[int] = []
+    wall_times: list[float] = []
+    posts = PostsStore()
+    user = FakeUser.from_env()
+    environment = {"APP_ROOT": args.app_root}
+    with contextlib.ExitStack() as stack:
+        server = stack.enter_context(
+            run_server(
+                FakeWebDriverServer(
+                    ("localhost", 0),
+                    app=BlogApp(app_root=args.app_root, user=user, posts=posts),
+                    latency=args.latency,
+                    command_latencies=dict(args.command_latency),
+                ),
+            ),
+        )
+        api_server = None
+        if not args.real_api:
+            api_server = stack.enter_context(
+                run_server(
+                    FakeApiServer(
+                        ("localhost", 0),
+                        api=BlogApi(schema=load_schema(args.api_schema), store=posts, user=user),
+                        faults=get_fault_injector(args),
+                    ),
+                ),
+            )
+            environment.update(APP_BASE_URL=api_server.url, API_URL=api_server.url)
+        tmp_dir = pathlib.Path(stack.enter_context(tempfile.TemporaryDirectory()))
+        for round_number in range(1, args.rounds + 1):
+            report_path = tmp_dir / f"round_{round_number}.xml"
+            output_path = tmp_dir / f"round_{round_number}.log"
+            server.reset_stats()
+            if api_server:
+                api_server.reset_stats()
+            start = time.perf_counter()
+            exit_code = run_tests(
+                args.tests,
+                server,
+                environment,
+                args.workers,
+                report_path,
+                output_path,
+                tmp_dir / f"cache_{round_number}",
+            )
+            wall_times.append(time.perf_counter() - start)
+            if exit_code:
+                LOGGER.warning(
+                    f"Round {round_number}: pytest exited with code {exit_code}:\n"
+                    f"{output_path.read_text(errors='replace')}",
+                )
+            for name, duration in read_durations(report_path).items():
+                durations[name].append(duration)
+            commands.append(server.get_stats()["total"])
+            if api_server:
+                api_requests.append(api_server.get_stats()["total"])
+    if not durations:
+        LOGGER.error("No tests passed, see pytest output above")
+        sys.exit(1)
+    log_results(durations, commands, api_requests, wall_times)
+
+
+if __name__ == "__main__":
+    main()
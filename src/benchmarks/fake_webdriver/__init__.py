@@ -0,0 +1,17 @@
+"""Local W3C WebDriver server with fake browser which opens scripted blog pages.
+
+Fake browser doesn't render pages and doesn't run JavaScript: pages are
+parsed HTML from `blog`, scripts of framework and selenium are emulated by
+`scripts`. It allows to measure how many WebDriver commands page objects
+send and how their speed depends on latency of browser, without real browser
+and network.
+
+Run from `src` folder:
+
+    python -m benchmarks.fake_webdriver --port 4445 --latency 0.005
+
+and point tests to it:
+
+    pytest --webdriver-remote --webdriver-remote-url=http://localhost:4445
+
+"""
@@ -0,0 +1,55 @@
+import argparse
+import logging
+import os
+
+from .blog import BlogApp, FakeUser
+from .server import FakeWebDriverServer
+
+LOGGER = logging.getLogger(__name__)
+
+
+def parse_command_latency(value: str) -> tuple[str, float]:
+    """Parse latency of command in `<Command Name>=<seconds>` format."""
+    command, _, latency = value.rpartition("=")
+    if not command:
+        raise argparse.ArgumentTypeError(f"Expected `<Command Name>=<seconds>`, got {value}")
+    return command, float(latency)
+
+
+def main() -> None:
+    """Run fake WebDriver server from command line."""
+    parser = argparse.ArgumentParser(description="Run fake WebDriver server")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=4445)
+    parser.add_argument("--app-root", default=os.environ.get("APP_ROOT", "http://blog.local/blog/"))
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Delay of each command in seconds",
+    )
+    parser.add_argument(
+        "--command-latency",
+        type=parse_command_latency,
+        action="append",
+        default=[],
+        help="Delay of specific command, e.g. `Navigate To=0.5`, can be repeated",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    server = FakeWebDriverServer(
+        (args.host, args.port),
+        app=BlogApp(app_root=args.app_root, user=FakeUser.from_env()),
+        latency=args.latency,
+        command_latencies=dict(args.command_latency),
+    )
+    LOGGER.info(f"Fake WebDriver is listening on {server.url}, app root is {args.app_root}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
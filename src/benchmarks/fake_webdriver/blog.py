@@ -0,0 +1,183 @@
+import dataclasses
+import html
+import os
+import re
+import urllib.parse
+from collections.abc import Callable
+from typing import Any
+
+from ..fake_api.store import PostsStore
+
+NOT_FOUND_TEMPLATE = "<h1>Page not found</h1>"
+
+
+@dataclasses.dataclass
+class FakeUser:
+    """Represent user of fake blog."""
+
+    username: str
+    email: str
+    password: str
+    first_name: str = ""
+    last_name: str = ""
+
+    @classmethod
+    def from_env(cls) -> "FakeUser":
+        """Get credentials of super user which are used by tests."""
+        return cls(
+            username=os.environ.get("SUPER_USER_USERNAME", "admin"),
+            email=os.environ.get("SUPER_USER_EMAIL", "admin@example.com"),
+            password=os.environ.get("SUPER_USER_PASSWORD", "admin"),
+        )
+
+
+class BlogApp:
+    """Scripted pages of blog which are used by tests.
+
+    Pages are rendered from templates with data of app (user and posts) and
+    of browser session (signed in user), forms are handled like by the blog
+    backend, e.g. pages which require auth redirect to login page. Posts can
+    be shared with fake API (`benchmarks.fake_api`) through `posts` store.
+
+    Home page is served at `app_root`, other pages use paths of real blog
+    (`/user/login/`, `/blog/post/new/`, ...) on origin of `app_root`.
+
+    """
+
+    def __init__(self, app_root: str, user: FakeUser, posts: PostsStore | None = None) -> None:
+        self.app_root = app_root if app_root.endswith("/") else f"{app_root}/"
+        split_root = urllib.parse.urlsplit(self.app_root)
+        self.origin = f"{split_root.scheme}://{split_root.netloc}"
+        self.user = user
+        self.posts = posts if posts is not None else PostsStore()
+        # Path pattern -> (page renderer, whether page requires auth)
+        self.routes: list[tuple[re.Pattern[str], Callable[..., str], bool]] = [
+            (re.compile(re.escape(split_root.path)), self.render_home, False),
+            (re.compile(r"/user/login/"), self.render_login, False),
+            (re.compile(r"/user/profile/"), self.render_profile, True),
+            (re.compile(r"/blog/post/new/"), self.render_post_create, True),
+            (re.compile(r"/blog/post/(?P<slug>[^/]+)/"), self.render_post_details, False),
+        ]
+
+    def render(self, url: str, state: dict[str, Any]) -> tuple[str, str]:
+        """Render page of url, return final url (after redirects) and HTML."""
+        path = self.get_path(url)
+        if path == "/user/logout/":
+            state.pop("username", None)
+            return self.render(self.app_root, state)
+        for pattern, renderer, requires_auth in self.routes:
+            if path is None or not (match := pattern.fullmatch(path)):
+                continue
+            if requires_auth and not state.get("username"):
+                return self.render(f"{self.origin}/user/login/", state)
+            return url, self.render_layout(state, renderer(state, **match.groupdict()))
+        return url, self.render_layout(state, NOT_FOUND_TEMPLATE)
+
+    def submit(self, url: str, values: dict[str, str], state: dict[str, Any]) -> str:
+        """Handle submitted form and return url to open."""
+        match self.get_path(url):
+            case "/user/login/":
+                if (values.get("username"), values.get("password")) != (
+                    self.user.username,
+                    self.user.password,
+                ):
+                    state["login_error"] = True
+                    return url
+                state.pop("login_error", None)
+                state["username"] = self.user.username
+                return f"{self.origin}/user/profile/"
+            case "/user/profile/":
+                self.user.first_name = values.get("first_name", "")
+                self.user.last_name = values.get("last_name", "")
+                return url
+            case "/blog/post/new/":
+                post = self.posts.create(
+                    {
+                        "title": values.get("title", ""),
+                        "description": values.get("description", ""),
+                        "content": values.get("content", ""),
+                    },
+                    author=state.get("username", ""),
+                )
+                return f"{self.origin}/blog/post/{post['slug']}/"
+        return url
+
+    def get_path(self, url: str) -> str | None:
+        """Get path of url if it belongs to app."""
+        split_url = urllib.parse.urlsplit(url)
+        if f"{split_url.scheme}://{split_url.netloc}" != self.origin:
+            return None
+        return split_url.path or "/"
+
+    def render_layout(self, state: dict[str, Any], content: str) -> str:
+        if state.get("username"):
+            links = [
+                ("Home", self.app_root),
+                ("Create Post", f"{self.origin}/blog/post/new/"),
+                ("Profile", f"{self.origin}/user/profile/"),
+                ("Logout", f"{self.origin}/user/logout/"),
+            ]
+        else:
+            links = [("Home", self.app_root), ("Login", f"{self.origin}/user/login/")]
+        nav = "".join(f'<a href="{url}">{text}</a>' for text, url in links)
+        return (
+            "<!DOCTYPE html><html><head><title>Blog</title></head><body>"
+            f"<nav>{nav}</nav><main>{content}</main></body></html>"
+        )
+
+    def render_home(self, state: dict[str, Any]) -> str:
+        items = "".join(
+            f'<li><a href="{self.origin}/blog/post/{post["slug"]}/">'
+            f"{html.escape(post['title'])}</a></li>"
+            for post in reversed(self.posts.search())
+        )
+        return f"<h1>Posts</h1><ul>{items}</ul>"
+
+    def render_login(self, state: dict[str, Any]) -> str:
+        error = "<p class='error'>Invalid credentials</p>" if state.get("login_error") else ""
+        return (
+            f'<form method="post" action="{self.origin}/user/login/">{error}'
+            '<label for="id_username">Username</label>'
+            '<input id="id_username" name="username">'
+            '<label for="id_password">Password</label>'
+            '<input id="id_password" name="password" type="password">'
+            '<button type="submit">Login</button></form>'
+        )
+
+    def render_profile(self, state: dict[str, Any]) -> str:
+        fields = [
+            ("First Name", "first_name", self.user.first_name),
+            ("Last Name", "last_name", self.user.last_name),
+            ("Username", "username", self.user.username),
+            ("Email", "email", self.user.email),
+        ]
+        rows = "".join(
+            f'<div><label for="id_{name}">{label}</label>'
+            f'<input id="id_{name}" name="{name}" value="{html.escape(value)}"></div>'
+            for label, name, value in fields
+        )
+        return (
+            f'<form method="post" action="{self.origin}/user/profile/">{rows}'
+            '<button type="submit">Update</button></form>'
+        )
+
+    def render_post_create(self, state: dict[str, Any]) -> str:
+        return (
+            f'<form method="post" action="{self.origin}/blog/post/new/">'
+            '<div><label for="id_title">Title</label><input id="id_title" name="title"></div>'
+            '<div><label for="id_description">Description</label>'
+            '<textarea id="id_description" name="description"></textarea></div>'
+            '<div><label for="id_content">Content</label>'
+            '<textarea id="id_content" name="content"></textarea></div>'
+            '<button type="submit">Post</button></form>'
+        )
+
+    def render_post_details(self, state: dict[str, Any], slug: str) -> str:
+        post = self.posts.get_by_slug(slug)
+        if not post:
+            return NOT_FOUND_TEMPLATE
+        return (
+            f'<article><h2 class="article-title">{html.escape(post["title"])}</h2>'
+            f'<p class="article-content">{html.escape(post["description"])}</p>'
+            f'<div class="article-content">{html.escape(post["content"])}</div></article>'
+        )
@@ -0,0 +1,176 @@
+import urllib.parse
+import uuid
+from collections.abc import Iterator
+
+import lxml.html
+from lxml import etree
+
+# Elements which are never rendered
+HIDDEN_TAGS = frozenset(("head", "script", "style", "template", "title", "meta", "link"))
+# Elements which have `value` property
+VALUE_TAGS = frozenset(("input", "textarea", "select", "button", "option"))
+BOOLEAN_ATTRIBUTES = frozenset(
+    ("checked", "disabled", "hidden", "readonly", "required", "selected"),
+)
+
+
+class InvalidSelectorError(Exception):
+    """Raised when XPath query can't be evaluated."""
+
+
+class FakeDocument:
+    """Represent document loaded in fake browser.
+
+    Values of fields are stored separately from attributes, like in real
+    browsers. Each change of document increments its `generation`, which is
+    used by emulation of mutation observers.
+
+    """
+
+    def __init__(self, url: str, html: str) -> None:
+        self.url = url
+        self.root: lxml.html.HtmlElement = lxml.html.document_fromstring(html)
+        self.document_id = uuid.uuid4().hex
+        self.generation = 0
+        self.values: dict[lxml.html.HtmlElement, str] = {}
+
+    @property
+    def title(self) -> str:
+        return self.root.findtext(".//title") or ""
+
+    @property
+    def source(self) -> str:
+        return lxml.html.tostring(self.root, encoding="unicode")
+
+    def find_all(
+        self,
+        query: str,
+        context: lxml.html.HtmlElement | None = None,
+    ) -> list[lxml.html.HtmlElement]:
+        """Find elements by XPath query, like `document.evaluate` does."""
+        try:
+            result = (self.root if context is None else context).xpath(query)
+        except etree.XPathError as error:
+            raise InvalidSelectorError(f"{query}: {error}") from error
+        if not isinstance(result, list):
+            return []
+        return [item for item in result if isinstance(item, lxml.html.HtmlElement)]
+
+    def find(
+        self,
+        query: str,
+        context: lxml.html.HtmlElement | None = None,
+    ) -> lxml.html.HtmlElement | None:
+        elements = self.find_all(query, context)
+        return elements[0] if elements else None
+
+    def contains(self, element: lxml.html.HtmlElement) -> bool:
+        return element.getroottree().getroot() is self.root
+
+    def get_value(self, element: lxml.html.HtmlElement) -> str:
+        if element in self.values:
+            return self.values[element]
+        if element.tag == "textarea":
+            return element.text or ""
+        if element.tag == "select":
+            options = element.xpath(".//option[@selected]") or element.xpath(".//option")
+            return options[0].get("value", options[0].text_content()) if options else ""
+        return element.get("value", "")
+
+    def set_value(self, element: lxml.html.HtmlElement, value: str) -> None:
+        self.values[element] = value
+        self.generation += 1
+
+    def get_attribute(self, element: lxml.html.HtmlElement, name: str) -> str | None:
+        """Get attribute like selenium's `getAttribute` atom, i.e. property if it's set."""
+        if name == "value" and element.tag in VALUE_TAGS:
+            return self.get_value(element)
+        if name in BOOLEAN_ATTRIBUTES:
+            return "true" if element.get(name) is not None else None
+        if name in ("class", "className"):
+            return element.get("class")
+        value = element.get(name)
+        if name in ("href", "src") and value is not None:
+            return urllib.parse.urljoin(self.url, value)
+        return value
+
+    def get_labels(self, element: lxml.html.HtmlElement) -> list[lxml.html.HtmlElement]:
+        """Get labels of field, like `element.labels` does."""
+        labels = []
+        if element_id := element.get("id"):
+            labels.extend(self.root.xpath("//label[@for=$id]", id=element_id))
+        labels.extend(
+            ancestor
+            for ancestor in element.iterancestors("label")
+            if ancestor not in labels and not ancestor.get("for")
+        )
+        return labels
+
+    def get_unique_id(self, element: lxml.html.HtmlElement) -> str | None:
+        """Get id of element if it can be used to find only this element."""
+        element_id = element.get("id")
+        if not element_id or '"' in element_id:
+            return None
+        return element_id if self.find_all(f'//*[@id="{element_id}"]') == [element] else None
+
+
+def is_hidden_node(element: lxml.html.HtmlElement) -> bool:
+    """Check if element itself hides its content."""
+    if element.tag in HIDDEN_TAGS or element.get("hidden") is not None:
+        return True
+    if element.tag == "input" and element.get("type") == "hidden":
+        return True
+    style = (element.get("style") or "").replace(" ", "").lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+
+def is_displayed(element: lxml.html.HtmlElement) -> bool:
+    """Check if element is rendered, fake documents don't have any layout."""
+    return not any(is_hidden_node(node) for node in (element, *element.iterancestors()))
+
+
+def is_enabled(element: lxml.html.HtmlElement) -> bool:
+    return element.get("disabled") is None and not any(
+        fieldset.get("disabled") is not None for fieldset in element.iterancestors("fieldset")
+    )
+
+
+def get_text(element: lxml.html.HtmlElement) -> str:
+    """Get rendered text of element, like `innerText` with collapsed whitespaces."""
+    if not is_displayed(element):
+        return ""
+    parts: list[str] = []
+    _collect_text(element, parts)
+    return " ".join("".join(parts).split())
+
+
+def _collect_text(element: lxml.html.HtmlElement, parts: list[str]) -> None:
+    if element.text:
+        parts.append(element.text)
+    for child in element:
+        if isinstance(child, lxml.html.HtmlElement) and not is_hidden_node(child):
+            _collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+
+
+def iter_nodes(element: lxml.html.HtmlElement) -> Iterator[lxml.html.HtmlElement | str]:
+    """Iterate over descendants of element and their texts in document order."""
+    if element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child, lxml.html.HtmlElement):
+            yield child
+            yield from iter_nodes(child)
+        if child.tail:
+            yield child.tail
+
+
+def find_closest(
+    element: lxml.html.HtmlElement,
+    tag: str,
+) -> lxml.html.HtmlElement | None:
+    """Find element itself or its closest ancestor with tag."""
+    if element.tag == tag:
+        return element
+    return next(element.iterancestors(tag), None)
@@ -0,0 +1,166 @@
+"""Emulation of scripts which are executed by framework and by selenium.
+
+Fake browser can't run JavaScript, so scripts are recognized by their text
+and emulated with Python. Scripts of framework are imported from page
+modules, so emulation is always matched with current version of script.
+
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import lxml.html
+
+from pages.common.form_filling import BULK_FILL_SCRIPT
+from pages.common.labels import LABEL_INDEX_SCRIPT
+from pages.element_cache import RESOLVE_ELEMENT_SCRIPT
+from pages.network import CHECK_NETWORK_IDLE_SCRIPT, WAIT_NETWORK_IDLE_SCRIPT
+from pages.snapshots import SNAPSHOT_SCRIPT
+from pages.waits import ALL_VISIBLE_SCRIPT, IN_PAGE_WAIT_SCRIPT
+
+from . import dom
+
+ScriptHandler = Callable[[dom.FakeDocument, list[Any]], Any]
+
+
+class UnsupportedScriptError(Exception):
+    """Raised when script can't be emulated."""
+
+
+def is_displayed_atom(document: dom.FakeDocument, args: list[Any]) -> bool:
+    return dom.is_displayed(args[0])
+
+
+def get_attribute_atom(document: dom.FakeDocument, args: list[Any]) -> str | None:
+    return document.get_attribute(args[0], args[1])
+
+
+def in_page_wait(document: dom.FakeDocument, args: list[Any]) -> bool:
+    """Check condition of in-page wait right away, DOM of fake browser changes only on commands."""
+    condition, queries, text, url, _timeout = args
+    elements = [document.find(query) for query in queries]
+    match condition:
+        case "visible":
+            return bool(elements[0] is not None and dom.is_displayed(elements[0]))
+        case "all_visible":
+            return all(element is not None and dom.is_displayed(element) for element in elements)
+        case "invisible":
+            return elements[0] is None or not dom.is_displayed(elements[0])
+        case "text":
+            return elements[0] is not None and text in dom.get_text(elements[0])
+        case "url_changed":
+            return document.url != url
+        case "gone":
+            return elements[0] is None
+    raise UnsupportedScriptError(f"Unknown wait condition: {condition}")
+
+
+def check_all_visible(document: dom.FakeDocument, args: list[Any]) -> bool:
+    elements = [document.find(query) for query in args[0]]
+    return all(element is not None and dom.is_displayed(element) for element in elements)
+
+
+def take_snapshot(document: dom.FakeDocument, args: list[Any]) -> list[dict[str, Any] | None]:
+    queries, attribute_names = args
+    snapshots: list[dict[str, Any] | None] = []
+    for query in queries:
+        element = document.find(query)
+        if element is None:
+            snapshots.append(None)
+            continue
+        snapshots.append(
+            {
+                "text": dom.get_text(element),
+                "value": document.get_value(element) if element.tag in dom.VALUE_TAGS else None,
+                "isDisplayed": dom.is_displayed(element),
+                "attributes": {name: element.get(name) for name in attribute_names},
+            },
+        )
+    return snapshots
+
+
+def bulk_fill(document: dom.FakeDocument, args: list[Any]) -> list[bool]:
+    queries, values = args
+    filled = []
+    for query, value in zip(queries, values, strict=True):
+        element = document.find(query)
+        if element is not None:
+            document.set_value(element, value)
+        filled.append(element is not None)
+    return filled
+
+
+def build_label_index(document: dom.FakeDocument, args: list[Any]) -> list[dict[str, Any]] | None:
+    root_query, tags = args
+    root = document.find(root_query) if root_query else document.root
+    if root is None:
+        return None
+    preceding_texts = dict.fromkeys(tags, "")
+    fields = []
+    for node in dom.iter_nodes(root):
+        if isinstance(node, str):
+            for tag in tags:
+                preceding_texts[tag] += node
+            continue
+        if node.tag not in preceding_texts:
+            continue
+        fields.append(
+            {
+                "tag": node.tag,
+                "id": document.get_unique_id(node),
+                "labels": [label.text_content() for label in document.get_labels(node)],
+                "precedingText": preceding_texts[node.tag],
+            },
+        )
+        preceding_texts[node.tag] = ""
+    return fields
+
+
+def resolve_element(document: dom.FakeDocument, args: list[Any]) -> dict[str, Any]:
+    query, known_generation = args
+    generation = f"{document.document_id}:{document.generation}"
+    if generation == known_generation:
+        return {"generation": generation, "isFresh": True}
+    element: lxml.html.HtmlElement | None = document.find(query)
+    return {
+        "generation": generation,
+        "isFresh": False,
+        "element": element,
+        "isDisplayed": element is not None and dom.is_displayed(element),
+    }
+
+
+# Script text -> emulation of script
+SCRIPT_HANDLERS: dict[str, ScriptHandler] = {
+    IN_PAGE_WAIT_SCRIPT: in_page_wait,
+    ALL_VISIBLE_SCRIPT: check_all_visible,
+    SNAPSHOT_SCRIPT: take_snapshot,
+    BULK_FILL_SCRIPT: bulk_fill,
+    LABEL_INDEX_SCRIPT: build_label_index,
+    RESOLVE_ELEMENT_SCRIPT: resolve_element,
+    # Fake browser doesn't send any requests in background
+    WAIT_NETWORK_IDLE_SCRIPT: lambda document, args: True,
+    CHECK_NETWORK_IDLE_SCRIPT: lambda document, args: True,
+}
+
+# Prefix of script text -> emulation of selenium atom
+ATOM_HANDLERS: dict[str, ScriptHandler] = {
+    "/* isDisplayed */": is_displayed_atom,
+    "/* getAttribute */": get_attribute_atom,
+}
+
+
+def execute_script(document: dom.FakeDocument, script: str, args: list[Any]) -> Any:
+    """Emulate script execution in document.
+
+    Raises:
+        UnsupportedScriptError: If script isn't known.
+
+    """
+    if handler := SCRIPT_HANDLERS.get(script):
+        return handler(document, args)
+    for prefix, atom_handler in ATOM_HANDLERS.items():
+        if script.startswith(prefix):
+            return atom_handler(document, args)
+    first_line = next((line for line in script.splitlines() if line.strip()), "")
+    raise UnsupportedScriptError(f"Script isn't supported by fake browser: {first_line}")
@@ -0,0 +1,569 @@
+import json
+import logging
+import re
+import threading
+import time
+import urllib.parse
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Protocol
+
+import lxml.html
+
+from . import dom, scripts
+
+LOGGER = logging.getLogger(__name__)
+
+# Key of element reference in W3C WebDriver protocol
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# Method, path template and name of supported W3C WebDriver commands. Command
+# is handled by method of `FakeSession` named like command in snake case.
+COMMANDS: tuple[tuple[str, str, str], ...] = (
+    ("POST", "/session", "New Session"),
+    ("GET", "/status", "Status"),
+    ("DELETE", "/session/{session_id}", "Delete Session"),
+    ("GET", "/session/{session_id}/timeouts", "Get Timeouts"),
+    ("POST", "/session/{session_id}/timeouts", "Set Timeouts"),
+    ("POST", "/session/{session_id}/url", "Navigate To"),
+    ("GET", "/session/{session_id}/url", "Get Current URL"),
+    ("POST", "/session/{session_id}/back", "Back"),
+    ("POST", "/session/{session_id}/refresh", "Refresh"),
+    ("GET", "/session/{session_id}/title", "Get Title"),
+    ("GET", "/session/{session_id}/source", "Get Page Source"),
+    ("GET", "/session/{session_id}/window", "Get Window Handle"),
+    ("GET", "/session/{session_id}/window/handles", "Get Window Handles"),
+    ("GET", "/session/{session_id}/window/rect", "Get Window Rect"),
+    ("POST", "/session/{session_id}/window/rect", "Set Window Rect"),
+    ("POST", "/session/{session_id}/window/maximize", "Maximize Window"),
+    ("POST", "/session/{session_id}/element", "Find Element"),
+    ("POST", "/session/{session_id}/elements", "Find Elements"),
+    ("POST", "/session/{session_id}/element/{element_id}/element", "Find Element From Element"),
+    ("POST", "/session/{session_id}/element/{element_id}/elements", "Find Elements From Element"),
+    ("POST", "/session/{session_id}/element/{element_id}/click", "Element Click"),
+    ("POST", "/session/{session_id}/element/{element_id}/clear", "Element Clear"),
+    ("POST", "/session/{session_id}/element/{element_id}/value", "Element Send Keys"),
+    ("GET", "/session/{session_id}/element/{element_id}/text", "Get Element Text"),
+    ("GET", "/session/{session_id}/element/{element_id}/name", "Get Element Tag Name"),
+    ("GET", "/session/{session_id}/element/{element_id}/rect", "Get Element Rect"),
+    ("GET", "/session/{session_id}/element/{element_id}/enabled", "Is Element Enabled"),
+    ("GET", "/session/{session_id}/element/{element_id}/selected", "Is Element Selected"),
+    ("GET", "/session/{session_id}/element/{element_id}/displayed", "Is Element Displayed"),
+    ("GET", "/session/{session_id}/element/{element_id}/attribute/{name}", "Get Element Attribute"),
+    ("GET", "/session/{session_id}/element/{element_id}/property/{name}", "Get Element Property"),
+    ("GET", "/session/{session_id}/element/{element_id}/css/{name}", "Get Element CSS Value"),
+    ("POST", "/session/{session_id}/execute/sync", "Execute Script"),
+    ("POST", "/session/{session_id}/execute/async", "Execute Async Script"),
+    ("GET", "/session/{session_id}/cookie", "Get All Cookies"),
+    ("DELETE", "/session/{session_id}/cookie", "Delete All Cookies"),
+    ("POST", "/session/{session_id}/actions", "Perform Actions"),
+    ("DELETE", "/session/{session_id}/actions", "Release Actions"),
+    ("GET", "/session/{session_id}/screenshot", "Take Screenshot"),
+    # Chromium extension, which is used to inject scripts in new documents
+    ("POST", "/session/{session_id}/goog/cdp/execute", "Execute CDP Command"),
+)
+
+COMMAND_PATTERNS = tuple(
+    (method, re.compile(re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path)), name)
+    for method, path, name in COMMANDS
+)
+
+# Special keys of WebDriver protocol which are emulated on typing
+KEY_NULL = "\ue000"
+KEY_BACKSPACE = "\ue003"
+KEY_DELETE = "\ue017"
+# Control, Command and right Control
+KEY_MODIFIERS = ("\ue009", "\ue03d", "\ue051")
+# Range of special keys, other special keys are ignored on typing
+SPECIAL_KEYS_RANGE = ("\ue000", "\uf8ff")
+
+
+def resolve_command(method: str, path: str) -> tuple[str, dict[str, str]] | None:
+    """Get name of command and its path params."""
+    for command_method, pattern, command in COMMAND_PATTERNS:
+        if command_method == method and (match := pattern.fullmatch(path)):
+            return command, match.groupdict()
+    return None
+
+
+class WebDriverError(Exception):
+    """Represent error of W3C WebDriver protocol."""
+
+    def __init__(self, error: str, message: str, status: int = 404) -> None:
+        super().__init__(message)
+        self.error = error
+        self.message = message
+        self.status = status
+
+
+class FakeApp(Protocol):
+    """Represent scripted web app opened in fake browser, e.g. `BlogApp`."""
+
+    def render(self, url: str, state: dict[str, Any]) -> tuple[str, str]:
+        """Render page of url, return final url (after redirects) and HTML."""
+
+    def submit(self, url: str, values: dict[str, str], state: dict[str, Any]) -> str:
+        """Handle submitted form and return url to open."""
+
+
+class FakeSession:
+    """Represent session of fake browser.
+
+    Documents are changed only by commands, so waits and scripts are
+    resolved right away. The only exception is implicit wait: if element
+    isn't found, command takes implicit wait timeout like in real browser.
+
+    """
+
+    def __init__(self, app: FakeApp, browser_name: str) -> None:
+        self.session_id = uuid.uuid4().hex
+        self.app = app
+        self.browser_name = browser_name
+        self.window_handle = uuid.uuid4().hex
+        # State of app in browser, e.g. signed in user
+        self.app_state: dict[str, Any] = {}
+        self.timeouts = {"implicit": 0, "pageLoad": 300_000, "script": 30_000}
+        self.window_rect = {"x": 0, "y": 0, "width": 1280, "height": 720}
+        self.document = dom.FakeDocument(url="about:blank", html="<html></html>")
+        self.history: list[str] = []
+        self.lock = threading.Lock()
+        self._elements: dict[str, lxml.html.HtmlElement] = {}
+        self._references: dict[int, str] = {}
+        self._stale_references: set[str] = set()
+        # Field where all text is selected by `Ctrl+A`
+        self._selected_field: lxml.html.HtmlElement | None = None
+
+    def load(self, url: str) -> None:
+        """Load page of app, all references to elements of previous page become stale."""
+        final_url, html = self.app.render(url, self.app_state)
+        self.document = dom.FakeDocument(url=final_url, html=html)
+        self._stale_references.update(self._elements)
+        self._elements.clear()
+        self._references.clear()
+        self._selected_field = None
+
+    def get_reference(self, element: lxml.html.HtmlElement) -> dict[str, str]:
+        # Elements are stored in session, so their ids are never reused
+        reference = self._references.setdefault(id(element), uuid.uuid4().hex)
+        self._elements[reference] = element
+        return {ELEMENT_KEY: reference}
+
+    def get_element(self, reference: str) -> lxml.html.HtmlElement:
+        element = self._elements.get(reference)
+        if element is not None and self.document.contains(element):
+            return element
+        if element is not None or reference in self._stale_references:
+            raise WebDriverError("stale element reference", f"Element {reference} is stale")
+        raise WebDriverError("no such element", f"Element {reference} is unknown")
+
+    def encode(self, value: Any) -> Any:
+        """Replace elements in result of command by references."""
+        if isinstance(value, lxml.html.HtmlElement):
+            return self.get_reference(value)
+        if isinstance(value, list | tuple):
+            return [self.encode(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.encode(item) for key, item in value.items()}
+        return value
+
+    def decode(self, value: Any) -> Any:
+        """Replace references in arguments of command by elements."""
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return self.get_element(value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if isinstance(value, dict):
+            return {key: self.decode(item) for key, item in value.items()}
+        return value
+
+    def find(
+        self,
+        body: dict[str, Any],
+        context: lxml.html.HtmlElement | None = None,
+    ) -> list[lxml.html.HtmlElement]:
+        if body.get("using") != "xpath":
+            raise WebDriverError(
+                "invalid argument",
+                f"Only xpath is supported by fake browser, got {body.get('using')}",
+                status=400,
+            )
+        try:
+            elements = self.document.find_all(body["value"], context)
+        except dom.InvalidSelectorError as error:
+            raise WebDriverError("invalid selector", str(error), status=400) from error
+        if not elements and self.timeouts["implicit"]:
+            # DOM of fake browser can't change while command is executed
+            time.sleep(self.timeouts["implicit"] / 1000)
+        return elements
+
+    def find_one(
+        self,
+        body: dict[str, Any],
+        context: lxml.html.HtmlElement | None = None,
+    ) -> dict[str, str]:
+        elements = self.find(body, context)
+        if not elements:
+            raise WebDriverError("no such element", f"Unable to locate {body.get('value')}")
+        return self.get_reference(elements[0])
+
+    def check_interactable(self, element: lxml.html.HtmlElement) -> None:
+        if not dom.is_displayed(element):
+            raise WebDriverError(
+                "element not interactable",
+                f"Element <{element.tag}> is not displayed",
+                status=400,
+            )
+
+    def submit(self, form: lxml.html.HtmlElement) -> None:
+        values = {
+            field.get("name"): self.document.get_value(field)
+            for field in form.iter("input", "textarea", "select")
+            if field.get("name") and dom.is_enabled(field)
+        }
+        action = urllib.parse.urljoin(self.document.url, form.get("action") or self.document.url)
+        self.history.append(self.document.url)
+        self.load(self.app.submit(action, values, self.app_state))
+
+    def type_keys(self, element: lxml.html.HtmlElement, text: str) -> None:
+        """Type text to field, `Ctrl+A`, `Backspace` and `Delete` keys are emulated."""
+        value = self.document.get_value(element)
+        is_modifier_pressed = False
+        for key in text:
+            if key in KEY_MODIFIERS:
+                is_modifier_pressed = True
+            elif key == KEY_NULL:
+                is_modifier_pressed = False
+            elif is_modifier_pressed and key.lower() == "a":
+                self._selected_field = element
+            elif key in (KEY_BACKSPACE, KEY_DELETE):
+                value = "" if self._selected_field is element else value[:-1]
+                self._selected_field = None
+            elif not SPECIAL_KEYS_RANGE[0] <= key <= SPECIAL_KEYS_RANGE[1]:
+                value = key if self._selected_field is element else value + key
+                self._selected_field = None
+        self.document.set_value(element, value)
+
+    # Commands
+
+    def delete_session(self, body: dict[str, Any]) -> None:
+        return None
+
+    def get_timeouts(self, body: dict[str, Any]) -> dict[str, int]:
+        return self.timeouts
+
+    def set_timeouts(self, body: dict[str, Any]) -> None:
+        self.timeouts.update(
+            {key: value for key, value in body.items() if key in self.timeouts},
+        )
+
+    def navigate_to(self, body: dict[str, Any]) -> None:
+        self.history.append(self.document.url)
+        self.load(body["url"])
+
+    def get_current_url(self, body: dict[str, Any]) -> str:
+        return self.document.url
+
+    def back(self, body: dict[str, Any]) -> None:
+        if self.history:
+            self.load(self.history.pop())
+
+    def refresh(self, body: dict[str, Any]) -> None:
+        self.load(self.document.url)
+
+    def get_title(self, body: dict[str, Any]) -> str:
+        return self.document.title
+
+    def get_page_source(self, body: dict[str, Any]) -> str:
+        return self.document.source
+
+    def get_window_handle(self, body: dict[str, Any]) -> str:
+        return self.window_handle
+
+    def get_window_handles(self, body: dict[str, Any]) -> list[str]:
+        return [self.window_handle]
+
+    def get_window_rect(self, body: dict[str, Any]) -> dict[str, int]:
+        return self.window_rect
+
+    def set_window_rect(self, body: dict[str, Any]) -> dict[str, int]:
+        self.window_rect.update(
+            {key: value for key, value in body.items() if key in self.window_rect and value},
+        )
+        return self.window_rect
+
+    def maximize_window(self, body: dict[str, Any]) -> dict[str, int]:
+        self.window_rect.update({"x": 0, "y": 0, "width": 1920, "height": 1080})
+        return self.window_rect
+
+    def find_element(self, body: dict[str, Any]) -> dict[str, str]:
+        return self.find_one(body)
+
+    def find_elements(self, body: dict[str, Any]) -> list[dict[str, str]]:
+        return [self.get_reference(element) for element in self.find(body)]
+
+    def find_element_from_element(self, body: dict[str, Any], element_id: str) -> dict[str, str]:
+        return self.find_one(body, context=self.get_element(element_id))
+
+    def find_elements_from_element(
+        self,
+        body: dict[str, Any],
+        element_id: str,
+    ) -> list[dict[str, str]]:
+        elements = self.find(body, context=self.get_element(element_id))
+        return [self.get_reference(element) for element in elements]
+
+    def element_click(self, body: dict[str, Any], element_id: str) -> None:
+        element = self.get_element(element_id)
+        self.check_interactable(element)
+        if not dom.is_enabled(element):
+            return
+        if (link := dom.find_closest(element, "a")) is not None and link.get("href"):
+            self.history.append(self.document.url)
+            self.load(urllib.parse.urljoin(self.document.url, link.get("href")))
+            return
+        button = dom.find_closest(element, "button")
+        if button is None and element.tag == "input" and element.get("type") == "submit":
+            button = element
+        if button is not None and button.get("type", "submit") == "submit":
+            form = dom.find_closest(button, "form")
+            if form is not None:
+                self.submit(form)
+
+    def element_clear(self, body: dict[str, Any], element_id: str) -> None:
+        element = self.get_element(element_id)
+        self.check_interactable(element)
+        self.document.set_value(element, "")
+
+    def element_send_keys(self, body: dict[str, Any], element_id: str) -> None:
+        element = self.get_element(element_id)
+        self.check_interactable(element)
+        self.type_keys(element, body["text"])
+
+    def get_element_text(self, body: dict[str, Any], element_id: str) -> str:
+        return dom.get_text(self.get_element(element_id))
+
+    def get_element_tag_name(self, body: dict[str, Any], element_id: str) -> str:
+        return self.get_element(element_id).tag
+
+    def get_element_rect(self, body: dict[str, Any], element_id: str) -> dict[str, int]:
+        is_displayed = dom.is_displayed(self.get_element(element_id))
+        return {"x": 0, "y": 0, "width": 100 * is_displayed, "height": 20 * is_displayed}
+
+    def is_element_enabled(self, body: dict[str, Any], element_id: str) -> bool:
+        return dom.is_enabled(self.get_element(element_id))
+
+    def is_element_selected(self, body: dict[str, Any], element_id: str) -> bool:
+        element = self.get_element(element_id)
+        return element.get("checked") is not None or element.get("selected") is not None
+
+    def is_element_displayed(self, body: dict[str, Any], element_id: str) -> bool:
+        return dom.is_displayed(self.get_element(element_id))
+
+    def get_element_attribute(
+        self,
+        body: dict[str, Any],
+        element_id: str,
+        name: str,
+    ) -> str | None:
+        return self.get_element(element_id).get(name)
+
+    def get_element_property(self, body: dict[str, Any], element_id: str, name: str) -> Any:
+        element = self.get_element(element_id)
+        match name:
+            case "value":
+                return self.document.get_value(element)
+            case "textContent":
+                return element.text_content()
+            case "innerText":
+                return dom.get_text(element)
+            case "tagName":
+                return element.tag.upper()
+        if name in dom.BOOLEAN_ATTRIBUTES:
+            return element.get(name) is not None
+        return element.get(name)
+
+    def get_element_css_value(self, body: dict[str, Any], element_id: str, name: str) -> str:
+        element = self.get_element(element_id)
+        if name == "display":
+            return "block" if dom.is_displayed(element) else "none"
+        if name == "visibility":
+            return "visible" if dom.is_displayed(element) else "hidden"
+        return ""
+
+    def execute_script(self, body: dict[str, Any]) -> Any:
+        try:
+            result = scripts.execute_script(
+                self.document,
+                body["script"],
+                self.decode(body.get("args", [])),
+            )
+        except scripts.UnsupportedScriptError as error:
+            raise WebDriverError("javascript error", str(error), status=500) from error
+        return self.encode(result)
+
+    def execute_async_script(self, body: dict[str, Any]) -> Any:
+        return self.execute_script(body)
+
+    def get_all_cookies(self, body: dict[str, Any]) -> list[dict[str, Any]]:
+        return []
+
+    def delete_all_cookies(self, body: dict[str, Any]) -> None:
+        self.app_state.clear()
+
+    def perform_actions(self, body: dict[str, Any]) -> None:
+        return None
+
+    def release_actions(self, body: dict[str, Any]) -> None:
+        return None
+
+    def take_screenshot(self, body: dict[str, Any]) -> str:
+        return ""
+
+    def execute_cdp_command(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Accept CDP commands, scripts of fake browser are emulated without them."""
+        return {}
+
+
+class FakeWebDriverServer(ThreadingHTTPServer):
+    """W3C WebDriver server which opens scripted app in fake browser.
+
+    Each command can be delayed to emulate latency of real browser, see
+    `get_latency`. Commands are counted by name, stats can be read by
+    `GET /fake/stats` request and reset by `DELETE /fake/stats`.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        app: FakeApp,
+        latency: float = 0.0,
+        command_latencies: dict[str, float] | None = None,
+    ) -> None:
+        super().__init__(address, FakeWebDriverRequestHandler)
+        self.host = address[0]
+        self.app = app
+        self.latency = latency
+        self.command_latencies = command_latencies or {}
+        self.sessions: dict[str, FakeSession] = {}
+        self.commands_counter: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.server_port}"
+
+    def get_latency(self, command: str) -> float:
+        """Get delay of command, per command latency takes precedence over global one."""
+        return self.command_latencies.get(command, self.latency)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "commands": dict(self.commands_counter),
+                "total": sum(self.commands_counter.values()),
+                "sessions": len(self.sessions),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.commands_counter.clear()
+
+    def dispatch(self, method: str, path: str, body: dict[str, Any]) -> tuple[int, Any]:
+        """Execute command and return HTTP status with value of response."""
+        # Remote url can have prefix, e.g. `/wd/hub`
+        if "/session" in path:
+            path = path[path.index("/session") :]
+        elif path.endswith("/status"):
+            path = "/status"
+        resolved_command = resolve_command(method, path)
+        if not resolved_command:
+            return 404, {"error": "unknown command", "message": f"{method} {path}"}
+
+        command, params = resolved_command
+        with self._lock:
+            self.commands_counter[command] += 1
+        time.sleep(self.get_latency(command))
+        try:
+            return 200, self.execute(command, params, body)
+        except WebDriverError as error:
+            return error.status, {"error": error.error, "message": error.message, "stacktrace": ""}
+
+    def execute(self, command: str, params: dict[str, str], body: dict[str, Any]) -> Any:
+        match command:
+            case "Status":
+                return {"ready": True, "message": "Fake WebDriver is ready"}
+            case "New Session":
+                return self.create_session(body)
+        session_id = params.pop("session_id")
+        session = self.sessions.get(session_id)
+        if not session:
+            raise WebDriverError("invalid session id", f"Session {session_id} doesn't exist")
+        if command == "Delete Session":
+            with self._lock:
+                self.sessions.pop(session_id, None)
+        handler = getattr(session, command.lower().replace(" ", "_"))
+        with session.lock:
+            return handler(body=body, **params)
+
+    def create_session(self, body: dict[str, Any]) -> dict[str, Any]:
+        capabilities = body.get("capabilities", {}).get("alwaysMatch", {})
+        session = FakeSession(self.app, browser_name=capabilities.get("browserName", "chrome"))
+        with self._lock:
+            self.sessions[session.session_id] = session
+        return {
+            "sessionId": session.session_id,
+            "capabilities": {
+                "browserName": session.browser_name,
+                "browserVersion": "fake",
+                "platformName": "linux",
+                "acceptInsecureCerts": False,
+                "timeouts": session.timeouts,
+            },
+        }
+
+
+class FakeWebDriverRequestHandler(BaseHTTPRequestHandler):
+    """Handle HTTP requests of WebDriver clients."""
+
+    # Keep connections alive like drivers of real browsers do
+    protocol_version = "HTTP/1.1"
+    # Headers and body of response are written separately, with Nagle's
+    # algorithm body waits for delayed ACK of headers (~40ms on Linux)
+    disable_nagle_algorithm = True
+    server: FakeWebDriverServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.handle_request("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self.handle_request("POST")
+
+    def do_DELETE(self) -> None:  # noqa: N802
+        self.handle_request("DELETE")
+
+    def handle_request(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        path = urllib.parse.urlsplit(self.path).path
+        if path == "/fake/stats":
+            if method == "DELETE":
+                self.server.reset_stats()
+            self.send_json(200, self.server.get_stats())
+            return
+        status, value = self.server.dispatch(method, path, body)
+        self.send_json(status, {"value": value})
+
+    def send_json(self, status: int, payload: Any) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        LOGGER.debug(format, *args)
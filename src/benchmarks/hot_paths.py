@@ -0,0 +1,297 @@
+"""Measure overhead of framework code on hot paths.
+
+Benchmarks use fake webdriver, pytest request and API models, so they are
+run offline, without browser and API. Results are compared with stored
+baselines and run fails if any benchmark is slower than its baseline by
+more than threshold. Baselines depend on machine, so save them on the same
+machine before changes.
+
+Run from `src` folder:
+
+    python -m benchmarks.hot_paths --save-baselines
+    python -m benchmarks.hot_paths --threshold 0.25
+
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import pathlib
+import sys
+import timeit
+import types
+from collections.abc import Callable
+from typing import Any
+
+from pomcorn import Component, Page
+
+from _pytest.fixtures import SubRequest
+
+from api_factories.api_factory import FactoryGenerator, api_factory
+from api_factories.cache_decorators import _openapi_deserializer, _openapi_serializer
+from api_factories.utils import generate_name_with_uuid
+from plugins.selenium_plugin.cache_decorators import fixture_cache
+
+from pages.caching import get_page_cache_key, memoize_open
+from pages.common import fields
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BASELINES_PATH = pathlib.Path(__file__).with_name("hot_paths_baselines.json")
+# Allowed slowdown relatively to baseline, e.g. 0.25 is 25%
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 5
+LARGE_LIST_SIZE = 1000
+
+
+class FakeModel:
+    """Represent API model generated by SDK."""
+
+    def __init__(self, id: int, title: str, tags: list[str]) -> None:  # noqa: A002
+        self.id = id
+        self.title = title
+        self.tags = tags
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"id": self.id, "title": self.title, "tags": list(self.tags)}
+
+    @classmethod
+    def from_dict(cls, src_dict: dict[str, Any]) -> "FakeModel":
+        return cls(id=src_dict["id"], title=src_dict["title"], tags=list(src_dict["tags"]))
+
+
+FAKE_MODELS_MODULE = types.ModuleType("fake_models")
+FAKE_MODELS_MODULE.FakeModel = FakeModel  # type: ignore[attr-defined]
+
+
+class FakeCache:
+    """Represent in-memory pytest cache, `persist=False` emulates cache misses."""
+
+    def __init__(self, persist: bool = True) -> None:
+        self.persist = persist
+        self.data: dict[str, Any] = {}
+
+    def get(self, key: str, default: Any) -> Any:
+        return self.data.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        if self.persist:
+            self.data[key] = value
+
+
+class FakeConfig:
+    """Represent pytest config with enabled fixtures cache."""
+
+    def __init__(self, cache: FakeCache) -> None:
+        self.cache = cache
+
+    def getoption(self, name: str) -> Any:
+        return name == "--use-cache"
+
+
+class FakeRequest(SubRequest):  # type: ignore[misc]
+    """Represent request of fixture without pytest session."""
+
+    def __init__(self, cache: FakeCache) -> None:
+        self._config = FakeConfig(cache)
+
+    @property
+    def config(self) -> Any:
+        return self._config
+
+    def getfixturevalue(self, argname: str) -> Any:
+        return "gw0"
+
+    def addfinalizer(self, finalizer: Callable[[], object]) -> None:
+        """Skip finalizers, they are never run by benchmarks."""
+
+
+class FakeWebDriver:
+    """Represent webdriver which opens any url instantly."""
+
+    current_url = "http://localhost:8000/"
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+
+
+class FakePage(Page):
+    """Represent page which is loaded instantly."""
+
+    def __init__(self, webdriver: Any, *args, **kwargs) -> None:
+        self.webdriver = webdriver
+
+    @classmethod
+    @memoize_open
+    def open(cls, webdriver: Any, post: FakeModel) -> "FakePage":
+        webdriver.get(f"http://localhost:8000/posts/{post.id}/")
+        return cls(webdriver)
+
+
+class FakeForm(Component[FakePage]):
+    """Represent form with already initialized field."""
+
+    title = fields.Input("Title")
+
+    def __init__(self) -> None:
+        self.cached_elements = {"title": object()}
+
+
+def get_fake_models(count: int) -> list[FakeModel]:
+    return [
+        FakeModel(id=index, title=f"Post {index}", tags=["python", "selenium"])
+        for index in range(count)
+    ]
+
+
+def prepare_openapi_serializer() -> Callable[[], object]:
+    api_objects = get_fake_models(LARGE_LIST_SIZE)
+    return lambda: _openapi_serializer(api_objects)  # type: ignore[arg-type]
+
+
+def prepare_openapi_deserializer() -> Callable[[], object]:
+    cache_data = _openapi_serializer(get_fake_models(LARGE_LIST_SIZE))  # type: ignore[arg-type]
+    return lambda: _openapi_deserializer(FAKE_MODELS_MODULE, cache_data)
+
+
+def _prepare_fixture_cache(persist: bool) -> Callable[[], object]:
+    api_objects = get_fake_models(10)
+    cached_fixture = fixture_cache(
+        serializer=_openapi_serializer,
+        deserializer=functools.partial(_openapi_deserializer, models_module=FAKE_MODELS_MODULE),
+    )(lambda request: api_objects)
+    # Cache names of fixtures include API url
+    os.environ.setdefault("API_URL", "http://localhost:8000")
+    request = FakeRequest(FakeCache(persist=persist))
+    # Fill cache for hits
+    cached_fixture(request)
+    return lambda: cached_fixture(request)
+
+
+def prepare_fixture_cache_hit() -> Callable[[], object]:
+    return _prepare_fixture_cache(persist=True)
+
+
+def prepare_fixture_cache_miss() -> Callable[[], object]:
+    return _prepare_fixture_cache(persist=False)
+
+
+def prepare_get_page_cache_key() -> Callable[[], object]:
+    post = get_fake_models(1)[0]
+    return lambda: get_page_cache_key(FakePage, post, page=1, search="title")
+
+
+def prepare_memoize_open_hit() -> Callable[[], object]:
+    webdriver = FakeWebDriver()
+    post = get_fake_models(1)[0]
+    # Open page for the first time to cache its url
+    FakePage.open(webdriver, post=post)
+    return lambda: FakePage.open(webdriver, post=post)
+
+
+def prepare_form_descriptor_get() -> Callable[[], object]:
+    form = FakeForm()
+    return lambda: form.title
+
+
+def prepare_api_factory() -> Callable[[], object]:
+    @api_factory
+    def fake_factory(title: str) -> FactoryGenerator[FakeModel]:
+        yield FakeModel(id=1, title=title, tags=[])
+
+    request = FakeRequest(FakeCache())
+    return lambda: fake_factory(request, "Post")
+
+
+def prepare_generate_name_with_uuid() -> Callable[[], object]:
+    return lambda: generate_name_with_uuid("Post")
+
+
+# Benchmark name -> function which prepares fakes and returns measured function
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {
+    "openapi_serializer_large_list": prepare_openapi_serializer,
+    "openapi_deserializer_large_list": prepare_openapi_deserializer,
+    "fixture_cache_hit": prepare_fixture_cache_hit,
+    "fixture_cache_miss": prepare_fixture_cache_miss,
+    "get_page_cache_key": prepare_get_page_cache_key,
+    "memoize_open_hit": prepare_memoize_open_hit,
+    "form_descriptor_get": prepare_form_descriptor_get,
+    "api_factory": prepare_api_factory,
+    "generate_name_with_uuid": prepare_generate_name_with_uuid,
+}
+
+
+def measure(function: Callable[[], object], repeat: int = DEFAULT_REPEAT) -> float:
+    """Measure the best time of single call in microseconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1_000_000
+
+
+def run_benchmarks(names: list[str] | None = None) -> dict[str, float]:
+    """Run benchmarks and return time of single call of each one in microseconds."""
+    return {
+        name: measure(prepare())
+        for name, prepare in BENCHMARKS.items()
+        if not names or name in names
+    }
+
+
+def find_regressions(
+    results: dict[str, float],
+    baselines: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """Log results compared with baselines and return names of regressed benchmarks."""
+    regressions = []
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            LOGGER.warning(f"{name}: {result:.2f}us (no baseline)")
+            continue
+        change = result / baseline - 1
+        message = f"{name}: {result:.2f}us (baseline {baseline:.2f}us, {change:+.0%})"
+        if change > threshold:
+            regressions.append(name)
+            LOGGER.error(message)
+        else:
+            LOGGER.info(message)
+    return regressions
+
+
+def main() -> None:
+    """Run benchmarks from command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--baselines", type=pathlib.Path, default=DEFAULT_BASELINES_PATH)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--save-baselines", action="store_true")
+    args = parser.parse_args()
+    if unknown_names := set(args.names) - set(BENCHMARKS):
+        parser.error(f"Unknown benchmarks: {', '.join(sorted(unknown_names))}")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    results = run_benchmarks(args.names)
+    if args.save_baselines:
+        baselines = json.loads(args.baselines.read_text()) if args.baselines.exists() else {}
+        args.baselines.write_text(json.dumps({**baselines, **results}, indent=2, sort_keys=True))
+        LOGGER.info(f"Baselines are saved to {args.baselines}")
+        return
+
+    if not args.baselines.exists():
+        LOGGER.error(f"No baselines in {args.baselines}, save them with --save-baselines")
+        sys.exit(1)
+    regressions = find_regressions(
+        results,
+        baselines=json.loads(args.baselines.read_text()),
+        threshold=args.threshold,
+    )
+    if regressions:
+        LOGGER.error(f"Regressions beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
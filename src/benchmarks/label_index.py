@@ -0,0 +1,183 @@
+"""Compare lookup of fields by label XPath and by label index on large synthetic form.
+
+Run from `src` folder (requires local Chrome):
+
+    python -m benchmarks.label_index --fields 500 --lookups 50
+
+or against fake WebDriver (see `benchmarks.fake_webdriver`), which evaluates
+XPath with lxml and emulates scripts with Python, so only number of commands
+and their latency are comparable with real browser:
+
+    python -m benchmarks.label_index --fake-latency 0.005
+
+"""
+
+import argparse
+import contextlib
+import logging
+import random
+import statistics
+import time
+import urllib.parse
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from pomcorn import Page, locators
+
+from selenium import webdriver as selenium_webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.common.labels import find_field_by_label
+
+from .fake_browser_tests import run_server
+from .fake_webdriver.server import FakeWebDriverServer
+from .waits import count_commands
+
+LOGGER = logging.getLogger(__name__)
+
+
+def generate_form(fields_count: int) -> str:
+    """Prepare HTML of form with fields labeled in different ways.
+
+    Labels are numbered with leading zeros, so no label contains another one.
+    Fields aren't wrapped by labels, since `following::` XPath of fields
+    doesn't match descendants of label. Every third field doesn't have id, so
+    it's located by label XPath in both cases.
+
+    """
+    rows = []
+    for number in range(fields_count):
+        label = f"Field {number:05}"
+        field_id = f"field-{number}"
+        match number % 3:
+            case 0:
+                rows.append(f'<label for="{field_id}">{label}</label><input id="{field_id}">')
+            case 1:
+                rows.append(
+                    f'<div><label>{label}</label> <textarea id="{field_id}"></textarea></div>',
+                )
+            case _:
+                rows.append(f"<div><span>{label}</span></div><div><input></div>")
+        rows.append(f"<p>Help text for {number:05} field, {'lorem ipsum ' * 10}</p>")
+    return f"<html><body><form>{''.join(rows)}</form></body></html>"
+
+
+def get_field_tag(number: int) -> str:
+    """Get tag of field generated by `generate_form`."""
+    return "textarea" if number % 3 == 1 else "input"
+
+
+class StaticApp:
+    """App for fake WebDriver which renders the same page for any url."""
+
+    def __init__(self, html: str) -> None:
+        self.html = html
+
+    def render(self, url: str, state: dict[str, Any]) -> tuple[str, str]:
+        return url, self.html
+
+    def submit(self, url: str, values: dict[str, str], state: dict[str, Any]) -> str:
+        return url
+
+
+@contextlib.contextmanager
+def run_fake_webdriver(html: str, latency: float) -> Iterator[WebDriver]:
+    """Run fake WebDriver with page of `html` and connect to it."""
+    server = FakeWebDriverServer(("localhost", 0), app=StaticApp(html), latency=latency)
+    with run_server(server):
+        webdriver = selenium_webdriver.Remote(
+            command_executor=server.url,
+            options=selenium_webdriver.ChromeOptions(),
+        )
+        try:
+            yield webdriver
+        finally:
+            webdriver.quit()
+
+
+def measure(function: Callable[[], object], repeat: int) -> list[float]:
+    """Measure execution time of function in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def get_label_locator(number: int) -> locators.XPathLocator:
+    """Get locator of field by label, like fields build it."""
+    return locators.XPathLocator(
+        f"//*[contains(., 'Field {number:05}')]/following::{get_field_tag(number)}[1]",
+    )
+
+
+def run_benchmark(webdriver: WebDriver, fields_count: int, lookups: int, repeat: int) -> None:
+    """Find random fields by label XPath and by label index and log timings.
+
+    Label index is used as fields would use it: index is built once per page
+    object, fields without id fall back to label XPath.
+
+    """
+    webdriver.get(
+        f"data:text/html;charset=utf-8,{urllib.parse.quote(generate_form(fields_count))}",
+    )
+    numbers = random.sample(range(fields_count), k=min(lookups, fields_count))
+
+    def _find_by_xpath() -> None:
+        for number in numbers:
+            webdriver.find_element(*get_label_locator(number))
+
+    def _find_by_index() -> None:
+        page = Page(webdriver, app_root=webdriver.current_url)
+        for number in numbers:
+            locator = find_field_by_label(
+                page,
+                base_locator=locators.XPathLocator(""),
+                field_label=f"Field {number:05}",
+                tag=get_field_tag(number),
+            )
+            webdriver.find_element(*(locator or get_label_locator(number)))
+
+    LOGGER.info(f"{fields_count} fields, {len(numbers)} lookups, {repeat} repeats")
+    for name, function in (("label XPath", _find_by_xpath), ("label index", _find_by_index)):
+        commands_count, _ = count_commands(webdriver, function)
+        timings = measure(function, repeat)
+        LOGGER.info(
+            f"{name:>12}: commands={commands_count} "
+            f"mean={statistics.mean(timings) * 1000:.1f}ms "
+            f"min={min(timings) * 1000:.1f}ms max={max(timings) * 1000:.1f}ms",
+        )
+
+
+def main() -> None:
+    """Run benchmark from command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=500)
+    parser.add_argument("--lookups", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--fake-latency",
+        type=float,
+        default=None,
+        help="Run against fake WebDriver with this delay of each command in seconds",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.fake_latency is not None:
+        with run_fake_webdriver(generate_form(args.fields), args.fake_latency) as webdriver:
+            run_benchmark(webdriver, args.fields, args.lookups, args.repeat)
+        return
+
+    options = selenium_webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    webdriver = selenium_webdriver.Chrome(options=options)
+    try:
+        run_benchmark(webdriver, args.fields, args.lookups, args.repeat)
+    finally:
+        webdriver.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compare WebDriver commands sent by polling waits and by in-page waits.
+
+Run from `src` folder (requires local Chrome):
+
+    python -m benchmarks.waits --delays 0.5 1 3
+
+"""
+
+import argparse
+import functools
+import logging
+import time
+import urllib.parse
+from collections.abc import Callable
+from typing import Any
+
+from pomcorn import WebView, locators
+
+from selenium import webdriver as selenium_webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages import waits
+from pages.waits import InPageWaitsMixin
+
+LOGGER = logging.getLogger(__name__)
+
+TARGET_LOCATOR = locators.IdLocator("target")
+
+
+class InPageWaitsView(InPageWaitsMixin, WebView):
+    """Web view with in-page waits."""
+
+
+def get_delayed_page_url(delay: float) -> str:
+    """Prepare page which renders target element after `delay` seconds."""
+    html = (
+        "<html><body><script>setTimeout(() => {"
+        "document.body.insertAdjacentHTML('beforeend', '<div id=\"target\">Ready</div>');"
+        f"}}, {int(delay * 1000)});</script></body></html>"
+    )
+    return f"data:text/html;charset=utf-8,{urllib.parse.quote(html)}"
+
+
+def count_commands(webdriver: WebDriver, function: Callable[[], object]) -> tuple[int, float]:
+    """Count WebDriver commands sent while function is executed and measure its time."""
+    commands_count = 0
+    original_execute = webdriver.execute
+
+    def _execute(*args: Any, **kwargs: Any) -> Any:
+        nonlocal commands_count
+        commands_count += 1
+        return original_execute(*args, **kwargs)
+
+    webdriver.execute = _execute  # type: ignore[method-assign]
+    started_at = time.perf_counter()
+    try:
+        function()
+    finally:
+        webdriver.execute = original_execute  # type: ignore[method-assign]
+    return commands_count, time.perf_counter() - started_at
+
+
+def run_benchmark(webdriver: WebDriver, delays: list[float], poll_frequency: float) -> None:
+    """Wait for delayed element by both kinds of waits and log commands counts."""
+    if not waits.IN_PAGE_WAITS:
+        raise RuntimeError("In-page waits are disabled by `BROWSER_IN_PAGE_WAITS`")
+    web_views: dict[str, WebView] = {
+        "polling": WebView(
+            webdriver,
+            app_root="",
+            wait_timeout=max(delays) + 5,
+            poll_frequency=poll_frequency,
+        ),
+        "in-page": InPageWaitsView(
+            webdriver,
+            app_root="",
+            wait_timeout=max(delays) + 5,
+            poll_frequency=poll_frequency,
+        ),
+    }
+    for delay in delays:
+        for name, web_view in web_views.items():
+            webdriver.get(get_delayed_page_url(delay))
+            commands_count, duration = count_commands(
+                webdriver,
+                functools.partial(web_view.wait_until_locator_visible, TARGET_LOCATOR),
+            )
+            LOGGER.info(
+                f"delay={delay:.1f}s {name:>8}: commands={commands_count} time={duration:.2f}s",
+            )
+
+
+def main() -> None:
+    """Run benchmark from command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--delays", type=float, nargs="+", default=[0.5, 1, 3])
+    parser.add_argument("--poll-frequency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    options = selenium_webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    webdriver = selenium_webdriver.Chrome(options=options)
+    try:
+        run_benchmark(webdriver, args.delays, args.poll_frequency)
+    finally:
+        webdriver.quit()
+
+
+if __name__ == "__main__":
+    main()
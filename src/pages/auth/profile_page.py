@@ -10,6 +10,10 @@ from pages.common import fields
 class ProfilePage(BlogPage):
     """Represent Profile page of PhuongPV Blog."""
 
+    route = "/user/profile/"
+    # Profile form is checked or filled right after page is opened
+    wait_for_form = True
+
     first_name_input = fields.Input(field_label="First Name")
     last_name_input = fields.Input(field_label="Last Name")
     username_input = fields.Input(field_label="Username")
@@ -27,3 +31,9 @@ class ProfilePage(BlogPage):
             )
         blog_page.profile_button.click()
         return cls(webdriver)
+
+    def check_page_is_loaded(self) -> bool:
+        # Page opened by route isn't checked by `open`, so page of user which
+        # isn't signed in fails here and `open` raises error from UI path.
+        # Fields are checked by form readiness check, see `BlogPage.wait_until_form_ready`
+        return self.profile_button.is_displayed and self.save_button.is_displayed
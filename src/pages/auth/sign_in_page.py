@@ -11,6 +11,8 @@ from .profile_page import ProfilePage
 class SignInPage(BlogPage):
     """Represent Sign In page of PhuongPV Blog."""
 
+    route = "/user/login/"
+
     username = Element(locator=locators.IdLocator("id_username"))
     password = Element(locator=locators.IdLocator("id_password"))
     login_button = Element(locator=locators.ButtonWithTextLocator("Login"))
@@ -23,6 +25,9 @@ class SignInPage(BlogPage):
         page.sign_in_button.click()
         return cls(webdriver)
 
+    def check_page_is_loaded(self) -> bool:
+        return self.login_button.is_displayed
+
     def sign_in(self, username: str, password: str) -> ProfilePage:
         """Sign in to the blog admin panel."""
         self.username.fill(username)
@@ -1,12 +1,18 @@
-from typing import TYPE_CHECKING
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
 
 from pomcorn import Component
 
+from pages.common.form_filling import fill_fields
+from pages.snapshots import ElementSnapshot, SnapshotTarget, take_snapshot
+from pages.waits import InPageWaitsMixin
+
 if TYPE_CHECKING:
     from pages.base_pages import BlogPage
+    from pages.common.base_field import BaseField
 
 
-class BlogComponent(Component["BlogPage"]):
+class BlogComponent(InPageWaitsMixin, Component["BlogPage"]):
     """Represent component of PhuongPV Blog.
 
     Jetbrains has some issues with type checking and autocompletion when using generic
@@ -19,3 +25,20 @@ class BlogComponent(Component["BlogPage"]):
         https://youtrack.jetbrains.com/issue/PY-57731
 
     """
+
+    def snapshot(
+        self,
+        *targets: SnapshotTarget,
+        attributes: Sequence[str] = (),
+        wait_until_visible: bool = True,
+    ) -> list[ElementSnapshot]:
+        """Read state of several elements in a single browser call, see `BlogPage.snapshot`.
+
+        Raw locators are relative to component, like `relative_locator` of elements.
+
+        """
+        return take_snapshot(self, targets, attributes, wait_until_visible)
+
+    def fill_form(self, values: Mapping["BaseField", Any]) -> None:
+        """Fill several fields in a single browser call, see `BlogPage.fill_form`."""
+        fill_fields(self, values)
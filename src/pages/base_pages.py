@@ -1,19 +1,45 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Iterator
+import pathlib
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
 from pomcorn import Element, Page, locators
 
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from pages.common.fields import prepare_form_fields
+from pages.common.form_filling import fill_fields
+from pages.network import NETWORK_IDLE_TIME, wait_for_network_idle
+from pages.snapshots import ElementSnapshot, SnapshotTarget, take_snapshot
+from pages.waits import InPageWaitsMixin, wait_until_all_visible
 
-class BlogPage(Page):
+if TYPE_CHECKING:
+    from pages.common.base_field import BaseField
+
+
+class BlogPage(InPageWaitsMixin, Page):
     """Page for setting the basic parameters of pomcorn."""
 
     APP_ROOT = os.environ["APP_ROOT"]
 
+    # Template of page path which is built from arguments of `open` method, for example
+    # `/blog/post/{post.slug}/` (relative to origin of `APP_ROOT` if it starts with `/`,
+    # otherwise to `APP_ROOT`). If it's set, page opened with `memoize_open` is navigated
+    # straight to this URL, see `pages.routing`.
+    route: str | None = None
+
+    # Whether page waits for fields of its form descriptors on load, see
+    # `wait_until_form_ready`. Enable it for pages whose fields are used right
+    # after load, otherwise fields are resolved on first access.
+    wait_for_form: bool = False
+
+    # Folder to save HTML of loaded pages for offline locators validation, see
+    # `pages.locators_validation`
+    HTML_SNAPSHOTS_DIR = os.environ.get("HTML_SNAPSHOTS_DIR")
+
     # Nav bar elements
     sign_in_button = Element(
         locator=locators.ElementWithTextLocator(text="Login", element="a"),
@@ -41,9 +67,86 @@ class BlogPage(Page):
             poll_frequency=poll_frequency,
         )
 
+    def wait_until_loaded(self, timeout: float | None = None) -> None:
+        """Wait until page is loaded and its form is ready if `wait_for_form` is set."""
+        super().wait_until_loaded(timeout=timeout)
+        if self.wait_for_form:
+            self.wait_until_form_ready(timeout=timeout)
+        if self.HTML_SNAPSHOTS_DIR:
+            self.save_html_snapshot(pathlib.Path(self.HTML_SNAPSHOTS_DIR))
+
+    def wait_until_form_ready(self, timeout: float | None = None) -> None:
+        """Wait until all fields declared by form descriptors are visible.
+
+        Fields are checked together in single in-page wait (or by polling of
+        single check if in-page waits are disabled) instead of separate wait
+        for each field on its first access. Fields declared with `lazy=True`
+        are skipped and resolved on first access as usual.
+
+        """
+        fields = prepare_form_fields(self)
+        wait_until_all_visible(
+            self,
+            [field.base_locator for field in fields],
+            timeout=timeout,
+        )
+
+    def save_html_snapshot(self, snapshots_dir: pathlib.Path) -> None:
+        """Save current HTML of page as `<snapshots_dir>/<PageClass>.html`."""
+        snapshots_dir.mkdir(parents=True, exist_ok=True)
+        (snapshots_dir / f"{type(self).__name__}.html").write_text(self.webdriver.page_source)
+
     @contextmanager
     def wait_for_url_change(self) -> Iterator[None]:
         """Context manager for interacting with page switching."""
         old_url = self.current_url
         yield
         self.wait_until_url_changes(old_url)
+
+    def wait_for_network_idle(
+        self,
+        idle_time: float = NETWORK_IDLE_TIME,
+        timeout: float | None = None,
+    ) -> bool:
+        """Wait until page finishes its background API calls.
+
+        Use it instead of sleeps and retries after actions which trigger
+        fetch/XHR requests, see `pages.network`. Return `False` if requests
+        of page aren't tracked, so wait is skipped.
+
+        """
+        return wait_for_network_idle(self, idle_time=idle_time, timeout=timeout)
+
+    def snapshot(
+        self,
+        *targets: SnapshotTarget,
+        attributes: Sequence[str] = (),
+        wait_until_visible: bool = True,
+    ) -> list[ElementSnapshot]:
+        """Read state of several elements in a single browser call.
+
+        Use it instead of multiple `get_text()` calls, each of them requires
+        separate round trips to browser:
+
+            title, content = page.snapshot(page.title, page.content)
+            assert title.text == post.title
+
+        Like `get_text()` snapshot waits until elements are visible, pass
+        `wait_until_visible=False` to read current state of elements.
+
+        """
+        return take_snapshot(self, targets, attributes, wait_until_visible)
+
+    def fill_form(self, values: Mapping[BaseField, Any]) -> None:
+        """Fill several fields in a single browser call.
+
+        Use it instead of multiple `fill()` calls, each of them types value
+        key by key:
+
+            page.fill_form({page.title: post.title, page.content: post.content})
+
+        Fields with disabled `bulk_fill` and all fields in tests marked with
+        `keystroke_typing` are filled by keystrokes, see `pages.common.form_filling`.
+
+        """
+        fill_fields(self, values)
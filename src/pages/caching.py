@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import hashlib
+import inspect
+import json
+import logging
+from collections import Counter
 from collections.abc import Callable
 from functools import wraps
-from typing import NewType, ParamSpec, TypeAlias, TypeVar
+from typing import Any, NewType, ParamSpec, Protocol, TypeAlias, TypeVar
 
 from pomcorn import Page
 
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from pages.routing import get_route_url, is_route_failed, mark_route_failed
+
+LOGGER = logging.getLogger(__name__)
+
 PageObject = TypeVar("PageObject", bound=Page)
 OpenParams = ParamSpec("OpenParams")
 
@@ -19,13 +29,63 @@ PageUrl: TypeAlias = str
 # Cached page urls for use in `memoize_open()`
 URLS_CACHE: dict[PageCacheKey, PageUrl] = {}
 
+# How many times pages were opened by route, by cached url or using UI
+OPEN_PATHS_COUNTER: Counter[str] = Counter()
+
+
+class PersistentStorage(Protocol):
+    """Represent interface of storage to persist page urls between runs, e.g. pytest cache."""
+
+    def get(self, key: str, default: Any) -> Any: ...
+
+    def set(self, key: str, value: Any) -> None: ...
+
+
+class PersistentUrlsCache:
+    """Store page urls in persistent storage, so they survive across sessions, workers and runs."""
+
+    def __init__(self, storage: PersistentStorage, namespace: str) -> None:
+        self.storage = storage
+        self.namespace = namespace
+
+    def get(self, cache_key: PageCacheKey) -> PageUrl | None:
+        return self.storage.get(self._get_storage_key(cache_key), None)
+
+    def set(self, cache_key: PageCacheKey, url: PageUrl) -> None:
+        self.storage.set(self._get_storage_key(cache_key), url)
+
+    def _get_storage_key(self, cache_key: PageCacheKey) -> str:
+        """Convert cache key to string which can be used as file name."""
+        return f"{self.namespace}/{hashlib.sha256(cache_key.encode()).hexdigest()}"
+
+
+# Persistent cache of page urls, see `enable_persistent_urls_cache`
+PERSISTENT_URLS_CACHE: PersistentUrlsCache | None = None
+
+
+def enable_persistent_urls_cache(storage: PersistentStorage, namespace: str) -> None:
+    """Persist urls cached by `memoize_open()` in passed storage."""
+    global PERSISTENT_URLS_CACHE
+    PERSISTENT_URLS_CACHE = PersistentUrlsCache(storage=storage, namespace=namespace)
+
 
 def memoize_open(
     page_open_method: Callable[OpenParams, PageObject],
 ) -> Callable[OpenParams, PageObject]:
     """Open page for the first time using UI, for subsequent calls use stored URL.
 
-    Cache is based on page class name and params for opening.
+    If page declares `route`, it's opened by URL built from route and open
+    params, without any UI navigation or cache. Route url which fails once is
+    skipped by this webdriver session, other urls and sessions still use it.
+
+    Cache is based on page class name and params for opening. If persistent
+    cache is enabled, urls are also reused across sessions, workers and runs.
+
+    Opening by route or stored URL is validated: if browser was redirected or
+    page's `check_page_is_loaded` fails, page is opened using UI and stored URL
+    is rewritten.
+
+    Used ways of opening are counted in `OPEN_PATHS_COUNTER`.
 
     Usage:
 
@@ -41,6 +101,7 @@ def memoize_open(
             return cls(webdriver)
 
     """
+    open_signature = inspect.signature(page_open_method)
 
     @wraps(page_open_method)
     def inner(
@@ -49,47 +110,104 @@ def memoize_open(
         *args: OpenParams.args,
         **kwargs: OpenParams.kwargs,
     ) -> PageObject:
-        cache_key = get_page_cache_key(cls, webdriver, args, kwargs)
+        # Open page by declared route
+        open_arguments = open_signature.bind(cls, webdriver, *args, **kwargs).arguments
+        route_url = get_route_url(cls, open_arguments)
+        if route_url and not is_route_failed(webdriver, route_url):
+            if page := _open_by_url(cls, webdriver, route_url, *args, **kwargs):
+                OPEN_PATHS_COUNTER[f"{cls.__name__}: route"] += 1
+                return page
+            LOGGER.warning(msg=f"`{cls.__name__}` can't be opened by route: {route_url}")
+            OPEN_PATHS_COUNTER[f"{cls.__name__}: failed route"] += 1
+            mark_route_failed(webdriver, route_url)
+
+        cache_key = get_page_cache_key(cls, *args, **kwargs)
 
         # Open page by cached url
-        if cache_key in URLS_CACHE:
-            stored_url = URLS_CACHE[cache_key]
-            webdriver.get(stored_url)
-            return cls(webdriver, *args, **kwargs)
+        if stored_url := get_cached_url(cache_key):
+            if page := _open_by_url(cls, webdriver, stored_url, *args, **kwargs):
+                OPEN_PATHS_COUNTER[f"{cls.__name__}: cached url"] += 1
+                return page
+            LOGGER.info(msg=f"Stored url of `{cls.__name__}` is outdated: {stored_url}")
 
         # Open page manually (step-by-step) and save url
         opened_page: PageObject = page_open_method(cls, webdriver, *args, **kwargs)  # type: ignore
+        OPEN_PATHS_COUNTER[f"{cls.__name__}: UI"] += 1
 
-        URLS_CACHE[cache_key] = opened_page.current_url
+        set_cached_url(cache_key, opened_page.current_url)
         return opened_page
 
     return inner  # type: ignore
 
 
+def _open_by_url(
+    cls: type[PageObject],
+    webdriver: WebDriver,
+    url: PageUrl,
+    *args,
+    **kwargs,
+) -> PageObject | None:
+    """Open page by url and return `None` if page wasn't opened."""
+    webdriver.get(url)
+    # Page may require auth or other conditions, in this case browser is redirected
+    if webdriver.current_url != url:
+        return None
+    try:
+        # Page checks that it's loaded on init by `check_page_is_loaded`
+        return cls(webdriver, *args, **kwargs)
+    except WebDriverException:
+        return None
+
+
+def get_cached_url(cache_key: PageCacheKey) -> PageUrl | None:
+    """Get page url from in-memory cache or from persistent one."""
+    if cache_key in URLS_CACHE:
+        return URLS_CACHE[cache_key]
+    if not PERSISTENT_URLS_CACHE:
+        return None
+    if stored_url := PERSISTENT_URLS_CACHE.get(cache_key):
+        URLS_CACHE[cache_key] = stored_url
+    return stored_url
+
+
+def set_cached_url(cache_key: PageCacheKey, url: PageUrl) -> None:
+    """Save page url to in-memory cache and to persistent one."""
+    URLS_CACHE[cache_key] = url
+    if PERSISTENT_URLS_CACHE:
+        PERSISTENT_URLS_CACHE.set(cache_key, url)
+
+
 def get_page_cache_key(
     cls: type[object],
-    webdriver: WebDriver,
     *args,
     **kwargs,
 ) -> PageCacheKey:
     """Generate page cache key based on passed params.
 
-    Key contains page class name, webdriver session id and args/kwargs which passed to page `open`
-    method.
+    Key contains page class path and args/kwargs which passed to page `open` method.
 
-    All args/kwargs params are converting to single string because they can include API Models which
-    has unhashable type. Also kwargs have unhashable `dict` type by default.
+    All args/kwargs params are converting to single json string because they can include API
+    Models which has unhashable type. API Models are converted to dict, so key doesn't depend on
+    object ids. Also kwargs have unhashable `dict` type by default.
 
-    We have to include the webdriver session ID in cache key, because in some test cases we need
-    to reopen the page using the UI (For example, to open it by another user). And for it we will
-    create new webdriver session.
+    Webdriver session isn't included in key, because urls are reused between sessions. If the
+    page can't be opened by stored URL in other session (for example, by another user), it will
+    be opened using the UI.
 
     """
-    return PageCacheKey(f"""
-        PageCacheKey(
-            page_class=`{cls.__name__}`,
-            webdriver_session_id=`{webdriver.session_id}`,
-            args={args},
-            kwargs={kwargs},
-        )
-    """)
+    open_arguments = json.dumps(
+        {
+            "args": [_normalize_open_argument(arg) for arg in args],
+            "kwargs": {key: _normalize_open_argument(value) for key, value in kwargs.items()},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return PageCacheKey(f"{cls.__module__}.{cls.__qualname__}({open_arguments})")
+
+
+def _normalize_open_argument(argument: Any) -> Any:
+    """Convert API models to dict to make them comparable between runs."""
+    if hasattr(argument, "to_dict"):
+        return argument.to_dict()
+    return argument
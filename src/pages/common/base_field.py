@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from pomcorn import locators
 
 from pages.base_components import BlogComponent
+from pages.element_cache import CachedElement
 
 if TYPE_CHECKING:
     from pages.base_pages import BlogPage
@@ -16,11 +17,16 @@ class BaseField(BlogComponent):
 
     `field_label` can be specified as component attribute or passed in `__init__` method.
 
+    `bulk_fill` defines whether field can be filled together with other fields in a single
+    script call by `fill_form`, disable it for fields which rely on keystrokes (e.g. with
+    autocomplete or input masks), they will be filled by `fill`.
+
     """
 
     page: BlogPage
 
     field_label: str = ""
+    bulk_fill: bool = True
 
     def __init__(
         self,
@@ -28,8 +34,11 @@ class BaseField(BlogComponent):
         field_label: str = "",
         base_locator: locators.XPathLocator = locators.XPathLocator(""),
         wait_until_visible: bool = True,
+        bulk_fill: bool | None = None,
     ):
         self.field_label = field_label or self.field_label
+        if bulk_fill is not None:
+            self.bulk_fill = bulk_fill
         field_locator = base_locator // self.get_field_locator_by_label(self.field_label)
 
         super().__init__(
@@ -37,6 +46,9 @@ class BaseField(BlogComponent):
             base_locator=field_locator,
             wait_until_visible=wait_until_visible,
         )
+        # Field element is accessed on each interaction, so reuse its reference while DOM is
+        # unchanged instead of finding it again each time
+        self.body = CachedElement(web_view=page, locator=self.base_locator)
 
     @property
     @abc.abstractmethod
@@ -16,12 +16,23 @@ class BaseFormDescriptor(Generic[TField]):
     Get field class from `Generic` param and return a cached instance
         each time this attribute is called.
 
+    Fields of page with `wait_for_form` are prepared together by form
+    readiness check (see `prepare_form_fields`), pass `lazy=True` to exclude
+    field from it and resolve it only when it's accessed for the first time.
+
     """
 
     cache_attribute_name = "cached_elements"
 
-    def __init__(self, field_label: str | None = None) -> None:
+    def __init__(
+        self,
+        field_label: str | None = None,
+        bulk_fill: bool | None = None,
+        lazy: bool = False,
+    ) -> None:
         self.field_label = field_label
+        self.bulk_fill = bulk_fill
+        self.lazy = lazy
 
     @property
     def component(self) -> type:
@@ -44,13 +55,20 @@ class BaseFormDescriptor(Generic[TField]):
             )
         return self.prepare_component(instance)
 
-    def prepare_component(self, instance: Instance) -> TField:  # type: ignore[type-arg]
+    def prepare_component(
+        self,
+        instance: Instance,  # type: ignore[type-arg]
+        wait_until_visible: bool = True,
+    ) -> TField:
         """Init component and cache it.
 
         Initiate component only once, and then store it in an instance and return it each
             subsequent time. This is to avoid calling `wait_until_visible` multiple times
             in the init of component.
 
+        Pass `wait_until_visible=False` if visibility of component is checked by caller,
+            e.g. by form readiness check.
+
         If the instance doesn't already have an attribute to store cache, it will be set.
 
         """
@@ -72,6 +90,8 @@ class BaseFormDescriptor(Generic[TField]):
             page=page,
             field_label=self.field_label,
             base_locator=base_locator,
+            wait_until_visible=wait_until_visible,
+            bulk_fill=self.bulk_fill,
         )
         cache[self.attribute_name] = component
 
@@ -81,6 +101,32 @@ class BaseFormDescriptor(Generic[TField]):
         raise ValueError("You can't reset an form component attribute value!")
 
 
+def get_form_descriptors(
+    instance: Instance,  # type: ignore[type-arg]
+) -> list[BaseFormDescriptor[BaseField]]:
+    """Get all form descriptors declared in class of instance and its parents."""
+    descriptors: dict[str, BaseFormDescriptor[BaseField]] = {}
+    for cls in reversed(type(instance).__mro__):
+        for name, attribute in vars(cls).items():
+            if isinstance(attribute, BaseFormDescriptor):
+                descriptors[name] = attribute
+    return list(descriptors.values())
+
+
+def prepare_form_fields(instance: Instance) -> list[BaseField]:  # type: ignore[type-arg]
+    """Init components of all not lazy form fields without waiting for them.
+
+    Returned fields should be checked for visibility at once by caller, see
+    `BlogPage.wait_until_form_ready`.
+
+    """
+    return [
+        descriptor.prepare_component(instance, wait_until_visible=False)
+        for descriptor in get_form_descriptors(instance)
+        if not descriptor.lazy
+    ]
+
+
 class Input(BaseFormDescriptor[fields_components.InputComponent]):
     """Descriptor for easier way to init input attributes in form components."""
 
@@ -27,7 +27,8 @@ class InputComponent(BaseField):
 
     def get_field_locator_by_label(self, field_label: str) -> locators.XPathLocator:
         """Prepare input locator based on `field_label`."""
-        return locators.XPathLocator(f"//*[contains(., '{field_label}')]/following::input[1]")
+        label = locators.XPathLocator._escape_quotes(field_label)
+        return locators.XPathLocator(f"//*[contains(., {label})]/following::input[1]")
 
 
 class TextAreaComponent(InputComponent):
@@ -35,6 +36,5 @@ class TextAreaComponent(InputComponent):
 
     def get_field_locator_by_label(self, field_label: str) -> locators.XPathLocator:
         """Prepare input locator based on `field_label`."""
-        return locators.XPathLocator(
-            f"//*[contains(., '{field_label}')]/following::textarea[1]",
-        )
+        label = locators.XPathLocator._escape_quotes(field_label)
+        return locators.XPathLocator(f"//*[contains(., {label})]/following::textarea[1]")
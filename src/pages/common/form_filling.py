@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from pomcorn import WebView
+
+if TYPE_CHECKING:
+    from .base_field import BaseField
+
+# Set values of all fields in one call. Value is set via native setter of
+# element prototype, so frameworks which track value (e.g. React) notice the
+# change, then the same events as on user input are dispatched.
+BULK_FILL_SCRIPT = """
+const [queries, values] = arguments;
+return queries.map((query, index) => {
+    const element = document.evaluate(
+        query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null,
+    ).singleNodeValue;
+    if (!element) {
+        return false;
+    }
+    const valueDescriptor = Object.getOwnPropertyDescriptor(
+        Object.getPrototypeOf(element), "value",
+    );
+    element.focus();
+    if (valueDescriptor && valueDescriptor.set) {
+        valueDescriptor.set.call(element, values[index]);
+    } else {
+        element.value = values[index];
+    }
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+    element.blur();
+    return true;
+});
+"""
+
+# Whether bulk fill is disabled for all fields, see `keystroke_typing`
+_KEYSTROKE_TYPING: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "keystroke_typing",
+    default=False,
+)
+
+
+@contextmanager
+def keystroke_typing() -> Iterator[None]:
+    """Fill all fields by real keystrokes inside context.
+
+    Use it when keystroke behavior is what the test is checking, for
+    example, with `keystroke_typing` pytest marker.
+
+    """
+    token = _KEYSTROKE_TYPING.set(True)
+    try:
+        yield
+    finally:
+        _KEYSTROKE_TYPING.reset(token)
+
+
+def fill_fields(web_view: WebView, values: Mapping[BaseField, Any]) -> None:
+    """Fill several fields at once.
+
+    Fields which support bulk fill are filled in a single script call, other
+    fields (or fields which weren't found by script) are filled by keystrokes
+    via `field.fill`.
+
+    """
+    typed_fields = {
+        field: value
+        for field, value in values.items()
+        if not field.bulk_fill or _KEYSTROKE_TYPING.get()
+    }
+    bulk_fields = [field for field in values if field not in typed_fields]
+    if bulk_fields:
+        filled = web_view.webdriver.execute_script(
+            BULK_FILL_SCRIPT,
+            [field.base_locator.query for field in bulk_fields],
+            [str(values[field]) for field in bulk_fields],
+        )
+        for field, is_filled in zip(bulk_fields, filled, strict=True):
+            if not is_filled:
+                typed_fields[field] = values[field]
+
+    for field, value in typed_fields.items():
+        field.fill(value)
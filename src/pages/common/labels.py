@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from pomcorn import locators
+
+if TYPE_CHECKING:
+    from pomcorn import Page
+
+# Collect all fields of form (or whole document) with their labels in one
+# pass. For each field both labels bound to it (`<label for>` and wrapping
+# `<label>`) and text between it and previous field of the same tag are
+# returned. The latter allows to keep "text followed by field" heuristic of
+# `//*[contains(., 'label')]/following::input[1]` locators without asking
+# browser to compute string value of every node of document. Only unique ids
+# of fields are returned, fields without them are located by label XPath.
+LABEL_INDEX_SCRIPT = """
+const [rootQuery, tags] = arguments;
+const root = rootQuery ? document.evaluate(
+    rootQuery, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null,
+).singleNodeValue : document;
+if (!root) {
+    return null;
+}
+const getId = (element) => {
+    const id = element.id;
+    return id && !id.includes('"') && document.getElementById(id) === element ? id : null;
+};
+const precedingTexts = Object.fromEntries(tags.map((tag) => [tag, ""]));
+const fields = [];
+const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT);
+for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+    if (node.nodeType === Node.TEXT_NODE) {
+        for (const tag of tags) {
+            precedingTexts[tag] += node.data;
+        }
+        continue;
+    }
+    const tag = node.localName;
+    if (!(tag in precedingTexts)) {
+        continue;
+    }
+    fields.push({
+        tag: tag,
+        id: getId(node),
+        labels: Array.from(node.labels || [], (label) => label.textContent),
+        precedingText: precedingTexts[tag],
+    });
+    precedingTexts[tag] = "";
+}
+return fields;
+"""
+
+# Tags of fields which are collected in label index
+INDEXED_TAGS = ("input", "textarea", "select")
+
+# Attribute of page object to store label indexes by base locator
+LABEL_INDEXES_ATTRIBUTE = "label_indexes"
+
+
+@dataclasses.dataclass(frozen=True)
+class IndexedField:
+    """Represent field found in form by label index.
+
+    `locator` is id locator of field, `None` if field doesn't have unique id.
+
+    """
+
+    tag: str
+    locator: locators.XPathLocator | None
+    labels: tuple[str, ...]
+    preceding_text: str
+
+
+class LabelIndex:
+    """Map labels of form to id locators of fields.
+
+    Lookup by label works like `//*[contains(., 'label')]/following::tag[1]`
+    locator, but fields with label bound by `<label for>` or wrapping
+    `<label>` are preferred.
+
+    Id locators don't depend on position of field, so they stay valid when
+    DOM changes and index is built once per form.
+
+    Fields aren't located by index yet: in Chromium it wasn't faster than
+    label XPath even on forms with thousands of fields, since it costs extra
+    command and fields without id still need XPath, see `benchmarks.label_index`.
+
+    """
+
+    def __init__(self, fields: Sequence[IndexedField]) -> None:
+        self.fields = fields
+
+    def find_field(self, field_label: str, tag: str) -> IndexedField | None:
+        """Get the first field with `tag` matching `field_label`."""
+        fields = [field for field in self.fields if field.tag == tag]
+        for field in fields:
+            if any(field_label in label for label in field.labels):
+                return field
+        for field in fields:
+            if field_label in field.preceding_text:
+                return field
+        return None
+
+    def find(self, field_label: str, tag: str) -> locators.XPathLocator | None:
+        """Get id locator of the first field with `tag` matching `field_label`."""
+        field = self.find_field(field_label, tag)
+        return field.locator if field else None
+
+
+def get_id_locator(field_id: str) -> locators.XPathLocator:
+    """Get XPath locator of element by its id, fields need XPath to be nested."""
+    return locators.XPathLocator(f'//*[@id="{field_id}"]')
+
+
+def build_label_index(
+    page: Page,
+    base_locator: locators.XPathLocator = locators.XPathLocator(""),
+) -> LabelIndex | None:
+    """Collect fields inside element of `base_locator` (or whole page) in one script call.
+
+    Return `None` if element of `base_locator` doesn't exist.
+
+    """
+    raw_fields = page.webdriver.execute_script(
+        LABEL_INDEX_SCRIPT,
+        base_locator.query,
+        list(INDEXED_TAGS),
+    )
+    if raw_fields is None:
+        return None
+    return LabelIndex(
+        [
+            IndexedField(
+                tag=raw_field["tag"],
+                locator=get_id_locator(raw_field["id"]) if raw_field["id"] else None,
+                labels=tuple(raw_field["labels"]),
+                preceding_text=raw_field["precedingText"],
+            )
+            for raw_field in raw_fields
+        ],
+    )
+
+
+def find_field_by_label(
+    page: Page,
+    base_locator: locators.XPathLocator,
+    field_label: str,
+    tag: str,
+) -> locators.XPathLocator | None:
+    """Find id locator of field by label using index cached in page object.
+
+    Index is built once per page object and `base_locator`, so all fields of
+    form share one script call. If field isn't found in cached index, it's
+    rebuilt once, since field may be rendered after index was built. Return
+    `None` if field isn't found or doesn't have id, so caller falls back to
+    label XPath.
+
+    """
+    if not getattr(page, LABEL_INDEXES_ATTRIBUTE, None):
+        setattr(page, LABEL_INDEXES_ATTRIBUTE, {})
+
+    indexes: dict[str, LabelIndex] = getattr(page, LABEL_INDEXES_ATTRIBUTE)
+    index = indexes.get(base_locator.query)
+    if index and (field := index.find_field(field_label, tag)):
+        return field.locator
+
+    if not (index := build_label_index(page, base_locator)):
+        return None
+    indexes[base_locator.query] = index
+    return index.find(field_label, tag)
@@ -0,0 +1,103 @@
+from collections import Counter
+from typing import Any
+
+from pomcorn import WebView, XPathElement, locators
+
+from selenium.webdriver.remote.webelement import WebElement
+
+# How many times cached element references were reused or resolved again
+ELEMENT_CACHE_COUNTER: Counter[str] = Counter()
+
+# Install mutation generation counter once per document and resolve element
+# only if DOM was changed since `knownGeneration`. Generation includes random
+# id of document, so counter of new document never matches old one. Changes of
+# attributes which affect visibility are counted too, so reused element keeps
+# its visibility.
+RESOLVE_ELEMENT_SCRIPT = """
+const [query, knownGeneration] = arguments;
+if (window.__mutationGeneration === undefined) {
+    window.__documentId = Math.random().toString(36).slice(2);
+    window.__mutationGeneration = 0;
+    new MutationObserver(() => {
+        window.__mutationGeneration++;
+    }).observe(document, {
+        childList: true,
+        subtree: true,
+        attributes: true,
+        attributeFilter: ["style", "class", "hidden"],
+    });
+}
+const generation = `${window.__documentId}:${window.__mutationGeneration}`;
+if (generation === knownGeneration) {
+    return {generation: generation, isFresh: true};
+}
+const element = document.evaluate(
+    query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null,
+).singleNodeValue;
+const isDisplayed = Boolean(element) && Boolean(
+    element.offsetWidth || element.offsetHeight || element.getClientRects().length
+) && window.getComputedStyle(element).visibility !== "hidden";
+return {
+    generation: generation,
+    isFresh: false,
+    element: element,
+    isDisplayed: isDisplayed,
+};
+"""
+
+
+class CachedElement(XPathElement):
+    """Element which keeps reference to resolved `WebElement`.
+
+    Pomcorn element finds `WebElement` (and waits for its visibility) before
+    each interaction. This element instead checks in one call whether DOM was
+    changed since reference was resolved and reuses reference if it wasn't,
+    or resolves it again in the same call otherwise. It waits for element
+    like usual pomcorn element only if element wasn't found or isn't visible.
+
+    Use it for elements which are accessed many times, like fields of forms.
+
+    """
+
+    def __init__(self, web_view: WebView, locator: locators.XPathLocator) -> None:
+        super().__init__(web_view=web_view, locator=locator)
+        self._element: WebElement | None = None
+        self._generation: str | None = None
+        self._is_displayed = False
+
+    def get_element(self, only_visible: bool = True) -> WebElement:
+        """Get cached `WebElement` if DOM wasn't changed, otherwise resolve it again."""
+        result: dict[str, Any] = self.web_view.webdriver.execute_script(
+            RESOLVE_ELEMENT_SCRIPT,
+            self.locator.query,
+            self._generation,
+        )
+        if result["isFresh"] and self._element and (self._is_displayed or not only_visible):
+            ELEMENT_CACHE_COUNTER["hit"] += 1
+            return self._element
+
+        element: WebElement | None = result.get("element")
+        is_displayed: bool = result.get("isDisplayed", False)
+        if element and (is_displayed or not only_visible):
+            ELEMENT_CACHE_COUNTER["resolved"] += 1
+            self._cache(element, result["generation"], is_displayed)
+            return element
+
+        # Element isn't rendered yet, so wait for it and resolve it on next call
+        ELEMENT_CACHE_COUNTER["waited"] += 1
+        self.invalidate()
+        return super().get_element(only_visible=only_visible)
+
+    def invalidate(self) -> None:
+        """Drop cached reference, so it's resolved again on next interaction."""
+        self._cache(element=None, generation=None, is_displayed=False)
+
+    def _cache(
+        self,
+        element: WebElement | None,
+        generation: str | None,
+        is_displayed: bool,
+    ) -> None:
+        self._element = element
+        self._generation = generation
+        self._is_displayed = is_displayed
@@ -0,0 +1,270 @@
+"""Validate locators of page objects against saved HTML snapshots of pages.
+
+Snapshots are saved by tests run with `HTML_SNAPSHOTS_DIR` env variable (see
+`BlogPage.wait_until_loaded`), one `<PageClass>.html` per page.
+
+Locators of components are validated against snapshot of page which is set
+in `page` annotation of component, relative locators are joined with
+`base_locator` of component class.
+
+Can be used as standalone script (run from `src` folder):
+
+    python -m pages.locators_validation --snapshots-dir ../html_snapshots
+
+"""
+
+import argparse
+import dataclasses
+import importlib
+import logging
+import pathlib
+import pkgutil
+import sys
+import time
+from collections.abc import Iterator
+
+from pomcorn import Element, locators
+
+import lxml.html
+from lxml import etree
+
+import pages
+from pages.base_components import BlogComponent
+from pages.base_pages import BlogPage
+from pages.common.base_field import BaseField
+from pages.common.fields import BaseFormDescriptor
+
+LOGGER = logging.getLogger(__name__)
+
+# Locators which are evaluated longer than this number of milliseconds are reported as slow
+DEFAULT_SLOW_THRESHOLD_MS = 5.0
+DEFAULT_REPEAT = 5
+
+
+@dataclasses.dataclass(frozen=True)
+class DeclaredLocator:
+    """Represent locator declared in page or component object."""
+
+    view_class: type[BlogPage | BlogComponent]
+    attribute_name: str
+    locator: locators.XPathLocator
+    # Query to count elements which can be matched by locator, if it differs
+    # from locator itself, e.g. for fields located by label
+    ambiguity_query: str | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.view_class.__name__}.{self.attribute_name}"
+
+
+@dataclasses.dataclass
+class ValidationResult:
+    """Represent result of locator evaluation in page snapshot."""
+
+    declared_locator: DeclaredLocator
+    matches_count: int = 0
+    duration_ms: float = 0.0
+    error: str | None = None
+
+    def get_problems(self, slow_threshold_ms: float) -> list[str]:
+        """Describe problems of locator."""
+        if self.error:
+            return [f"invalid: {self.error}"]
+        problems = []
+        if not self.matches_count:
+            problems.append("missing")
+        elif self.matches_count > 1:
+            problems.append(f"ambiguous: {self.matches_count} matches")
+        if self.duration_ms > slow_threshold_ms:
+            problems.append(f"slow: {self.duration_ms:.2f}ms")
+        return problems
+
+
+def import_pages_modules() -> None:
+    """Import all modules of `pages` package, so all page objects are declared."""
+    for module_info in pkgutil.walk_packages(pages.__path__, prefix=f"{pages.__name__}."):
+        importlib.import_module(module_info.name)
+
+
+def iter_subclasses[T](base_class: type[T]) -> Iterator[type[T]]:
+    """Yield class and all its subclasses."""
+    classes: list[type[T]] = [base_class]
+    while classes:
+        cls = classes.pop()
+        yield cls
+        classes.extend(cls.__subclasses__())
+
+
+def iter_page_classes() -> Iterator[type[BlogPage]]:
+    """Import all modules of `pages` package and yield all page classes."""
+    import_pages_modules()
+    yield from iter_subclasses(BlogPage)
+
+
+def get_component_page(
+    component_class: type[BlogComponent],
+    page_classes: dict[str, type[BlogPage]],
+) -> type[BlogPage] | None:
+    """Get page of component from its `page` annotation, `None` if it isn't specific page."""
+    for cls in component_class.__mro__:
+        annotation = vars(cls).get("__annotations__", {}).get("page")
+        if annotation is None:
+            continue
+        # Annotations are strings in modules with postponed evaluation
+        page_name = annotation if isinstance(annotation, str) else annotation.__name__
+        page_class = page_classes.get(page_name.rpartition(".")[2])
+        return page_class if page_class is not BlogPage else None
+    return None
+
+
+def iter_component_classes(
+    page_classes: dict[str, type[BlogPage]],
+) -> Iterator[tuple[type[BlogComponent], type[BlogPage]]]:
+    """Yield component classes and their pages, components without page are skipped.
+
+    Components without specific page, e.g. fields, are validated as part of
+    page which declares them.
+
+    """
+    import_pages_modules()
+    for component_class in iter_subclasses(BlogComponent):
+        if page_class := get_component_page(component_class, page_classes):
+            yield component_class, page_class
+
+
+def get_element_locator(
+    element: Element,
+    base_locator: locators.XPathLocator,
+) -> locators.XPathLocator | None:
+    """Get locator of element descriptor as it's prepared for instance."""
+    if element.relative_locator:
+        return base_locator // element.relative_locator
+    return element.locator
+
+
+def collect_locators(
+    view_class: type[BlogPage | BlogComponent],
+    base_locator: locators.XPathLocator = locators.XPathLocator(""),
+) -> list[DeclaredLocator]:
+    """Collect locators of elements and form fields declared in class and its parents.
+
+    `base_locator` is added to relative locators like it's done for component.
+
+    """
+    attributes: dict[str, object] = {}
+    for cls in reversed(view_class.__mro__):
+        attributes.update(vars(cls))
+
+    declared_locators = []
+    for attribute_name, attribute in attributes.items():
+        if isinstance(attribute, Element) and (
+            locator := get_element_locator(attribute, base_locator)
+        ):
+            declared_locators.append(
+                DeclaredLocator(
+                    view_class=view_class,
+                    attribute_name=attribute_name,
+                    locator=locator,
+                ),
+            )
+        elif isinstance(attribute, BaseFormDescriptor) and attribute.field_label:
+            field_class: type[BaseField] = attribute.component
+            # Field locator is prepared by method of field component, but
+            # component can't be initialized without browser
+            field = field_class.__new__(field_class)
+            # Quote label like pomcorn does, label may contain both quotes
+            label = locators.XPathLocator._escape_quotes(attribute.field_label)
+            declared_locators.append(
+                DeclaredLocator(
+                    view_class=view_class,
+                    attribute_name=attribute_name,
+                    locator=base_locator // field.get_field_locator_by_label(attribute.field_label),
+                    # Innermost elements containing label
+                    ambiguity_query=(
+                        f"{base_locator.query}//*[contains(., {label})]"
+                        f"[not(*[contains(., {label})])]"
+                    ),
+                ),
+            )
+    return declared_locators
+
+
+def evaluate_locator(
+    tree: etree._Element,
+    declared_locator: DeclaredLocator,
+    repeat: int = DEFAULT_REPEAT,
+) -> ValidationResult:
+    """Evaluate locator in snapshot and measure how long it takes."""
+    result = ValidationResult(declared_locator=declared_locator)
+    try:
+        xpath = etree.XPath(declared_locator.locator.query)
+        durations = []
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            matches = xpath(tree)
+            durations.append(time.perf_counter() - started_at)
+        if declared_locator.ambiguity_query and matches:
+            matches = tree.xpath(declared_locator.ambiguity_query)
+    except etree.XPathError as error:
+        result.error = str(error)
+        return result
+
+    result.matches_count = len(matches) if isinstance(matches, list) else int(bool(matches))
+    result.duration_ms = min(durations) * 1000
+    return result
+
+
+def validate_locators(
+    snapshots_dir: pathlib.Path,
+    slow_threshold_ms: float = DEFAULT_SLOW_THRESHOLD_MS,
+) -> int:
+    """Validate locators of all pages which have snapshots and log problems.
+
+    Return number of found problems.
+
+    """
+    page_classes = {page_class.__name__: page_class for page_class in iter_page_classes()}
+    views: list[tuple[type[BlogPage | BlogComponent], type[BlogPage]]] = [
+        (page_class, page_class) for page_class in page_classes.values()
+    ]
+    views.extend(iter_component_classes(page_classes))
+
+    problems_count = 0
+    trees: dict[type[BlogPage], etree._Element] = {}
+    for view_class, page_class in views:
+        snapshot_path = snapshots_dir / f"{page_class.__name__}.html"
+        if not snapshot_path.exists():
+            LOGGER.warning(f"{view_class.__name__}: no snapshot in {snapshot_path}, skipped")
+            continue
+
+        if page_class not in trees:
+            trees[page_class] = lxml.html.fromstring(snapshot_path.read_bytes())
+        base_locator = getattr(view_class, "base_locator", None) or locators.XPathLocator("")
+        for declared_locator in collect_locators(view_class, base_locator):
+            result = evaluate_locator(trees[page_class], declared_locator)
+            problems = result.get_problems(slow_threshold_ms)
+            problems_count += len(problems)
+            for problem in problems:
+                LOGGER.error(f"{declared_locator.name}: {problem} ({declared_locator.locator})")
+    return problems_count
+
+
+def main() -> None:
+    """Run validation from command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--snapshots-dir",
+        type=pathlib.Path,
+        default=pathlib.Path("../html_snapshots"),
+    )
+    parser.add_argument("--slow-threshold", type=float, default=DEFAULT_SLOW_THRESHOLD_MS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    problems_count = validate_locators(args.snapshots_dir, args.slow_threshold)
+    LOGGER.info(f"Found {problems_count} problems")
+    sys.exit(1 if problems_count else 0)
+
+
+if __name__ == "__main__":
+    main()
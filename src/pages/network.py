@@ -0,0 +1,181 @@
+import logging
+import os
+import weakref
+
+from pomcorn import WebView
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.waits import MAX_IN_PAGE_WAIT_TIMEOUT
+
+LOGGER = logging.getLogger(__name__)
+
+# How long page should have no requests in flight to be considered idle
+NETWORK_IDLE_TIME = float(os.environ.get("BROWSER_NETWORK_IDLE_TIME", 0.5))
+
+# Count fetch/XHR requests in flight and remember time of last network
+# activity. Script has to be run at document start (before any script of
+# page), otherwise requests sent before it are missed and page may look idle
+# while they are in flight. Last activity starts at 0 (start of document, see
+# `performance.timeOrigin`).
+NETWORK_TRACKER_SCRIPT = """
+(() => {
+    if (window.__networkTracker || document.readyState !== "loading") {
+        return;
+    }
+    const tracker = {pending: 0, lastActivity: 0};
+    window.__networkTracker = tracker;
+    const start = () => {
+        tracker.pending++;
+        tracker.lastActivity = performance.now();
+    };
+    const finish = () => {
+        tracker.pending = Math.max(tracker.pending - 1, 0);
+        tracker.lastActivity = performance.now();
+    };
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function (...args) {
+            start();
+            return originalFetch.apply(this, args).finally(finish);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        start();
+        this.addEventListener("loadend", finish, {once: true});
+        return originalSend.apply(this, args);
+    };
+})();
+"""
+
+# Result of network idle scripts for document without tracker
+UNTRACKED = "untracked"
+
+# Wait until document is loaded and there are no requests in flight for
+# `idleTime` ms. Document without tracker can't be checked, since tracker
+# installed now wouldn't know about requests which are already in flight.
+WAIT_NETWORK_IDLE_SCRIPT = f"""
+const [idleTime, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const tracker = window.__networkTracker;
+if (!tracker) {{
+    done("{UNTRACKED}");
+    return;
+}}
+const startedAt = performance.now();
+const check = () => {{
+    const now = performance.now();
+    if (
+        document.readyState === "complete"
+        && tracker.pending === 0
+        && now - tracker.lastActivity >= idleTime
+    ) {{
+        done(true);
+    }} else if (now - startedAt >= timeout) {{
+        done(false);
+    }} else {{
+        setTimeout(check, 50);
+    }}
+}};
+check();
+"""
+
+# Check whether document is loaded and there are no requests in flight for
+# `idleTime` ms, used for waits which are longer than script timeout
+CHECK_NETWORK_IDLE_SCRIPT = f"""
+const [idleTime] = arguments;
+const tracker = window.__networkTracker;
+if (!tracker) {{
+    return "{UNTRACKED}";
+}}
+return document.readyState === "complete"
+    && tracker.pending === 0
+    && performance.now() - tracker.lastActivity >= idleTime;
+"""
+
+# Whether tracker is installed at document start through CDP or BiDi, so
+# reused sessions are set up (and warned about) once
+_TRACKED_WEBDRIVERS: weakref.WeakKeyDictionary[WebDriver, bool] = weakref.WeakKeyDictionary()
+
+
+def install_network_tracker(webdriver: WebDriver) -> bool:
+    """Track network requests of all documents opened by webdriver.
+
+    Tracker is injected at start of each new document: through CDP for local
+    Chromium drivers, through BiDi preload script for drivers with BiDi
+    session (`webSocketUrl` capability, see `--webdriver-bidi` option).
+    Other drivers (e.g. remote ones without BiDi) can't track requests, so
+    network idle waits are skipped for them.
+
+    Return whether tracker is installed.
+
+    """
+    if webdriver not in _TRACKED_WEBDRIVERS:
+        _TRACKED_WEBDRIVERS[webdriver] = _install_network_tracker(webdriver)
+    return _TRACKED_WEBDRIVERS[webdriver]
+
+
+def _install_network_tracker(webdriver: WebDriver) -> bool:
+    """Inject tracker at start of each new document, return whether it's installed."""
+    if hasattr(webdriver, "execute_cdp_cmd"):
+        webdriver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": NETWORK_TRACKER_SCRIPT},
+        )
+    elif webdriver.caps.get("webSocketUrl"):
+        try:
+            webdriver.script.add_preload_script(f"() => {{{NETWORK_TRACKER_SCRIPT}}}")
+        except WebDriverException as error:
+            LOGGER.warning(f"Network tracker isn't installed through BiDi: {error}")
+            return False
+    else:
+        LOGGER.warning(
+            "Network tracker can't be installed without CDP or BiDi, "
+            "network idle waits are skipped",
+        )
+        return False
+    return True
+
+
+def wait_for_network_idle(
+    web_view: WebView,
+    idle_time: float = NETWORK_IDLE_TIME,
+    timeout: float | None = None,
+) -> bool:
+    """Wait until page has no fetch/XHR requests in flight for `idle_time` seconds.
+
+    Wait is done by single async script, waits which don't fit into script
+    timeout of WebDriver poll page instead.
+
+    Page without tracker (see `install_network_tracker`) isn't waited for,
+    since its requests in flight are unknown. Return `False` in this case,
+    so callers which rely on idle network have to wait for page by its
+    elements.
+
+    Raises:
+        TimeoutException: If page didn't become idle in `timeout` seconds.
+
+    """
+    timeout = web_view.wait_timeout if timeout is None else timeout
+    message = f"Page still has requests in flight after {timeout} seconds!"
+    if timeout >= MAX_IN_PAGE_WAIT_TIMEOUT:
+        result = web_view.get_wait(timeout).until(
+            lambda webdriver: webdriver.execute_script(
+                CHECK_NETWORK_IDLE_SCRIPT,
+                int(idle_time * 1000),
+            ),
+            message=message,
+        )
+    else:
+        result = web_view.webdriver.execute_async_script(
+            WAIT_NETWORK_IDLE_SCRIPT,
+            int(idle_time * 1000),
+            int(timeout * 1000),
+        )
+    if result == UNTRACKED:
+        return False
+    if not result:
+        raise TimeoutException(msg=message)
+    return True
@@ -13,6 +13,10 @@ from .post_details_page import PostDetailsPage
 class PostCreatePage(BlogPage):
     """Represent Create Post page of PhuongPV Blog."""
 
+    route = "/blog/post/new/"
+    # Form is filled right after page is opened
+    wait_for_form = True
+
     title = fields.Input("Title")
     description = fields.TextArea("Description")
     content = fields.TextArea("Content")
@@ -27,13 +31,19 @@ class PostCreatePage(BlogPage):
         return cls(webdriver)
 
     def check_page_is_loaded(self) -> bool:
-        return self.title.body.is_displayed
+        # Fields are checked by form readiness check, see `BlogPage.wait_until_form_ready`
+        return self.publish_button.is_displayed
 
     def create(self, post: models.Post) -> PostDetailsPage:
         """Create a new blog post."""
-        self.title.fill(post.title)
-        self.description.fill(post.description)
-        self.content.fill(post.content)
+        self.fill_form(
+            {
+                self.title: post.title,
+                self.description: post.description,
+                self.content: post.content,
+            },
+        )
         with self.wait_for_url_change():
             self.publish_button.click()
+        self.wait_for_network_idle()
         return PostDetailsPage(self.webdriver, post)
@@ -10,6 +10,8 @@ from pages.caching import memoize_open
 class PostDetailsPage(BlogPage):
     """Represent Post Details page of PhuongPV Blog."""
 
+    route = "/blog/post/{post.slug}/"
+
     title = Element(locator=locators.ClassLocator("article-title"))
     # Post description and content have the same class name `article-content`,
     # but description is always before content
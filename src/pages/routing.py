@@ -0,0 +1,65 @@
+import string
+import urllib.parse
+from typing import Any
+
+from pomcorn import Page
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class RouteFormatter(string.Formatter):
+    """Formatter for route templates which fails on empty values.
+
+    Open arguments can contain API models with unset fields (for example,
+    post which isn't created yet doesn't have `slug`), so route can't be built
+    from them.
+
+    """
+
+    def get_field(
+        self,
+        field_name: str,
+        args: Any,
+        kwargs: Any,
+    ) -> tuple[Any, str]:
+        value, key = super().get_field(field_name, args, kwargs)
+        if not value and value != 0:
+            raise ValueError(f"Value of `{field_name}` is empty")
+        return value, key
+
+
+# Route urls which failed to open, by url and webdriver session. Route may
+# fail only for some open arguments (e.g. deleted post) or only for session
+# without auth, so other urls of the same page and other sessions still use it
+FAILED_ROUTES: set[tuple[str, str | None]] = set()
+
+
+def mark_route_failed(webdriver: WebDriver, route_url: str) -> None:
+    """Skip route url in next opens by this session, e.g. because it redirects."""
+    FAILED_ROUTES.add((route_url, webdriver.session_id))
+
+
+def is_route_failed(webdriver: WebDriver, route_url: str) -> bool:
+    """Check whether route url failed to open by this session before."""
+    return (route_url, webdriver.session_id) in FAILED_ROUTES
+
+
+def get_route_url(page_class: type[Page], open_arguments: dict[str, Any]) -> str | None:
+    """Build page URL from `route` template of page and its open arguments.
+
+    Route which starts with `/` is relative to origin of `APP_ROOT` (e.g. pages
+    which aren't under `APP_ROOT` path), other routes are relative to `APP_ROOT`.
+
+    Return `None` if page doesn't have a route or route can't be built.
+
+    """
+    route = getattr(page_class, "route", None)
+    if route is None:
+        return None
+    try:
+        path = RouteFormatter().format(route, **open_arguments)
+    except (AttributeError, KeyError, IndexError, ValueError):
+        return None
+    if path.startswith("/"):
+        return urllib.parse.urljoin(page_class.APP_ROOT, path)
+    return page_class._get_full_relative_url(page_class.APP_ROOT, path)
@@ -0,0 +1,104 @@
+import dataclasses
+from collections.abc import Sequence
+from typing import Any, TypeAlias
+
+from pomcorn import Component, WebView, XPathElement, locators
+
+from pages.waits import wait_until_all_visible
+
+SnapshotTarget: TypeAlias = XPathElement | locators.XPathLocator | Component[Any]
+
+# Read state of all elements in one call. Visibility check is similar to one of
+# selenium, text is taken only from visible elements like in `WebElement.text`
+SNAPSHOT_SCRIPT = """
+const [queries, attributeNames] = arguments;
+return queries.map((query) => {
+    const element = document.evaluate(
+        query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null,
+    ).singleNodeValue;
+    if (!element) {
+        return null;
+    }
+    const style = window.getComputedStyle(element);
+    const isDisplayed = Boolean(
+        element.offsetWidth || element.offsetHeight || element.getClientRects().length
+    ) && style.visibility !== "hidden";
+    return {
+        text: isDisplayed ? element.innerText.trim() : "",
+        value: element.value === undefined ? null : String(element.value),
+        isDisplayed: isDisplayed,
+        attributes: Object.fromEntries(
+            attributeNames.map((name) => [name, element.getAttribute(name)]),
+        ),
+    };
+});
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class ElementSnapshot:
+    """Represent state of element at the moment of snapshot."""
+
+    locator: locators.XPathLocator
+    exists: bool
+    text: str = ""
+    value: str | None = None
+    is_displayed: bool = False
+    attributes: dict[str, str | None] = dataclasses.field(default_factory=dict)
+
+
+def get_target_locator(web_view: WebView, target: SnapshotTarget) -> locators.XPathLocator:
+    """Get locator of element, component or locator itself.
+
+    Raw locators passed to component are relative to it (like
+    `relative_locator` of its elements), so they are joined with
+    `base_locator` of component.
+
+    """
+    if isinstance(target, locators.XPathLocator):
+        if isinstance(web_view, Component):
+            return web_view.base_locator // target
+        return target
+    if isinstance(target, Component):
+        return target.base_locator
+    return target.locator
+
+
+def take_snapshot(
+    web_view: WebView,
+    targets: Sequence[SnapshotTarget],
+    attributes: Sequence[str] = (),
+    wait_until_visible: bool = True,
+) -> list[ElementSnapshot]:
+    """Read text, value, visibility and attributes of elements in a single script call.
+
+    If `wait_until_visible` is set, snapshot is taken once all elements are
+    visible, they are waited for together (see `wait_until_all_visible`).
+    Disable it to take snapshot of current state, e.g. to check that element
+    is hidden or doesn't exist.
+
+    """
+    target_locators = [get_target_locator(web_view, target) for target in targets]
+    if wait_until_visible:
+        wait_until_all_visible(web_view, target_locators)
+    raw_snapshots = web_view.webdriver.execute_script(
+        SNAPSHOT_SCRIPT,
+        [locator.query for locator in target_locators],
+        list(attributes),
+    )
+    snapshots = []
+    for locator, raw_snapshot in zip(target_locators, raw_snapshots, strict=True):
+        if raw_snapshot is None:
+            snapshots.append(ElementSnapshot(locator=locator, exists=False))
+            continue
+        snapshots.append(
+            ElementSnapshot(
+                locator=locator,
+                exists=True,
+                text=raw_snapshot["text"],
+                value=raw_snapshot["value"],
+                is_displayed=raw_snapshot["isDisplayed"],
+                attributes=raw_snapshot["attributes"],
+            ),
+        )
+    return snapshots
@@ -1,24 +1,143 @@
+import dataclasses
 import os
+from collections import Counter
 from collections.abc import Callable
 from typing import TypeVar
 
 import tenacity
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    InvalidSessionIdException,
+    NoSuchDriverException,
+    NoSuchWindowException,
+    SessionNotCreatedException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
+from tenacity.stop import stop_base
 
 R = TypeVar("R")
 
+MAX_RETRY_ATTEMPTS = int(os.environ.get("MAX_RETRY_ATTEMPTS", 3))
+# How many seconds each test can spend on waiting between retries
+RETRY_BUDGET = float(os.environ.get("RETRY_BUDGET", 10))
+
+# How many times actions were retried, by call site and exception type
+RETRY_COUNTER: Counter[str] = Counter()
+# How many seconds were spent on waiting between retries, by call site
+RETRY_TIMINGS: dict[str, list[float]] = {}
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryRule:
+    """Represent exponential backoff between retries of some exception."""
+
+    initial_delay: float
+    max_delay: float
+
+    def get_delay(self, attempt_number: int) -> float:
+        """Get delay before next attempt."""
+        return min(self.initial_delay * 2 ** (attempt_number - 1), self.max_delay)
+
+
+# Backoff by exception class, exceptions with `None` rule are never retried.
+# Rule of the closest base class is used for exceptions which aren't listed.
+RETRY_RULES: dict[type[WebDriverException], RetryRule | None] = {
+    # Element is re-rendered, it's usually found again right away
+    StaleElementReferenceException: RetryRule(initial_delay=0.01, max_delay=0.2),
+    # Element is covered by other element or is being animated
+    ElementNotInteractableException: RetryRule(initial_delay=0.05, max_delay=0.5),
+    ElementClickInterceptedException: RetryRule(initial_delay=0.05, max_delay=0.5),
+    # Errors in locators or lost sessions won't go away on retry
+    InvalidSelectorException: None,
+    InvalidSessionIdException: None,
+    NoSuchDriverException: None,
+    NoSuchWindowException: None,
+    SessionNotCreatedException: None,
+    WebDriverException: RetryRule(initial_delay=1, max_delay=4),
+}
+
+
+class RetryBudget:
+    """Limit time which can be spent on waiting between retries."""
+
+    def __init__(self, seconds: float) -> None:
+        self.reset(seconds)
+
+    def reset(self, seconds: float) -> None:
+        """Start new budget, e.g. for next test."""
+        self.seconds = seconds
+        self.spent = 0.0
+
+    @property
+    def remaining(self) -> float:
+        return max(self.seconds - self.spent, 0)
+
+    def spend(self, seconds: float) -> None:
+        self.spent += seconds
+
+
+class StopWhenBudgetSpent(stop_base):
+    """Stop retrying when test spent its retry budget."""
+
+    def __init__(self, budget: RetryBudget) -> None:
+        self.budget = budget
+
+    def __call__(self, retry_state: tenacity.RetryCallState) -> bool:
+        return self.budget.remaining <= 0
+
+
+# Budget of current test, it's reset before each test by `retry_budget` fixture
+RETRY_BUDGET_STATE = RetryBudget(RETRY_BUDGET)
+
+
+def get_retry_rule(error: BaseException | None) -> RetryRule | None:
+    """Get backoff for exception, `None` means that exception shouldn't be retried."""
+    if not isinstance(error, WebDriverException):
+        return None
+    for error_class in type(error).__mro__:
+        if error_class in RETRY_RULES:
+            return RETRY_RULES[error_class]
+    return None
+
 
 def retry(func: Callable[..., R]) -> Callable[..., R]:
     """Shortcut for retrying various selenium actions.
 
     This is just wrapper for `@tenacity.retry` that retries common selenium webdriver exceptions
-    like `StaleElementReferenceException`, `ElementNotInteractableException`, etc
+    like `StaleElementReferenceException`, `ElementNotInteractableException`, etc.
+
+    Delay between retries depends on exception, see `RETRY_RULES`. Retries
+    stop after `MAX_RETRY_ATTEMPTS` attempts or when test spent its
+    `RETRY_BUDGET`. All retries are counted in `RETRY_COUNTER` and
+    `RETRY_TIMINGS`.
 
     """
+    call_site = f"{func.__module__}.{func.__qualname__}"
+
+    def _wait(retry_state: tenacity.RetryCallState) -> float:
+        rule = get_retry_rule(retry_state.outcome.exception() if retry_state.outcome else None)
+        if not rule:
+            return 0
+        return min(rule.get_delay(retry_state.attempt_number), RETRY_BUDGET_STATE.remaining)
+
+    def _before_sleep(retry_state: tenacity.RetryCallState) -> None:
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        delay = retry_state.upcoming_sleep
+        RETRY_BUDGET_STATE.spend(delay)
+        RETRY_COUNTER[f"{call_site}: {type(error).__name__}"] += 1
+        RETRY_TIMINGS.setdefault(call_site, []).append(delay)
+
     decorator = tenacity.retry(
-        stop=tenacity.stop_after_attempt(int(os.environ.get("MAX_RETRY_ATTEMPTS", 3))),
-        wait=tenacity.wait_exponential(min=1),
+        stop=tenacity.stop_any(
+            tenacity.stop_after_attempt(MAX_RETRY_ATTEMPTS),
+            StopWhenBudgetSpent(RETRY_BUDGET_STATE),
+        ),
+        wait=_wait,
         reraise=True,
-        retry=tenacity.retry_if_exception_type(WebDriverException),
+        retry=tenacity.retry_if_exception(lambda error: get_retry_rule(error) is not None),
+        before_sleep=_before_sleep,
     )
     return decorator(func)
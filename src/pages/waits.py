@@ -0,0 +1,274 @@
+import os
+from collections.abc import Sequence
+from typing import Literal, TypeAlias
+
+from pomcorn import WebView, XPathElement, locators
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+# Whether waits are performed inside page instead of polling from client.
+# In Chromium they finish as soon as polling waits (or sooner with coarse
+# `poll_frequency`) with single command instead of one per poll, see
+# `benchmarks.waits`.
+IN_PAGE_WAITS = os.environ.get("BROWSER_IN_PAGE_WAITS", "true").lower() == "true"
+
+# Default script timeout of WebDriver, longer waits can't be done in single
+# async script, so they fall back to polling
+MAX_IN_PAGE_WAIT_TIMEOUT = 30
+
+WaitCondition: TypeAlias = Literal[
+    "visible",
+    "all_visible",
+    "invisible",
+    "text",
+    "url_changed",
+    "gone",
+]
+
+# Check condition in page on each DOM mutation and finish as soon as it's met
+# or when timeout is reached. URL changes made by history API and changes of
+# styles don't always mutate DOM, so condition is also checked by rare timer.
+# Visibility check is similar to one of selenium.
+IN_PAGE_WAIT_SCRIPT = """
+const [condition, queries, text, url, timeout] = arguments;
+const done = arguments[arguments.length - 1];
+const findElement = (query = queries[0]) => document.evaluate(
+    query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null,
+).singleNodeValue;
+const isDisplayed = (element) => Boolean(
+    element.offsetWidth || element.offsetHeight || element.getClientRects().length
+) && window.getComputedStyle(element).visibility !== "hidden";
+const conditions = {
+    visible: () => {
+        const element = findElement();
+        return Boolean(element) && isDisplayed(element);
+    },
+    all_visible: () => queries.every((query) => {
+        const element = findElement(query);
+        return Boolean(element) && isDisplayed(element);
+    }),
+    invisible: () => {
+        const element = findElement();
+        return !element || !isDisplayed(element);
+    },
+    text: () => {
+        const element = findElement();
+        return Boolean(element) && element.innerText.includes(text);
+    },
+    url_changed: () => window.location.href !== url,
+    gone: () => !findElement(),
+};
+const check = conditions[condition];
+if (check()) {
+    done(true);
+    return;
+}
+let observer = null;
+let interval = null;
+let timer = null;
+const finish = (result) => {
+    observer.disconnect();
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+};
+const onChange = () => {
+    if (check()) {
+        finish(true);
+    }
+};
+observer = new MutationObserver(onChange);
+observer.observe(document, {
+    childList: true, subtree: true, attributes: true, characterData: true,
+});
+interval = setInterval(onChange, 100);
+timer = setTimeout(() => finish(check()), timeout);
+"""
+
+# Check visibility of all elements in one call, `all_visible` condition is
+# polled with it when it can't be waited for inside page
+ALL_VISIBLE_SCRIPT = """
+const [queries] = arguments;
+return queries.every((query) => {
+    const element = document.evaluate(
+        query, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null,
+    ).singleNodeValue;
+    return Boolean(element) && Boolean(
+        element.offsetWidth || element.offsetHeight || element.getClientRects().length
+    ) && window.getComputedStyle(element).visibility !== "hidden";
+});
+"""
+
+
+def wait_in_page(
+    web_view: WebView,
+    condition: WaitCondition,
+    message: str,
+    timeout: float | None = None,
+    locator: locators.Locator | None = None,
+    all_locators: Sequence[locators.Locator] = (),
+    text: str = "",
+    url: str = "",
+) -> bool:
+    """Wait until condition is met using single async script call.
+
+    Condition is checked for element of `locator` or, for `all_visible`
+    condition, for elements of `all_locators`.
+
+    Return `False` if wait can't be performed in page (in-page waits are
+    disabled, timeout is too long, locator isn't XPath or page was unloaded
+    during wait), so caller should fall back to polling.
+
+    Raises:
+        TimeoutException: If condition wasn't met in `timeout` seconds.
+
+    """
+    timeout = web_view.wait_timeout if timeout is None else timeout
+    if not IN_PAGE_WAITS or timeout >= MAX_IN_PAGE_WAIT_TIMEOUT:
+        return False
+    target_locators = [locator] if locator else list(all_locators)
+    if any(target_locator.by != By.XPATH for target_locator in target_locators):
+        return False
+
+    try:
+        is_met = web_view.webdriver.execute_async_script(
+            IN_PAGE_WAIT_SCRIPT,
+            condition,
+            [target_locator.query for target_locator in target_locators],
+            text,
+            url,
+            int(timeout * 1000),
+        )
+    except JavascriptException:
+        # Document was unloaded while waiting, e.g. by navigation
+        return False
+
+    if not is_met:
+        raise TimeoutException(msg=message)
+    return True
+
+
+class InPageWaitsMixin(WebView):
+    """Perform pomcorn waits inside page instead of polling browser from client.
+
+    Each polling check of pomcorn waits is separate WebDriver command (or
+    even several of them), so with small `poll_frequency` a wait sends
+    dozens of commands per second. These waits cost a single command however
+    long they last, see `wait_in_page`.
+
+    """
+
+    def wait_until_locator_visible(
+        self,
+        locator: locators.Locator,
+        timeout: float | None = None,
+    ) -> None:
+        if not wait_in_page(
+            self,
+            condition="visible",
+            message=f"Unable to locate {locator} in {timeout or self.wait_timeout} seconds!",
+            timeout=timeout,
+            locator=locator,
+        ):
+            super().wait_until_locator_visible(locator=locator, timeout=timeout)
+
+    def wait_until_locator_invisible(
+        self,
+        locator: locators.Locator,
+        timeout: float | None = None,
+    ) -> None:
+        if not wait_in_page(
+            self,
+            condition="invisible",
+            message=f"{locator} is still visible in {timeout or self.wait_timeout} seconds!",
+            timeout=timeout,
+            locator=locator,
+        ):
+            super().wait_until_locator_invisible(locator=locator, timeout=timeout)
+
+    def wait_until_text_is_in_element(
+        self,
+        text: str,
+        locator: locators.Locator,
+        timeout: float | None = None,
+    ) -> None:
+        if not wait_in_page(
+            self,
+            condition="text",
+            message=(
+                f"{locator} doesn't have `{text}` after {timeout or self.wait_timeout} seconds!"
+            ),
+            timeout=timeout,
+            locator=locator,
+            text=text,
+        ):
+            super().wait_until_text_is_in_element(text=text, locator=locator, timeout=timeout)
+
+    def wait_until_url_changes(
+        self,
+        url: str | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        url = url or self.current_url
+        if not wait_in_page(
+            self,
+            condition="url_changed",
+            message=f"Url didn't changed from {url} in {timeout or self.wait_timeout} seconds!",
+            timeout=timeout,
+            url=url,
+        ):
+            super().wait_until_url_changes(url=url, timeout=timeout)
+
+    def wait_until_not_exists_in_dom(
+        self,
+        element: XPathElement | locators.XPathLocator,
+        timeout: float | None = None,
+    ) -> None:
+        locator = element if isinstance(element, locators.XPathLocator) else element.locator
+        if not wait_in_page(
+            self,
+            condition="gone",
+            message=(
+                f"{element} is still exists in DOM after {timeout or self.wait_timeout} seconds!"
+            ),
+            timeout=timeout,
+            locator=locator,
+        ):
+            super().wait_until_not_exists_in_dom(element=element, timeout=timeout)
+
+
+def wait_until_all_visible(
+    web_view: WebView,
+    all_locators: Sequence[locators.Locator],
+    timeout: float | None = None,
+) -> None:
+    """Wait until elements of all locators are visible, in single call if possible.
+
+    If wait can't be performed in page, single script which checks all
+    elements is polled instead of separate wait for each element.
+
+    """
+    if not all_locators:
+        return
+    message = (
+        f"Unable to locate all of {list(all_locators)} in "
+        f"{timeout or web_view.wait_timeout} seconds!"
+    )
+    if wait_in_page(
+        web_view,
+        condition="all_visible",
+        message=message,
+        timeout=timeout,
+        all_locators=all_locators,
+    ):
+        return
+    if any(locator.by != By.XPATH for locator in all_locators):
+        for locator in all_locators:
+            web_view.wait_until_locator_visible(locator=locator, timeout=timeout)
+        return
+    queries = [locator.query for locator in all_locators]
+    web_view.get_wait(timeout).until(
+        lambda webdriver: webdriver.execute_script(ALL_VISIBLE_SCRIPT, queries),
+        message=message,
+    )
@@ -0,0 +1,40 @@
+import functools
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from _pytest.fixtures import SubRequest
+
+from .cleanup_queue import schedule_cleanup
+
+CleanupCallable = Callable[..., None]
+
+
+class ApiPlugin:
+    """Provide fixtures for managing test data created via API."""
+
+    @pytest.fixture
+    def api_cleanup(self, request: SubRequest) -> Callable[..., None]:
+        """Get function to remove object created in test.
+
+        If deferred cleanup is enabled, the removal is done in background,
+        otherwise it's done right away:
+
+            api_cleanup(api.delete_post, phuongpv_api_client, created_post.id)
+
+        """
+
+        def _cleanup(cleanup: CleanupCallable, *args, **kwargs) -> None:
+            schedule_cleanup(
+                request=request,
+                callback=functools.partial(cleanup, *args, **kwargs),
+                description=_describe_call(cleanup, *args, **kwargs),
+            )
+
+        return _cleanup
+
+
+def _describe_call(function: Callable[..., Any], *args, **kwargs) -> str:
+    """Prepare human-readable description of function call."""
+    arguments = [*map(repr, args), *(f"{key}={value!r}" for key, value in kwargs.items())]
+    return f"{function.__module__}.{function.__qualname__}({', '.join(arguments)})"
@@ -0,0 +1,168 @@
+import dataclasses
+import json
+import logging
+import os
+import pathlib
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from _pytest.fixtures import FixtureRequest, SubRequest
+
+
+@dataclasses.dataclass(frozen=True)
+class CleanupTask:
+    """Represent a single deferred cleanup action, e.g. removing of object via API."""
+
+    description: str
+    callback: Callable[[], Any]
+
+
+class DeferredCleanupQueue:
+    """Queue which runs cleanup tasks in background thread.
+
+    Tasks are processed one by one in the order they were added, so they are
+    drained while the next test is already running.
+
+    """
+
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self._tasks: queue.Queue[CleanupTask | None] = queue.Queue()
+        self._current_task: CleanupTask | None = None
+        self._failed_tasks: list[tuple[CleanupTask, str]] = []
+        self._thread = threading.Thread(
+            target=self._process_tasks,
+            name="deferred-cleanup",
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        """Start background thread that processes tasks."""
+        self._thread.start()
+
+    def put(self, task: CleanupTask) -> None:
+        """Add task to the queue."""
+        self._tasks.put(task)
+
+    def stop(self, timeout: float) -> list[dict[str, str]]:
+        """Wait until all tasks are processed and return the ones that were left behind.
+
+        Args:
+            timeout: Deadline in seconds for processing of remaining tasks.
+
+        """
+        self._tasks.put(None)
+        self._thread.join(timeout=timeout)
+
+        orphans = [
+            {"description": task.description, "reason": f"Failed: {error}"}
+            for task, error in self._failed_tasks
+        ]
+        if self._current_task:
+            orphans.append(
+                {
+                    "description": self._current_task.description,
+                    "reason": "In progress when deadline was reached",
+                },
+            )
+        while True:
+            try:
+                task = self._tasks.get_nowait()
+            except queue.Empty:
+                break
+            if task:
+                orphans.append(
+                    {"description": task.description, "reason": "Not processed"},
+                )
+        return orphans
+
+    def _process_tasks(self) -> None:
+        """Run tasks until `None` is received."""
+        while task := self._tasks.get():
+            self._current_task = task
+            try:
+                task.callback()
+            except Exception as error:
+                self.LOGGER.error(
+                    msg=f"Deferred cleanup failed: {task.description}",
+                    exc_info=True,
+                )
+                self._failed_tasks.append((task, repr(error)))
+            finally:
+                self._current_task = None
+
+
+class DeferredCleanupPlugin:
+    """Move API cleanup (teardown of API factories, inline deletes) out of tests.
+
+    Each xdist worker has its own plugin instance and therefore its own queue.
+    At the end of session the remaining tasks are processed with a deadline,
+    tasks which weren't processed or failed are written to the orphans
+    manifest.
+
+    """
+
+    name = "deferred_cleanup_plugin"
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self.queue = DeferredCleanupQueue()
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        """Start processing of cleanup tasks."""
+        self.queue.start()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Process remaining tasks and save orphans manifest."""
+        timeout = float(session.config.getoption("--deferred-cleanup-timeout"))
+        started_at = time.monotonic()
+        orphans = self.queue.stop(timeout=timeout)
+        self.LOGGER.info(
+            msg=f"Final drain of cleanup queue took {time.monotonic() - started_at:.2f}s",
+        )
+        if not orphans:
+            return
+
+        manifest_path = self.get_orphans_manifest_path(session.config)
+        manifest_path.write_text(json.dumps(orphans, indent=2))
+        self.LOGGER.warning(
+            msg=f"{len(orphans)} objects weren't removed, see {manifest_path}",
+        )
+
+    def get_orphans_manifest_path(self, config: pytest.Config) -> pathlib.Path:
+        """Get path of orphans manifest for current worker."""
+        worker_id = os.environ.get("PYTEST_XDIST_WORKER", "master")
+        manifest_dir = config.getoption("--orphans-manifest-dir")
+        if manifest_dir:
+            manifest_path = pathlib.Path(manifest_dir)
+            manifest_path.mkdir(parents=True, exist_ok=True)
+        else:
+            manifest_path = config.cache.mkdir("orphans")  # type: ignore
+        return manifest_path / f"{worker_id}.json"
+
+
+def get_cleanup_queue(request: SubRequest | FixtureRequest) -> DeferredCleanupQueue | None:
+    """Get cleanup queue if deferred cleanup is enabled."""
+    plugin = request.config.pluginmanager.get_plugin(DeferredCleanupPlugin.name)
+    if not plugin:
+        return None
+    return plugin.queue
+
+
+def schedule_cleanup(
+    request: SubRequest | FixtureRequest,
+    callback: Callable[[], Any],
+    description: str,
+) -> None:
+    """Put cleanup to background queue or run it right away if deferred cleanup is disabled."""
+    cleanup_queue = get_cleanup_queue(request)
+    if not cleanup_queue:
+        callback()
+        return
+    cleanup_queue.put(CleanupTask(description=description, callback=callback))
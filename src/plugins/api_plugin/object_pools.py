@@ -0,0 +1,160 @@
+import logging
+import queue
+import threading
+from collections.abc import Callable, Hashable
+from concurrent import futures
+from contextlib import suppress
+from typing import Any, Generic, TypeVar
+
+import pytest
+from _pytest.fixtures import FixtureRequest, SubRequest
+
+PooledObject = TypeVar("PooledObject")
+
+
+class ObjectPool(Generic[PooledObject]):
+    """Pool of pre-created objects which are handed out one per checkout.
+
+    Objects are never returned back to the pool, since tests may change them.
+    Instead, after each checkout the pool is topped up in background.
+
+    """
+
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        create: Callable[[], PooledObject],
+        destroy: Callable[[PooledObject], Any],
+        executor: futures.ThreadPoolExecutor,
+    ) -> None:
+        self.name = name
+        self.size = size
+        self._create = create
+        self._destroy = destroy
+        self._executor = executor
+        self._available: queue.Queue[PooledObject] = queue.Queue()
+        self._pending: list[futures.Future[None]] = []
+        self._lock = threading.Lock()
+
+    def fill(self) -> None:
+        """Create missing objects concurrently in background."""
+        with self._lock:
+            self._pending = [future for future in self._pending if not future.done()]
+            missing_count = self.size - self._available.qsize() - len(self._pending)
+            for _ in range(missing_count):
+                self._pending.append(self._executor.submit(self._create_object))
+
+    def checkout(self) -> PooledObject:
+        """Take object from the pool.
+
+        If there is no available object, wait for ones which are being created
+        and only if they failed create object right away.
+
+        """
+        while True:
+            with suppress(queue.Empty):
+                pooled_object = self._available.get_nowait()
+                self.fill()
+                return pooled_object
+
+            with self._lock:
+                pending = [future for future in self._pending if not future.done()]
+            if not pending:
+                break
+            futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+
+        self.LOGGER.warning(msg=f"Pool `{self.name}` is empty, creating object right away")
+        pooled_object = self._create()
+        self.fill()
+        return pooled_object
+
+    def close(self) -> None:
+        """Wait for objects which are being created and destroy all unused objects."""
+        with self._lock:
+            pending = list(self._pending)
+        futures.wait(pending)
+
+        unused_objects = []
+        while True:
+            try:
+                unused_objects.append(self._available.get_nowait())
+            except queue.Empty:
+                break
+
+        for future in futures.as_completed(
+            self._executor.submit(self._destroy, pooled_object) for pooled_object in unused_objects
+        ):
+            if error := future.exception():
+                self.LOGGER.error(
+                    msg=f"Failed to remove object of pool `{self.name}`",
+                    exc_info=error,
+                )
+
+    def _create_object(self) -> None:
+        """Create object and make it available for checkout."""
+        try:
+            self._available.put(self._create())
+        except Exception:
+            self.LOGGER.error(msg=f"Failed to create object for pool `{self.name}`", exc_info=True)
+
+
+class ObjectPoolsPlugin:
+    """Manage pools of objects created via API.
+
+    Pools live in memory of the worker process, so each xdist worker has its
+    own pools and no two tests ever get the same object.
+
+    """
+
+    name = "object_pools_plugin"
+
+    def __init__(self, max_workers: int) -> None:
+        self.executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="api-pool",
+        )
+        self.pools: dict[Hashable, ObjectPool[Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_pool(
+        self,
+        key: Hashable,
+        name: str,
+        size: int,
+        create: Callable[[], PooledObject],
+        destroy: Callable[[PooledObject], Any],
+    ) -> ObjectPool[PooledObject]:
+        """Get pool by key, new pool is filled right away.
+
+        `name` is used in logs only, so it shouldn't include secrets like
+        tokens of API clients.
+
+        """
+        with self._lock:
+            if pool := self.pools.get(key):
+                return pool
+            pool = ObjectPool(
+                name=name,
+                size=size,
+                create=create,
+                destroy=destroy,
+                executor=self.executor,
+            )
+            self.pools[key] = pool
+        pool.fill()
+        return pool
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Remove unused pooled objects in bulk."""
+        for pool in self.pools.values():
+            pool.close()
+        self.executor.shutdown()
+
+
+def get_object_pools(request: SubRequest | FixtureRequest) -> ObjectPoolsPlugin | None:
+    """Get pools manager if object pools are enabled."""
+    return request.config.pluginmanager.get_plugin(ObjectPoolsPlugin.name)
@@ -0,0 +1,87 @@
+import pytest
+
+from .api_plugin import ApiPlugin
+from .cleanup_queue import DeferredCleanupPlugin
+from .object_pools import ObjectPoolsPlugin
+from .sweeper import DEFAULT_MIN_AGE_HOURS, OrphansSweeperPlugin
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Register API plugins."""
+    config.pluginmanager.register(  # cspell:disable-line
+        plugin=ApiPlugin(),
+        name="api_plugin",
+    )
+    if config.getoption("--deferred-cleanup"):
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=DeferredCleanupPlugin(),
+            name=DeferredCleanupPlugin.name,
+        )
+    if config.getoption("--api-pools"):
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=ObjectPoolsPlugin(
+                max_workers=int(config.getoption("--api-pools-workers")),
+            ),
+            name=ObjectPoolsPlugin.name,
+        )
+    if config.getoption("--sweep-orphans") or config.getoption("--sweep-orphans-dry-run"):
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=OrphansSweeperPlugin(),
+            name="orphans_sweeper_plugin",
+        )
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Set up cmd args."""
+    # Deferred cleanup args
+    parser.addoption(
+        "--deferred-cleanup",
+        action="store_true",
+        default=False,
+        help="Remove objects created via API in background thread instead of test teardown",
+    )
+    parser.addoption(
+        "--deferred-cleanup-timeout",
+        action="store",
+        default=60,
+        help="How much to wait for background cleanup at the end of session in seconds",
+    )
+    parser.addoption(
+        "--orphans-manifest-dir",
+        action="store",
+        default=None,
+        help="Folder to save objects which weren't removed (pytest cache folder by default)",
+    )
+    # Object pools args
+    parser.addoption(
+        "--api-pools",
+        action="store_true",
+        default=False,
+        help="Hand out pre-created objects from pools in pooled API factories",
+    )
+    parser.addoption(
+        "--api-pools-workers",
+        action="store",
+        default=4,
+        help="How many objects can be created or removed concurrently for pools",
+    )
+    # Orphans sweeper args
+    parser.addoption(
+        "--sweep-orphans",
+        action="store_true",
+        default=False,
+        help="Remove old posts generated by tests at the end of session",
+    )
+    parser.addoption(
+        "--sweep-orphans-dry-run",
+        action="store_true",
+        default=False,
+        help="Only report old posts generated by tests at the end of session",
+    )
+    parser.addoption(
+        "--sweep-orphans-min-age",
+        action="store",
+        default=DEFAULT_MIN_AGE_HOURS,
+        help="Remove only posts older than this number of hours",
+    )
@@ -0,0 +1,303 @@
+"""Remove posts generated by tests which were left on API.
+
+Can be used as standalone script (run from `src` folder):
+
+    python -m plugins.api_plugin.sweeper --dry-run
+
+Posts with names of old format (before ` e2e-` marker) are only processed
+with `--legacy-names`, list them with `--dry-run` and review the report
+before removing them, since real posts can have such names too.
+
+"""
+
+import argparse
+import dataclasses
+import datetime
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from collections.abc import Iterator
+from concurrent import futures
+from typing import Any
+
+import dotenv
+import pytest
+import slugify
+from phuongpv_blog_api_client import AuthenticatedClient, models
+from phuongpv_blog_api_client.api.posts import posts_list
+
+import api
+from api.auth import get_api_client, get_api_token
+from api.pagination import iterate_list
+from api_factories.utils import is_generated_name, is_legacy_generated_name
+
+DEFAULT_MIN_AGE_HOURS = 24
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_REQUESTS_PER_SECOND = 5.0
+
+
+class RateLimiter:
+    """Limit how often requests can be sent from multiple threads."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self.interval = 1 / requests_per_second
+        self._next_request_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Wait until next request is allowed."""
+        with self._lock:
+            request_at = max(self._next_request_at, time.monotonic())
+            self._next_request_at = request_at + self.interval
+        time.sleep(max(request_at - time.monotonic(), 0))
+
+
+@dataclasses.dataclass
+class SweepResult:
+    """Represent single post processed by sweeper."""
+
+    post_id: int
+    title: str
+    created_at: str | None
+    action: str
+
+
+class OrphansSweeper:
+    """Find and remove posts generated by tests which are older than `min_age`.
+
+    Posts which are referenced by fixtures cache (`--use-cache`) are never
+    removed, since they are reused by next runs. Posts with names of old
+    format are processed only if `legacy_names` is set.
+
+    """
+
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        client: AuthenticatedClient,
+        min_age: datetime.timedelta,
+        referenced_ids: set[int],
+        dry_run: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        legacy_names: bool = False,
+    ) -> None:
+        self.client = client
+        self.min_age = min_age
+        self.referenced_ids = referenced_ids
+        self.dry_run = dry_run
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.legacy_names = legacy_names
+
+    def sweep(self) -> list[SweepResult]:
+        """Find orphans and remove them concurrently unless it's a dry run."""
+        results = list(self.find_candidates())
+        orphans = [result for result in results if result.action == "delete"]
+        if self.dry_run:
+            for orphan in orphans:
+                orphan.action = "delete (dry run)"
+            return results
+
+        with futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for orphan, future in [
+                (orphan, executor.submit(self._delete, orphan.post_id)) for orphan in orphans
+            ]:
+                try:
+                    future.result()
+                except Exception as error:
+                    orphan.action = f"failed: {error!r}"
+                else:
+                    orphan.action = "deleted"
+        return results
+
+    def find_candidates(self) -> Iterator[SweepResult]:
+        """Go through all posts and yield ones with generated names.
+
+        Orphans are marked with `delete` action, other posts contain reason
+        why they are kept.
+
+        """
+        now = datetime.datetime.now(tz=datetime.UTC)
+        for post in self._iter_posts():
+            if not self.is_generated_name(post.title):
+                continue
+
+            created_at = get_post_created_at(post)
+            action = "delete"
+            if post.id in self.referenced_ids:
+                action = "skip: referenced by fixtures cache"
+            elif not created_at:
+                action = "skip: unknown age"
+            elif now - created_at < self.min_age:
+                action = "skip: too new"
+
+            yield SweepResult(
+                post_id=post.id,
+                title=post.title,
+                created_at=created_at.isoformat() if created_at else None,
+                action=action,
+            )
+
+    def is_generated_name(self, name: str) -> bool:
+        """Check if name was generated by tests, including old format if requested."""
+        return is_generated_name(name) or (self.legacy_names and is_legacy_generated_name(name))
+
+    def _iter_posts(self) -> Iterator[models.Post]:
+        """Iterate over all posts with respect to rate limit."""
+
+        def _get_page(**params) -> models.PaginatedPostList | None:
+            self.rate_limiter.wait()
+            return posts_list.sync(client=self.client, **params)
+
+        return iterate_list(_get_page)
+
+    def _delete(self, post_id: int) -> None:
+        """Remove post with respect to rate limit."""
+        self.rate_limiter.wait()
+        api.delete_post(self.client, post_id)
+        self.LOGGER.info(msg=f"Removed orphan post {post_id}")
+
+
+def get_post_created_at(post: models.Post) -> datetime.datetime | None:
+    """Get creation time of post, `None` if API didn't return it for post."""
+    if isinstance(post.created_at, datetime.datetime):
+        return post.created_at
+    return None
+
+
+def get_referenced_ids(cache_dir: pathlib.Path) -> set[int]:
+    """Collect IDs of API objects stored in fixtures cache of current API.
+
+    Fixtures cache is stored by `fixture_cache` in
+    `<cache_dir>/v/<slugified API_URL>/<worker_id>/<fixture_name>`.
+
+    """
+    referenced_ids: set[int] = set()
+    api_cache_dir = cache_dir / "v" / slugify.slugify(os.environ["API_URL"])
+    for cache_file in api_cache_dir.glob("**/*"):
+        if not cache_file.is_file():
+            continue
+        try:
+            cache_data = json.loads(cache_file.read_text())
+        except (ValueError, UnicodeDecodeError):
+            continue
+        if not isinstance(cache_data, dict) or "response_type" not in cache_data:
+            continue
+        data = cache_data["data"]
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and isinstance(item.get("id"), int):
+                referenced_ids.add(item["id"])
+    return referenced_ids
+
+
+def save_report(
+    results: list[SweepResult],
+    report_path: pathlib.Path,
+    dry_run: bool,
+    min_age: datetime.timedelta,
+) -> None:
+    """Save report about processed posts as json."""
+    report: dict[str, Any] = {
+        "dry_run": dry_run,
+        "min_age_hours": min_age.total_seconds() / 3600,
+        "posts": [dataclasses.asdict(result) for result in results],
+    }
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2))
+
+
+def run_sweeper(
+    client: AuthenticatedClient | None,
+    cache_dir: pathlib.Path,
+    report_path: pathlib.Path,
+    dry_run: bool,
+    min_age_hours: float,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+    legacy_names: bool = False,
+) -> list[SweepResult]:
+    """Run sweeper and save report, client is prepared from env if not passed."""
+    min_age = datetime.timedelta(hours=min_age_hours)
+    sweeper = OrphansSweeper(
+        client=client or get_api_client(get_api_token()),
+        min_age=min_age,
+        referenced_ids=get_referenced_ids(cache_dir),
+        dry_run=dry_run,
+        max_workers=max_workers,
+        requests_per_second=requests_per_second,
+        legacy_names=legacy_names,
+    )
+    results = sweeper.sweep()
+    save_report(results, report_path=report_path, dry_run=dry_run, min_age=min_age)
+    OrphansSweeper.LOGGER.info(
+        msg=f"Processed {len(results)} generated posts, see report in {report_path}",
+    )
+    return results
+
+
+class OrphansSweeperPlugin:
+    """Run orphans sweeper at the end of test session."""
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Run sweeper once, on xdist controller or in non-distributed run."""
+        config = session.config
+        if hasattr(config, "workerinput"):  # cspell:disable-line
+            return
+        run_sweeper(
+            client=None,
+            cache_dir=config.cache._cachedir,  # type: ignore # cspell:disable-line
+            report_path=config.cache.mkdir("sweeper") / "report.json",  # type: ignore
+            dry_run=config.getoption("--sweep-orphans-dry-run"),
+            min_age_hours=float(config.getoption("--sweep-orphans-min-age")),
+        )
+
+
+def main() -> None:
+    """Run sweeper from command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dry-run", action="store_true", help="Only prepare report")
+    parser.add_argument(
+        "--min-age",
+        type=float,
+        default=DEFAULT_MIN_AGE_HOURS,
+        help="Remove only posts older than this number of hours",
+    )
+    parser.add_argument(
+        "--legacy-names",
+        action="store_true",
+        help="Also process posts with names of old format, review them with `--dry-run` first",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+    parser.add_argument("--rps", type=float, default=DEFAULT_REQUESTS_PER_SECOND)
+    parser.add_argument(
+        "--cache-dir",
+        type=pathlib.Path,
+        default=pathlib.Path("../.pytest_cache"),
+        help="Pytest cache folder to find objects referenced by fixtures cache",
+    )
+    parser.add_argument("--report", type=pathlib.Path, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # Load `.env` file the same way as `pytest-dotenv` does for tests
+    dotenv.load_dotenv()
+    run_sweeper(
+        client=None,
+        cache_dir=args.cache_dir,
+        report_path=args.report or args.cache_dir / "d" / "sweeper" / "report.json",
+        dry_run=args.dry_run,
+        min_age_hours=args.min_age,
+        max_workers=args.workers,
+        requests_per_second=args.rps,
+        legacy_names=args.legacy_names,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import logging
+import pathlib
+import subprocess
+import sys
+import types
+from collections.abc import Iterable
+from typing import Any
+
+import pytest
+from _pytest.fixtures import FixtureDef, SubRequest
+
+# Free tool id of `sys.monitoring`, ids 0-2 and 5 are used by debuggers,
+# coverage, profilers and optimizers
+MONITORING_TOOL_ID = 3
+
+# Changes of these files can affect any test, so all tests are run
+GLOBAL_DEPENDENCIES_PATTERNS = (
+    "**/conftest.py",
+    "src/plugins/**",
+    "pyproject.toml",
+    "poetry.lock",
+)
+
+IMPACT_MAP_CACHE_KEY = "impact/map"
+
+
+def is_project_file(path: str, root: str) -> bool:
+    """Check if file belongs to project, not to virtual environment inside of it."""
+    return path.startswith(root) and "site-packages" not in path
+
+
+class DependenciesTracer:
+    """Collect files of project which code was executed.
+
+    `sys.monitoring` event is disabled for code outside of project after its
+    first start, so tracing of libraries costs almost nothing. Project code
+    is reported on each start: disabled events can be enabled again only by
+    `sys.monitoring.restart_events`, which enables them for all tools, e.g.
+    for coverage too.
+
+    """
+
+    def __init__(self, root: pathlib.Path) -> None:
+        self.root = str(root)
+        self.files: set[str] = set()
+
+    def start(self) -> None:
+        sys.monitoring.use_tool_id(MONITORING_TOOL_ID, "impact-analysis")
+        sys.monitoring.register_callback(
+            MONITORING_TOOL_ID,
+            sys.monitoring.events.PY_START,
+            self._on_start,
+        )
+        sys.monitoring.set_events(MONITORING_TOOL_ID, sys.monitoring.events.PY_START)
+
+    def stop(self) -> None:
+        sys.monitoring.set_events(MONITORING_TOOL_ID, sys.monitoring.events.NO_EVENTS)
+        sys.monitoring.free_tool_id(MONITORING_TOOL_ID)
+
+    def collect(self) -> set[str]:
+        """Start new collection and return files collected by previous one."""
+        files, self.files = self.files, set()
+        return files
+
+    def _on_start(self, code: types.CodeType, instruction_offset: int) -> Any:
+        if not is_project_file(code.co_filename, self.root):
+            return sys.monitoring.DISABLE
+        self.files.add(code.co_filename)
+        return None
+
+
+class ImportsGraph:
+    """Collect files of project modules which module imports, directly or not.
+
+    Code of module runs only on the first import, so tracer doesn't see
+    modules imported by other tests or during collection. Imports are found
+    by globals of module instead: imported modules and modules where
+    imported classes, functions and constants are declared.
+
+    """
+
+    def __init__(self, root: pathlib.Path) -> None:
+        self.root = str(root)
+        self._dependencies: dict[str, set[str]] = {}
+
+    def get_dependencies(self, module_name: str) -> set[str]:
+        if module_name not in self._dependencies:
+            self._dependencies[module_name] = self._collect(module_name)
+        return self._dependencies[module_name]
+
+    def _collect(self, module_name: str) -> set[str]:
+        files: set[str] = set()
+        visited = {module_name}
+        modules = [module_name]
+        while modules:
+            module = sys.modules.get(modules.pop())
+            for value in list(vars(module).values()) if module else ():
+                name = (
+                    value.__name__
+                    if isinstance(value, types.ModuleType)
+                    else getattr(value, "__module__", None)
+                )
+                if not isinstance(name, str) or name in visited:
+                    continue
+                visited.add(name)
+                path = getattr(sys.modules.get(name), "__file__", None)
+                if path and is_project_file(path, self.root):
+                    files.add(path)
+                    modules.append(name)
+        return files
+
+
+class ImpactAnalysisPlugin:
+    """Record dependencies of tests and select tests affected by changes.
+
+    Dependencies of test are files of project which were executed during
+    test and during setup of fixtures which test uses (including cached
+    higher-scoped fixtures), plus files where these fixtures and test are
+    declared and project modules which these files import. Map of
+    dependencies is stored in pytest cache.
+
+    With `affected_since` only tests which dependencies were changed since
+    this git ref are run. All tests are run if there is no map yet or if
+    global dependencies (conftest, plugins, project config) were changed.
+
+    """
+
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(self, config: pytest.Config, affected_since: str | None) -> None:
+        self.config = config
+        self.affected_since = affected_since
+        self.root = config.rootpath
+        self.tracer = DependenciesTracer(self.root)
+        self.imports = ImportsGraph(self.root)
+        self.impact_map: dict[str, list[str]] = {}
+        self.fixtures_dependencies: dict[str, set[str]] = {}
+
+    def pytest_sessionstart(self, session: pytest.Session) -> None:
+        self.tracer.start()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(
+        self,
+        config: pytest.Config,
+        items: list[pytest.Item],
+    ) -> None:
+        """Deselect tests which aren't affected by changes since `affected_since`."""
+        if not self.affected_since:
+            return
+        stored_map: dict[str, list[str]] | None = config.cache.get(  # type: ignore
+            IMPACT_MAP_CACHE_KEY,
+            None,
+        )
+        if not stored_map:
+            self.LOGGER.warning("Impact map isn't recorded yet, all tests are run")
+            return
+
+        changed_files = self.get_changed_files(self.affected_since)
+        if global_changes := [
+            path
+            for path in changed_files
+            if any(path.full_match(pattern) for pattern in GLOBAL_DEPENDENCIES_PATTERNS)
+        ]:
+            self.LOGGER.warning(f"Global dependencies changed: {global_changes}, all tests are run")
+            return
+
+        changed_paths = {str(path) for path in changed_files}
+        selected, deselected = [], []
+        for item in items:
+            dependencies = stored_map.get(item.nodeid)
+            # New tests don't have recorded dependencies, so they are run too
+            if dependencies is None or changed_paths.intersection(dependencies):
+                selected.append(item)
+            else:
+                deselected.append(item)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef: FixtureDef[Any], request: SubRequest) -> Any:
+        """Record files executed during fixture setup."""
+        outer_files = self.tracer.collect()
+        yield
+        fixture_files = self.tracer.collect()
+        fixture_files.add(fixturedef.func.__code__.co_filename)
+        fixture_files.update(self.imports.get_dependencies(fixturedef.func.__module__))
+        self.fixtures_dependencies.setdefault(fixturedef.argname, set()).update(fixture_files)
+        self.tracer.files = outer_files | fixture_files
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item) -> Any:
+        """Record files executed by test and by fixtures which it uses."""
+        self.tracer.collect()
+        yield
+        test_files = self.tracer.collect()
+        test_files.add(str(item.path))
+        if module := getattr(item, "module", None):
+            test_files.update(self.imports.get_dependencies(module.__name__))
+        for fixture_name in getattr(item, "fixturenames", ()):  # cspell:disable-line
+            test_files.update(self.fixtures_dependencies.get(fixture_name, ()))
+        self.impact_map[item.nodeid] = sorted(map(str, self.to_relative_paths(test_files)))
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Save map in cache or send it to controller from xdist worker."""
+        self.tracer.stop()
+        workeroutput = getattr(session.config, "workeroutput", None)  # cspell:disable-line
+        if workeroutput is not None:
+            workeroutput["impact_map"] = self.impact_map
+            return
+        self.save_impact_map()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: Any, error: Any) -> None:
+        """Merge map of finished worker."""
+        worker_map = getattr(node, "workeroutput", {}).get("impact_map")  # cspell:disable-line
+        if worker_map:
+            self.impact_map.update(worker_map)
+
+    def save_impact_map(self) -> None:
+        """Update stored map with dependencies of tests from this run."""
+        stored_map = self.config.cache.get(IMPACT_MAP_CACHE_KEY, {})  # type: ignore
+        stored_map.update(self.impact_map)
+        self.config.cache.set(IMPACT_MAP_CACHE_KEY, stored_map)  # type: ignore
+
+    def get_changed_files(self, git_ref: str) -> list[pathlib.Path]:
+        """Get files changed since git ref, including uncommitted and untracked ones."""
+        changed_files = self._run_git("diff", "--name-only", git_ref)
+        changed_files += self._run_git("ls-files", "--others", "--exclude-standard", "--full-name")
+        git_root = pathlib.Path(self._run_git("rev-parse", "--show-toplevel")[0])
+        return sorted(self.to_relative_paths(git_root / path for path in changed_files))
+
+    def to_relative_paths(self, paths: Iterable[str | pathlib.Path]) -> set[pathlib.Path]:
+        """Convert paths to ones relative to root of project."""
+        return {
+            pathlib.Path(path).resolve().relative_to(self.root)
+            for path in paths
+            if pathlib.Path(path).resolve().is_relative_to(self.root)
+        }
+
+    def _run_git(self, *args: str) -> list[str]:
+        result = subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=self.root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.splitlines()
@@ -0,0 +1,31 @@
+import pytest
+
+from .impact_analysis import ImpactAnalysisPlugin
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Register impact analysis plugin."""
+    affected_since = config.getoption("--affected-since")
+    if affected_since or config.getoption("--record-impact"):
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=ImpactAnalysisPlugin(config=config, affected_since=affected_since),
+            name="impact_analysis_plugin",
+        )
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Set up cmd args."""
+    parser.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help="Record which project files each test depends on",
+    )
+    parser.addoption(
+        "--affected-since",
+        action="store",
+        default=None,
+        metavar="GIT_REF",
+        help="Run only tests which dependencies were changed since git ref",
+    )
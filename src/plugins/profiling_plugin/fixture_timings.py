@@ -0,0 +1,111 @@
+import pathlib
+import time
+from collections import defaultdict
+from typing import Any
+
+import pytest
+from _pytest.fixtures import FixtureDef, SubRequest
+from _pytest.terminal import TerminalReporter
+
+from plugins.summary import StatsSummaryPlugin
+
+
+def get_fixture_stack(request: SubRequest) -> list[str]:
+    """Get chain of fixtures from the one requested by test to the current one."""
+    stack: list[str] = []
+    current: Any = request
+    while isinstance(current, SubRequest):
+        stack.append(current._fixturedef.argname)
+        current = current._parent_request
+    return stack[::-1]
+
+
+class FixtureTimingsPlugin(StatsSummaryPlugin):
+    """Measure setup and teardown time of each fixture.
+
+    Time is recorded by stacks of fixtures, e.g. `setup;superuser_webdriver;webdriver_getter`,
+    where each fixture is nested into fixture which requested it. Each stack
+    contains only self time of its last fixture, i.e. without time of fixtures
+    which it requested, so stacks can be summed like in flamegraph.
+
+    At the end of session stacks are saved in collapsed format which can be
+    read by flamegraph tools (e.g. `flamegraph.pl` or speedscope) and the
+    slowest fixtures are printed in terminal summary.
+
+    """
+
+    def __init__(self, output_path: pathlib.Path, top: int) -> None:
+        super().__init__(name="fixture_timings", title="Slowest fixtures", top=top)
+        self.output_path = output_path
+        # Time of fixtures which were set up inside setup of current fixture,
+        # e.g. by `request.getfixturevalue`
+        self._nested_durations: list[float] = []
+        self._teardown_started_at: dict[int, float] = {}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef: FixtureDef[Any], request: SubRequest) -> Any:
+        """Measure self time of fixture setup."""
+        self._nested_durations.append(0.0)
+        started_at = time.perf_counter()
+        yield
+        duration = time.perf_counter() - started_at
+        nested_duration = self._nested_durations.pop()
+        if self._nested_durations:
+            self._nested_durations[-1] += duration
+
+        stack = ";".join(["setup", *get_fixture_stack(request)])
+        self.timings.setdefault(stack, []).append(duration - nested_duration)
+        # Finalizers are run in reversed order, so this one is run right
+        # before teardown code of fixture
+        fixturedef.addfinalizer(
+            lambda: self._teardown_started_at.__setitem__(id(fixturedef), time.perf_counter()),
+        )
+
+    def pytest_fixture_post_finalizer(
+        self,
+        fixturedef: FixtureDef[Any],
+        request: SubRequest,
+    ) -> None:
+        """Measure time of fixture teardown."""
+        started_at = self._teardown_started_at.pop(id(fixturedef), None)
+        if started_at is None:
+            return
+        stack = ";".join(["teardown", *get_fixture_stack(request)])
+        self.timings.setdefault(stack, []).append(time.perf_counter() - started_at)
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """Save collapsed stacks and print the slowest fixtures."""
+        if hasattr(terminalreporter.config, "workerinput"):  # cspell:disable-line
+            return
+        if not self.timings:
+            return
+
+        self.save_collapsed_stacks()
+
+        fixtures_timings: defaultdict[str, list[float]] = defaultdict(list)
+        for stack, timings in self.timings.items():
+            phase, *fixtures = stack.split(";")
+            fixtures_timings[f"{fixtures[-1]} ({phase})"].extend(timings)
+
+        terminalreporter.write_sep("-", self.title)
+        slowest_fixtures = sorted(
+            fixtures_timings.items(),
+            key=lambda item: sum(item[1]),
+            reverse=True,
+        )[: self.top]
+        for fixture, timings in slowest_fixtures:
+            terminalreporter.write_line(
+                f"{sum(timings):>8.2f}s {len(timings):>5}x "
+                f"mean={sum(timings) / len(timings):.3f}s {fixture}",
+            )
+        terminalreporter.write_line(f"Flamegraph stacks are saved to {self.output_path}")
+
+    def save_collapsed_stacks(self) -> None:
+        """Save total time of each stack in microseconds in collapsed format."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self.output_path.write_text(
+            "".join(
+                f"{stack} {round(sum(timings) * 1_000_000)}\n"
+                for stack, timings in sorted(self.timings.items())
+            ),
+        )
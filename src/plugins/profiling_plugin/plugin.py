@@ -0,0 +1,89 @@
+import pathlib
+
+import pytest
+
+from .fixture_timings import FixtureTimingsPlugin
+from .profiler import DEFAULT_SAMPLING_INTERVAL, ProfilerPlugin
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Register profiling plugins."""
+    if config.getoption("--fixture-timings"):
+        output_path = config.getoption("--fixture-timings-output") or (
+            config.cache.mkdir("fixture_timings") / "fixtures.folded"  # type: ignore
+        )
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=FixtureTimingsPlugin(
+                output_path=pathlib.Path(output_path),
+                top=config.getoption("--fixture-timings-top"),
+            ),
+            name="fixture_timings_plugin",
+        )
+    if config.getoption("--profile-tests"):
+        src_only = config.getoption("--profile-tests-src-only")
+        output_dir = config.getoption("--profile-tests-output") or (
+            config.cache.mkdir("tests_profile")  # type: ignore
+        )
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=ProfilerPlugin(
+                output_dir=pathlib.Path(output_dir),
+                interval=config.getoption("--profile-tests-interval"),
+                filter_path=config.rootpath / "src" if src_only else None,
+            ),
+            name="profiler_plugin",
+        )
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Set up cmd args."""
+    parser.addoption(
+        "--fixture-timings",
+        action="store_true",
+        default=False,
+        help="Measure setup and teardown time of fixtures",
+    )
+    parser.addoption(
+        "--fixture-timings-output",
+        action="store",
+        default=None,
+        help=(
+            "Path to save fixtures stacks in collapsed format for flamegraph, "
+            "by default they are saved in pytest cache folder"
+        ),
+    )
+    parser.addoption(
+        "--fixture-timings-top",
+        action="store",
+        type=int,
+        default=10,
+        help="Number of the slowest fixtures to show in summary",
+    )
+    parser.addoption(
+        "--profile-tests",
+        action="store_true",
+        default=False,
+        help="Profile calls of tests with sampling profiler",
+    )
+    parser.addoption(
+        "--profile-tests-output",
+        action="store",
+        default=None,
+        help=(
+            "Folder to save profile in pstats and speedscope formats, "
+            "by default it's saved in pytest cache folder"
+        ),
+    )
+    parser.addoption(
+        "--profile-tests-interval",
+        action="store",
+        type=float,
+        default=DEFAULT_SAMPLING_INTERVAL,
+        help="Interval between samples of stack in seconds",
+    )
+    parser.addoption(
+        "--profile-tests-src-only",
+        action="store_true",
+        default=False,
+        help="Leave in profile only frames from files of `src` folder",
+    )
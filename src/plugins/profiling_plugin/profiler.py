@@ -0,0 +1,220 @@
+import json
+import marshal
+import os
+import pathlib
+import sys
+import threading
+import time
+from typing import Any, TypeAlias
+
+import pytest
+from _pytest.terminal import TerminalReporter
+
+# Frame of stack: file, first line of function and its name, the same as
+# function key of `pstats`
+Frame: TypeAlias = tuple[str, int, str]
+Stack: TypeAlias = tuple[Frame, ...]
+
+DEFAULT_SAMPLING_INTERVAL = 0.005
+
+
+class StackSampler:
+    """Sample stack of thread which started sampling.
+
+    Unlike deterministic profilers, sampling doesn't slow down each function
+    call, so overhead doesn't depend on how much code is executed. Each
+    sample is weighted by time passed since previous one.
+
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLING_INTERVAL) -> None:
+        self.interval = interval
+        self.samples: dict[Stack, float] = {}
+        self._thread_id = 0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _sample(self) -> None:
+        sampled_at = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack_key = tuple(reversed(stack))
+                self.samples[stack_key] = self.samples.get(stack_key, 0.0) + now - sampled_at
+            sampled_at = now
+
+
+def filter_stacks(samples: dict[Stack, float], path: pathlib.Path) -> dict[Stack, float]:
+    """Leave only frames from files in path.
+
+    Time of omitted frames is attributed to the closest frame from path
+    which called them.
+
+    """
+    prefix = f"{path}{os.sep}"
+    filtered_samples: dict[Stack, float] = {}
+    for stack, seconds in samples.items():
+        filtered_stack = tuple(frame for frame in stack if frame[0].startswith(prefix))
+        if filtered_stack:
+            filtered_samples[filtered_stack] = filtered_samples.get(filtered_stack, 0.0) + seconds
+    return filtered_samples
+
+
+def to_pstats(samples: dict[Stack, float]) -> dict[Frame, Any]:
+    """Convert samples to stats of `pstats` format.
+
+    Numbers of calls are numbers of samples where function is present.
+
+    """
+    # Frame -> [primitive calls, calls, self time, cumulative time, callers]
+    stats: dict[Frame, list[Any]] = {}
+    for stack, seconds in samples.items():
+        seen_frames = set()
+        for index, frame in enumerate(stack):
+            is_leaf = index == len(stack) - 1
+            is_first_in_stack = frame not in seen_frames
+            seen_frames.add(frame)
+
+            frame_stats = stats.setdefault(frame, [0, 0, 0.0, 0.0, {}])
+            frame_stats[0] += int(is_first_in_stack)
+            frame_stats[1] += 1
+            frame_stats[2] += seconds if is_leaf else 0.0
+            frame_stats[3] += seconds if is_first_in_stack else 0.0
+            if index:
+                caller_stats = frame_stats[4].get(stack[index - 1], (0, 0, 0.0, 0.0))
+                frame_stats[4][stack[index - 1]] = (
+                    caller_stats[0] + int(is_first_in_stack),
+                    caller_stats[1] + 1,
+                    caller_stats[2] + (seconds if is_leaf else 0.0),
+                    caller_stats[3] + (seconds if is_first_in_stack else 0.0),
+                )
+    return {frame: tuple(frame_stats) for frame, frame_stats in stats.items()}
+
+
+def to_speedscope(samples: dict[Stack, float], name: str) -> dict[str, Any]:
+    """Convert samples to sampled profile of speedscope format."""
+    frames_indexes: dict[Frame, int] = {}
+    for stack in samples:
+        for frame in stack:
+            frames_indexes.setdefault(frame, len(frames_indexes))
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "shared": {
+            "frames": [
+                {"name": function_name, "file": file, "line": line}
+                for file, line, function_name in frames_indexes
+            ],
+        },
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(samples.values()),
+                "samples": [[frames_indexes[frame] for frame in stack] for stack in samples],
+                "weights": list(samples.values()),
+            },
+        ],
+    }
+
+
+class ProfilerPlugin:
+    """Profile calls of tests with sampling profiler.
+
+    Only calls of tests are profiled, setup and teardown of fixtures are
+    not. In xdist run samples of each worker are sent to controller in
+    `workeroutput` and merged there.
+
+    At the end of session profile is saved in `pstats` format (can be viewed
+    by `python -m pstats` or snakeviz) and in speedscope format, and the
+    functions with the biggest self time are printed in terminal summary.
+
+    """
+
+    def __init__(
+        self,
+        output_dir: pathlib.Path,
+        interval: float,
+        filter_path: pathlib.Path | None = None,
+        top: int = 10,
+    ) -> None:
+        self.output_dir = output_dir
+        self.filter_path = filter_path
+        self.top = top
+        self.sampler = StackSampler(interval=interval)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item: pytest.Item) -> Any:
+        """Sample stacks during test call."""
+        self.sampler.start()
+        yield
+        self.sampler.stop()
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Send samples of worker to controller."""
+        workeroutput = getattr(session.config, "workeroutput", None)  # cspell:disable-line
+        if workeroutput is None:
+            return
+        workeroutput["tests_profile"] = [
+            [[list(frame) for frame in stack], seconds]
+            for stack, seconds in self.sampler.samples.items()
+        ]
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: Any, error: Any) -> None:
+        """Merge samples of finished worker."""
+        workeroutput = getattr(node, "workeroutput", {})  # cspell:disable-line
+        worker_samples = workeroutput.get("tests_profile")  # cspell:disable-line
+        for stack, seconds in worker_samples or ():
+            stack_key = tuple((file, line, name) for file, line, name in stack)
+            self.sampler.samples[stack_key] = self.sampler.samples.get(stack_key, 0.0) + seconds
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """Save profile and print functions with the biggest self time."""
+        if hasattr(terminalreporter.config, "workerinput"):  # cspell:disable-line
+            return
+        samples = self.sampler.samples
+        if self.filter_path:
+            samples = filter_stacks(samples, self.filter_path)
+        if not samples:
+            return
+
+        stats = to_pstats(samples)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        pstats_path = self.output_dir / "tests.pstats"
+        pstats_path.write_bytes(marshal.dumps(stats))
+        speedscope_path = self.output_dir / "tests.speedscope.json"
+        speedscope_path.write_text(json.dumps(to_speedscope(samples, name="tests")))
+
+        terminalreporter.write_sep("-", "Profile of tests")
+        slowest_functions = sorted(
+            stats.items(),
+            key=lambda item: item[1][2],
+            reverse=True,
+        )[: self.top]
+        for (file, line, function_name), frame_stats in slowest_functions:
+            terminalreporter.write_line(
+                f"{frame_stats[2]:>8.2f}s self {frame_stats[3]:>8.2f}s cumulative "
+                f"{function_name} ({file}:{line})",
+            )
+        terminalreporter.write_line(f"Profile is saved to {pstats_path} and {speedscope_path}")
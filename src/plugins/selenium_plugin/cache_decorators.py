@@ -16,6 +16,11 @@ def get_cache_name(request: SubRequest | FixtureRequest, name: str) -> str:
     return f"{slugify.slugify(os.environ['API_URL'])}/{request.getfixturevalue('worker_id')}/{name}"
 
 
+def get_shared_cache_name(name: str) -> str:
+    """Return a string that represents location of cache shared between workers and runs."""
+    return f"{slugify.slugify(os.environ['API_URL'])}/shared/{name}"
+
+
 def get_fixture_cache_name(request: SubRequest | FixtureRequest, fixture: Any) -> str:
     """Shortcut for generating cache name for fixture."""
     fixture_name = f"{fixture.__module__}.{fixture.__name__}"
@@ -0,0 +1,313 @@
+import contextlib
+import copy
+import dataclasses
+import re
+import socket
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any
+
+import urllib3
+from _pytest.terminal import TerminalReporter
+from selenium.webdriver.common.options import BaseOptions
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import get_remote_connection
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from plugins.summary import StatsSummaryPlugin
+
+# Requests and new connections of each remote session, keys are
+# `<session_id> requests` and `<session_id> new connections`
+CONNECTION_COUNTER: Counter[str] = Counter()
+# Time of each command spent on HTTP (connection, sending request and
+# reading response) and on waiting for response of browser
+CONNECTION_TIMINGS: defaultdict[str, list[float]] = defaultdict(list)
+
+# Keep idle connections to hub from being dropped by firewalls and NAT
+KEEP_ALIVE_SOCKET_OPTIONS = [
+    *HTTPConnection.default_socket_options,
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+_SESSION_PATH_PATTERN = re.compile(r"/session/(?P<session_id>[^/]+)(?P<path>/.*)?$")
+# Segments of command path which are followed by id (of element, shadow root,
+# window or name of cookie) in W3C path templates, e.g. `/element/{id}/click`.
+# Ids are recognized by position, since their format depends on driver (e.g.
+# Chrome element id is `f.<HEX>.d.<HEX>.e.N`).
+_ID_PARENT_SEGMENTS = frozenset(("element", "shadow", "window", "cookie"))
+# Commands which have the same position as id, e.g. `/element/active`
+_ID_PARENT_COMMANDS = frozenset(
+    ("active", "handles", "rect", "maximize", "minimize", "fullscreen", "new"),
+)
+
+
+@dataclasses.dataclass
+class RequestState:
+    """Represent state and timings of single request which are tracked by connection."""
+
+    new_connection: bool = False
+    # Time from sent request to received headers of response
+    wait: float = 0.0
+    # Connection which waits for response
+    connection: HTTPConnection | None = None
+    aborted: bool = False
+
+
+# Requests which are being sent, grouped by id of thread which sends them
+_CURRENT_REQUESTS: dict[int, RequestState] = {}
+
+
+class TrackedHTTPConnection(HTTPConnection):
+    """Connection which reports new connections and wait for response to current request."""
+
+    def connect(self) -> None:
+        super().connect()
+        if state := _CURRENT_REQUESTS.get(threading.get_ident()):
+            state.new_connection = True
+
+    def request(self, *args, **kwargs) -> None:
+        # Retries of aborted request fail at once instead of waiting again
+        if (state := _CURRENT_REQUESTS.get(threading.get_ident())) and state.aborted:
+            raise ConnectionAbortedError("Request was aborted")
+        super().request(*args, **kwargs)
+
+    def getresponse(self, *args, **kwargs) -> Any:
+        state = _CURRENT_REQUESTS.get(threading.get_ident())
+        if state:
+            state.connection = self
+        started_at = time.perf_counter()
+        try:
+            return super().getresponse(*args, **kwargs)
+        finally:
+            if state:
+                state.connection = None
+                state.wait += time.perf_counter() - started_at
+
+
+def abort_request(thread_id: int) -> bool:
+    """Break request which is being sent by thread, so it fails at once."""
+    state = _CURRENT_REQUESTS.get(thread_id)
+    if not state:
+        return False
+    state.aborted = True
+    connection = state.connection
+    if connection and connection.sock:
+        with contextlib.suppress(OSError):
+            connection.sock.shutdown(socket.SHUT_RDWR)
+    return True
+
+
+class TrackedHTTPSConnection(TrackedHTTPConnection, HTTPSConnection):
+    """HTTPS version of `TrackedHTTPConnection`."""
+
+
+class TrackedHTTPConnectionPool(HTTPConnectionPool):
+    """Pool of `TrackedHTTPConnection`."""
+
+    ConnectionCls = TrackedHTTPConnection
+
+
+class TrackedHTTPSConnectionPool(HTTPSConnectionPool):
+    """Pool of `TrackedHTTPSConnection`."""
+
+    ConnectionCls = TrackedHTTPSConnection
+
+
+@dataclasses.dataclass(frozen=True)
+class ConnectionSettings:
+    """Represent tuning of connections to remote hubs."""
+
+    # How many connections to each hub are kept open for reuse
+    pool_size: int = 2
+    connect_timeout: float = 10.0
+    read_timeout: float = 300.0
+    # Ask hub to compress responses, e.g. page sources and screenshots
+    compression: bool = False
+
+
+class SharedPoolManager(urllib3.PoolManager):
+    """Pool of keep-alive connections to hubs which is shared by all sessions of worker.
+
+    Selenium clears pool of connection when session quits, so sessions
+    created one by one for each test open new connections every time. This
+    pool outlives sessions and is closed only at the end of pytest session.
+
+    Each request is measured: its time is split into waiting for response
+    (time spent in browser and on network round trip) and the rest, which is
+    HTTP overhead (new connection, sending request and reading response).
+
+    """
+
+    def __init__(self, settings: ConnectionSettings) -> None:
+        super().__init__(
+            num_pools=max(settings.pool_size, 10),
+            maxsize=settings.pool_size,
+            # Extra connections are closed after use instead of blocking commands
+            block=False,
+            socket_options=KEEP_ALIVE_SOCKET_OPTIONS,
+            timeout=urllib3.Timeout(
+                connect=settings.connect_timeout,
+                read=settings.read_timeout,
+            ),
+        )
+        self.pool_classes_by_scheme = {
+            "http": TrackedHTTPConnectionPool,
+            "https": TrackedHTTPSConnectionPool,
+        }
+
+    def urlopen(self, method: str, url: str, *args, **kwargs) -> Any:  # type: ignore[override]
+        thread_id = threading.get_ident()
+        # Redirects are tracked as part of original request
+        if thread_id in _CURRENT_REQUESTS:
+            return super().urlopen(method, url, *args, **kwargs)
+        state = _CURRENT_REQUESTS[thread_id] = RequestState()
+        started_at = time.perf_counter()
+        try:
+            return super().urlopen(method, url, *args, **kwargs)
+        finally:
+            del _CURRENT_REQUESTS[thread_id]
+            record_request(method, url, state, duration=time.perf_counter() - started_at)
+
+    def clear(self) -> None:
+        """Keep connections when session quits, use `close` to close them."""
+
+    def close(self) -> None:
+        super().clear()
+
+
+def record_request(method: str, url: str, state: RequestState, duration: float) -> None:
+    """Save stats of request to remote hub."""
+    match = _SESSION_PATH_PATTERN.search(urllib3.util.parse_url(url).path or "")
+    if match:
+        session_id = match["session_id"]
+        command = f"{method} {normalize_command_path(match['path'] or '/')}"
+    else:
+        # New Session and requests which don't belong to session, e.g. status
+        session_id = "new session" if method == "POST" and url.endswith("/session") else "other"
+        command = f"{method} {urllib3.util.parse_url(url).path}"
+    CONNECTION_COUNTER[f"{session_id} requests"] += 1
+    if state.new_connection:
+        CONNECTION_COUNTER[f"{session_id} new connections"] += 1
+    CONNECTION_TIMINGS[f"{command} http overhead"].append(duration - state.wait)
+    CONNECTION_TIMINGS[f"{command} browser"].append(state.wait)
+
+
+def normalize_command_path(path: str) -> str:
+    """Replace ids in path of session command with `{id}`, so commands can be grouped."""
+    segments = path.split("/")
+    for index in range(1, len(segments)):
+        if (
+            segments[index - 1] in _ID_PARENT_SEGMENTS
+            and segments[index]
+            and segments[index] not in _ID_PARENT_COMMANDS
+        ):
+            segments[index] = "{id}"
+    return "/".join(segments)
+
+
+class RemoteConnections:
+    """Create connections to remote hubs which share pool of worker.
+
+    Selenium picks connection class by browser (e.g. Chrome connection
+    supports CDP commands), so connections are built by selenium and only
+    their pool is replaced. Connection doesn't hold state of session, so
+    single connection is used for all sessions on the hub.
+
+    """
+
+    def __init__(self, settings: ConnectionSettings) -> None:
+        self.settings = settings
+        self.pool = SharedPoolManager(settings)
+        self._connections: dict[str, RemoteConnection] = {}
+        self._lock = threading.Lock()
+
+    def get(self, hub_url: str, options: BaseOptions) -> RemoteConnection:
+        with self._lock:
+            if hub_url not in self._connections:
+                self._connections[hub_url] = self._build(hub_url, options)
+            return self._connections[hub_url]
+
+    def _build(self, hub_url: str, options: BaseOptions) -> RemoteConnection:
+        client_config = ClientConfig(
+            remote_server_addr=hub_url,
+            keep_alive=True,
+            timeout=urllib3.Timeout(  # type: ignore[arg-type]
+                connect=self.settings.connect_timeout,
+                read=self.settings.read_timeout,
+            ),
+            extra_headers=(
+                {"Accept-Encoding": "gzip, deflate"} if self.settings.compression else None
+            ),
+        )
+        connection = get_remote_connection(
+            capabilities=copy.deepcopy(options.to_capabilities()),
+            command_executor=hub_url,
+            keep_alive=True,
+            ignore_local_proxy=False,
+            client_config=client_config,
+        )
+        # Connections through proxy keep pool of selenium
+        if not connection._proxy_url:
+            connection._conn = self.pool
+        return connection
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+class ConnectionStatsSummaryPlugin(StatsSummaryPlugin):
+    """Print connection reuse of remote sessions and HTTP overhead of commands."""
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """Print sessions with the lowest connection reuse and the slowest commands."""
+        if hasattr(terminalreporter.config, "workerinput"):  # cspell:disable-line
+            return
+        if not self.counter:
+            return
+
+        terminalreporter.write_sep("-", self.title)
+        sessions = {
+            key.removesuffix(" requests"): count
+            for key, count in self.counter.items()
+            if key.endswith(" requests")
+        }
+        total_requests = sum(sessions.values())
+        total_connections = sum(
+            self.counter[f"{session_id} new connections"] for session_id in sessions
+        )
+        terminalreporter.write_line(
+            f"requests={total_requests} new connections={total_connections} "
+            f"reuse={get_reuse(total_requests, total_connections):.0%}",
+        )
+        lowest_reuse = sorted(
+            sessions.items(),
+            key=lambda item: get_reuse(item[1], self.counter[f"{item[0]} new connections"]),
+        )[: self.top]
+        for session_id, requests in lowest_reuse:
+            connections = self.counter[f"{session_id} new connections"]
+            terminalreporter.write_line(
+                f"{session_id}: requests={requests} new connections={connections} "
+                f"reuse={get_reuse(requests, connections):.0%}",
+            )
+
+        slowest_commands = sorted(
+            (key.removesuffix(" http overhead") for key in self.timings if "overhead" in key),
+            key=lambda command: sum(self.timings[f"{command} http overhead"]),
+            reverse=True,
+        )[: self.top]
+        for command in slowest_commands:
+            overhead = self.timings[f"{command} http overhead"]
+            browser = self.timings.get(f"{command} browser", [])
+            terminalreporter.write_line(
+                f"{command}: count={len(overhead)} "
+                f"http overhead={sum(overhead):.2f}s (mean={sum(overhead) / len(overhead):.3f}s) "
+                f"browser={sum(browser):.2f}s",
+            )
+
+
+def get_reuse(requests: int, new_connections: int) -> float:
+    """Get share of requests which were sent through already open connection."""
+    return 1 - new_connections / requests if requests else 0.0
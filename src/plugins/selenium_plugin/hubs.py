@@ -0,0 +1,221 @@
+import dataclasses
+import logging
+import math
+import random
+import threading
+import time
+import urllib.parse
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from concurrent import futures
+from typing import Any
+
+import requests
+import urllib3
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Sessions and failed attempts to create session, grouped by hub
+HUB_COUNTER: Counter[str] = Counter()
+# How long balancer looked for hub for session and how long hub created it,
+# grouped by hub
+HUB_TIMINGS: defaultdict[str, list[float]] = defaultdict(list)
+
+# Errors of unreachable or slow hubs, session creation is retried on another hub
+SESSION_CREATION_ERRORS = (urllib3.exceptions.HTTPError, ConnectionError, TimeoutError)
+# Parts of `SessionNotCreatedException` messages of saturated hubs, e.g. Selenium
+# Grid rejects queued session with "New session request timed out". Other
+# errors (e.g. unsupported capabilities) fail on any hub, so they aren't retried.
+SATURATION_MESSAGES = ("timed out", "timeout", "queue", "too many", "retry count exceeded")
+
+
+def parse_hub_urls(value: str) -> list[str]:
+    """Parse comma-separated addresses of remote hubs."""
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Check if session can be created on another hub after error."""
+    if isinstance(error, SESSION_CREATION_ERRORS):
+        return True
+    if isinstance(error, SessionNotCreatedException):
+        message = (error.msg or "").lower()
+        return any(saturation_message in message for saturation_message in SATURATION_MESSAGES)
+    return False
+
+
+def redact_url(url: str) -> str:
+    """Remove credentials (`user:password@`) from url, so it can be logged."""
+    split_url = urllib.parse.urlsplit(url)
+    if "@" not in split_url.netloc:
+        return url
+    return split_url._replace(netloc=split_url.netloc.rpartition("@")[2]).geturl()
+
+
+def get_status_url(hub_url: str) -> str:
+    """Get url of hub status, both Selenoid and Selenium Grid serve it at root."""
+    return urllib.parse.urljoin(hub_url, "/status")
+
+
+@dataclasses.dataclass
+class HubStatus:
+    """Represent capacity of remote hub."""
+
+    url: str
+    # Number of browsers which hub can run, `None` if hub doesn't report it
+    total: int | None = None
+    used: int = 0
+    queued: int = 0
+    reachable: bool = True
+
+    @property
+    def load(self) -> float:
+        """Get share of busy slots, queued sessions make load higher than 1."""
+        if not self.reachable:
+            return math.inf
+        if not self.total:
+            return float(self.used + self.queued)
+        return (self.used + self.queued) / self.total
+
+    @classmethod
+    def from_payload(cls, url: str, payload: dict[str, Any]) -> "HubStatus":
+        """Parse response of status endpoint of Selenoid or Selenium Grid."""
+        # Selenoid: {"total": 20, "used": 3, "queued": 0, "pending": 1, ...}
+        if "total" in payload:
+            return cls(
+                url=url,
+                total=int(payload["total"]),
+                used=int(payload.get("used", 0)),
+                queued=int(payload.get("queued", 0)),
+            )
+        # Selenium Grid: {"value": {"ready": true, "nodes": [{"slots": [...]}]}}
+        value = payload.get("value", {})
+        nodes = value.get("nodes")
+        if nodes is None:
+            return cls(url=url, reachable=bool(value.get("ready", True)))
+        slots = [
+            slot
+            for node in nodes
+            if node.get("availability", "UP") == "UP"
+            for slot in node.get("slots", [])
+        ]
+        return cls(
+            url=url,
+            total=len(slots),
+            used=sum(1 for slot in slots if slot.get("session")),
+        )
+
+
+class HubBalancer:
+    """Place new remote sessions on the least loaded hub.
+
+    Before session creation status of each hub is polled and hubs are ranked
+    by load, sessions which are being created by current worker break ties.
+    If hub fails to create session (e.g. it's saturated and rejects queued
+    session), creation is retried with exponential backoff on the next hub.
+
+    Time before successful attempt (polling of statuses, failed attempts and
+    backoff) is recorded as placement time, time of successful `New Session`
+    command is recorded as session creation time. Hub queues session when all
+    its browsers are busy and answers only when browser is started, so time
+    spent in hub queue is part of session creation time.
+
+    """
+
+    LOGGER = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        hub_urls: list[str],
+        attempts: int = 3,
+        status_timeout: float = 2.0,
+        backoff: float = 1.0,
+        max_backoff: float = 10.0,
+    ) -> None:
+        self.hub_urls = hub_urls
+        self.attempts = max(attempts, 1)
+        self.status_timeout = status_timeout
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        # Sessions which are being created by current worker, grouped by hub
+        self._in_flight: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def get_status(self, hub_url: str) -> HubStatus:
+        try:
+            response = requests.get(get_status_url(hub_url), timeout=self.status_timeout)
+            response.raise_for_status()
+            return HubStatus.from_payload(hub_url, response.json())
+        except (requests.RequestException, ValueError) as error:
+            self.LOGGER.warning(f"Failed to get status of {redact_url(hub_url)}: {error!r}")
+            return HubStatus(url=hub_url, reachable=False)
+
+    def rank_hubs(self, exclude: str | None = None) -> list[str]:
+        """Get hubs ordered from the least loaded one, `exclude` hub goes last."""
+        if len(self.hub_urls) == 1:
+            return list(self.hub_urls)
+        with futures.ThreadPoolExecutor(max_workers=len(self.hub_urls)) as executor:
+            statuses = list(executor.map(self.get_status, self.hub_urls))
+        with self._lock:
+            in_flight = dict(self._in_flight)
+        ranked = sorted(
+            statuses,
+            key=lambda status: (
+                status.url == exclude,
+                status.load,
+                in_flight.get(status.url, 0),
+            ),
+        )
+        return [status.url for status in ranked]
+
+    def create_session(self, create: Callable[[str], WebDriver]) -> WebDriver:
+        """Create session with `create(hub_url)` on the least loaded hub."""
+        started_at = time.monotonic()
+        failed_hub = None
+        attempt = 0
+        while True:
+            hub_url = self.rank_hubs(exclude=failed_hub)[0]
+            try:
+                return self._create_on_hub(
+                    hub_url,
+                    create,
+                    placement_time=time.monotonic() - started_at,
+                )
+            except Exception as error:
+                attempt += 1
+                if attempt >= self.attempts or not is_retryable_error(error):
+                    raise
+                delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+                delay *= random.uniform(0.5, 1)
+                self.LOGGER.warning(
+                    f"Failed to create session on {redact_url(hub_url)}, "
+                    f"retrying in {delay:.1f}s: {error!r}",
+                )
+                failed_hub = hub_url
+                time.sleep(delay)
+
+    def _create_on_hub(
+        self,
+        hub_url: str,
+        create: Callable[[str], WebDriver],
+        placement_time: float,
+    ) -> WebDriver:
+        with self._lock:
+            self._in_flight[hub_url] += 1
+        # Stats are printed in terminal summary, so credentials are removed
+        stats_key = redact_url(hub_url)
+        attempt_started_at = time.monotonic()
+        try:
+            webdriver = create(hub_url)
+        except Exception:
+            HUB_COUNTER[f"{stats_key} failed attempts"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight[hub_url] -= 1
+        HUB_COUNTER[f"{stats_key} sessions"] += 1
+        HUB_TIMINGS[f"{stats_key} placement"].append(placement_time)
+        HUB_TIMINGS[f"{stats_key} session creation"].append(
+            time.monotonic() - attempt_started_at,
+        )
+        return webdriver
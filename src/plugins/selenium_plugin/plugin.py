@@ -1,7 +1,12 @@
 import pytest
 
+from plugins.summary import StatsSummaryPlugin
+
 from .collect_browser_screenshots_plugin import BrowserScreenshotLinkPlugin
+from .connection import CONNECTION_COUNTER, CONNECTION_TIMINGS, ConnectionStatsSummaryPlugin
+from .hubs import HUB_COUNTER, HUB_TIMINGS
 from .selenium_plugin import SeleniumPlugin, SupportedBrowsers
+from .watchdog import WATCHDOG_COUNTER, WATCHDOG_TIMINGS
 
 
 @pytest.hookimpl(trylast=True)
@@ -17,6 +22,35 @@ def pytest_configure(config: pytest.Config) -> None:
             plugin=BrowserScreenshotLinkPlugin(),
             name="collect_screenshot_plugin",
         )
+    if float(config.getoption("--webdriver-command-timeout")) > 0:
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=StatsSummaryPlugin(
+                name="webdriver_watchdog",
+                title="WebDriver watchdog",
+                counter=WATCHDOG_COUNTER,
+                timings=WATCHDOG_TIMINGS,
+            ),
+            name="webdriver_watchdog_summary",
+        )
+    if config.getoption("--webdriver-remote"):
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=StatsSummaryPlugin(
+                name="remote_hubs",
+                title="Remote hubs",
+                counter=HUB_COUNTER,
+                timings=HUB_TIMINGS,
+            ),
+            name="remote_hubs_summary",
+        )
+        config.pluginmanager.register(  # cspell:disable-line
+            plugin=ConnectionStatsSummaryPlugin(
+                name="remote_connections",
+                title="Remote connections",
+                counter=CONNECTION_COUNTER,
+                timings=CONNECTION_TIMINGS,
+            ),
+            name="remote_connections_summary",
+        )
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -59,7 +93,80 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     )
     parser.addoption(
         "--webdriver-remote-url",
-        help="Url to remote drivers hub",
+        help="Url to remote drivers hub, several hubs can be separated by comma",
+    )
+    parser.addoption(
+        "--webdriver-remote-session-attempts",
+        action="store",
+        default=3,
+        help="How many times to try to create remote session, each time on another hub",
+    )
+    parser.addoption(
+        "--webdriver-remote-status-timeout",
+        action="store",
+        default=2,
+        help="How much to wait for status of remote hub in seconds",
+    )
+    parser.addoption(
+        "--webdriver-remote-pool-size",
+        action="store",
+        default=2,
+        help=(
+            "How many keep-alive connections to each hub are kept by worker, "
+            "should match number of concurrent commands (test and its background threads)"
+        ),
+    )
+    parser.addoption(
+        "--webdriver-remote-connect-timeout",
+        action="store",
+        default=10,
+        help="How much to wait for connection to remote hub in seconds",
+    )
+    parser.addoption(
+        "--webdriver-remote-read-timeout",
+        action="store",
+        default=300,
+        help="How much to wait for response of remote hub to command in seconds",
+    )
+    parser.addoption(
+        "--webdriver-remote-compression",
+        action="store_true",
+        default=False,
+        help="Ask remote hub to compress responses, e.g. page sources and screenshots",
+    )
+    parser.addoption(
+        "--webdriver-bidi",
+        action="store_true",
+        default=False,
+        help=(
+            "Request WebDriver BiDi connection, it's used to track network requests "
+            "of browsers without CDP (e.g. remote ones) from document start"
+        ),
+    )
+    parser.addoption(
+        "--webdriver-command-timeout",
+        action="store",
+        default=120,
+        help=(
+            "How long single webdriver command can run in seconds, session with hung command "
+            "is killed by watchdog and replaced for next tests, `0` disables watchdog"
+        ),
+    )
+    parser.addoption(
+        "--webdriver-watchdog-output",
+        action="store",
+        default=None,
+        help=(
+            "Folder to save diagnostics of hung sessions, "
+            "by default they are saved in pytest cache folder "
+            "(or temporary folder if cache provider is disabled)"
+        ),
+    )
+    parser.addoption(
+        "--webdriver-watchdog-diagnostics-timeout",
+        action="store",
+        default=5,
+        help="How long to wait for diagnostics of hung session and for its kill in seconds",
     )
     # Screenshots collect plugin for jenkins runs
     parser.addoption(
@@ -4,8 +4,9 @@ import mimetypes
 import os
 import pathlib
 import socket
+import tempfile
 import typing
-from collections.abc import Callable
+from collections.abc import Callable, Generator
 from enum import StrEnum
 
 import pytest
@@ -18,6 +19,10 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.wait import WebDriverWait
 
+from .connection import ConnectionSettings, RemoteConnections
+from .hubs import HubBalancer, parse_hub_urls
+from .watchdog import SessionWatchdog, WatchdogSettings
+
 
 class SupportedBrowsers(StrEnum):
     """Available browsers for remote webdriver."""
@@ -65,6 +70,9 @@ class SeleniumPlugin:
         },
     }
 
+    def __init__(self) -> None:
+        self.watchdogs: list[SessionWatchdog] = []
+
     # spell-checker:disable
     @pytest.hookimpl(trylast=True)
     def pytest_collection_modifyitems(
@@ -85,6 +93,14 @@ class SeleniumPlugin:
 
     # spell-checker:enable
 
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_teardown(self, item: pytest.Item) -> None:
+        """Tear down fixtures of sessions which were killed by watchdog during test."""
+        for watchdog in self.watchdogs:
+            if watchdog.hung:
+                watchdog.discard()
+        self.watchdogs = [watchdog for watchdog in self.watchdogs if watchdog.running]
+
     @pytest.fixture(scope="session")
     def webdriver_name(self, request: SubRequest) -> SupportedBrowsers:
         raw_browser_name = request.config.getoption("--webdriver")
@@ -111,12 +127,81 @@ class SeleniumPlugin:
         return bool(request.config.getoption("--webdriver-remote"))
 
     @pytest.fixture(scope="session")
-    def remote_url(self, request: SubRequest) -> str:
-        """Get address of remote browser hub."""
+    def bidi(self, request: SubRequest) -> bool:
+        return bool(request.config.getoption("--webdriver-bidi"))
+
+    @pytest.fixture(scope="session")
+    def remote_urls(self, request: SubRequest) -> list[str]:
+        """Get addresses of remote browser hubs, they can be separated by comma."""
         remote_url = request.config.getoption("--webdriver-remote-url")
-        if remote_url:
-            return remote_url
-        return os.environ["REMOTE_BROWSER_ADDR"]
+        return parse_hub_urls(remote_url or os.environ["REMOTE_BROWSER_ADDR"])
+
+    @pytest.fixture(scope="session")
+    def remote_url(self, remote_urls: list[str]) -> str:
+        """Get address of remote browser hub, the first one if there are many."""
+        return remote_urls[0]
+
+    @pytest.fixture(scope="session")
+    def hub_balancer(
+        self,
+        request: SubRequest,
+        remote: bool,
+        remote_urls: list[str],
+    ) -> HubBalancer | None:
+        """Get balancer which places remote sessions on the least loaded hub."""
+        if not remote:
+            return None
+        return HubBalancer(
+            hub_urls=remote_urls,
+            attempts=int(request.config.getoption("--webdriver-remote-session-attempts")),
+            status_timeout=float(request.config.getoption("--webdriver-remote-status-timeout")),
+        )
+
+    @pytest.fixture(scope="session")
+    def remote_connections(
+        self,
+        request: SubRequest,
+        remote: bool,
+    ) -> Generator[RemoteConnections | None]:
+        """Get connections to remote hubs which share keep-alive connections of worker."""
+        if not remote:
+            yield None
+            return
+        connections = RemoteConnections(
+            ConnectionSettings(
+                pool_size=int(request.config.getoption("--webdriver-remote-pool-size")),
+                connect_timeout=float(
+                    request.config.getoption("--webdriver-remote-connect-timeout"),
+                ),
+                read_timeout=float(request.config.getoption("--webdriver-remote-read-timeout")),
+                compression=bool(request.config.getoption("--webdriver-remote-compression")),
+            ),
+        )
+        yield connections
+        connections.close()
+
+    @pytest.fixture(scope="session")
+    def watchdog_settings(self, request: SubRequest) -> WatchdogSettings | None:
+        """Get deadlines of webdriver commands, `None` if watchdog is disabled."""
+        command_timeout = float(request.config.getoption("--webdriver-command-timeout"))
+        if command_timeout <= 0:
+            return None
+        output_dir = request.config.getoption("--webdriver-watchdog-output")
+        if not output_dir:
+            # Cache is missing when cache provider is disabled (`-p no:cacheprovider`)
+            cache = getattr(request.config, "cache", None)
+            output_dir = (
+                cache.mkdir("webdriver_watchdog")
+                if cache
+                else tempfile.mkdtemp(prefix="webdriver_watchdog_")
+            )
+        return WatchdogSettings(
+            command_timeout=command_timeout,
+            output_dir=pathlib.Path(output_dir),
+            diagnostics_timeout=float(
+                request.config.getoption("--webdriver-watchdog-diagnostics-timeout"),
+            ),
+        )
 
     @pytest.fixture(scope="session")
     def tmp_download_dir(self, tmpdir_factory: pytest.TempdirFactory) -> pathlib.Path:
@@ -253,22 +338,25 @@ class SeleniumPlugin:
         edge_options: selenium_webdriver.EdgeOptions,
         remote_options: ArgOptions,
         remote: bool,
+        bidi: bool,
     ) -> BaseOptions:
         """Browser options.
 
         By default return chrome options.
 
         """
+        options: BaseOptions
         if remote:
-            return remote_options
-
-        if webdriver_name == SupportedBrowsers.FIREFOX:
-            return firefox_options
-
-        if webdriver_name in (SupportedBrowsers.EDGE, SupportedBrowsers.MICROSOFT_EDGE):
-            return edge_options
-
-        return chrome_options
+            options = remote_options
+        elif webdriver_name == SupportedBrowsers.FIREFOX:
+            options = firefox_options
+        elif webdriver_name in (SupportedBrowsers.EDGE, SupportedBrowsers.MICROSOFT_EDGE):
+            options = edge_options
+        else:
+            options = chrome_options
+        if bidi:
+            options.enable_bidi = True
+        return options
 
     @pytest.fixture(scope="session")
     def driver_class(self, webdriver_name: SupportedBrowsers, remote: bool) -> type[WebDriver]:
@@ -282,12 +370,12 @@ class SeleniumPlugin:
         self,
         remote_url: str,
         options: BaseOptions,
-        remote: bool,
+        remote_connections: RemoteConnections | None,
     ) -> dict[str, typing.Any]:
         """Set up kwargs for webdriver class init."""
         kwargs: dict[str, typing.Any] = {"options": options}
-        if remote:
-            kwargs["command_executor"] = remote_url
+        if remote_connections:
+            kwargs["command_executor"] = remote_connections.get(remote_url, options)
         return kwargs
 
     @pytest.fixture(scope="session")
@@ -298,6 +386,9 @@ class SeleniumPlugin:
         driver_kwargs: dict[str, typing.Any],
         window_size: WidthHeight,
         implicitly_wait: int,
+        hub_balancer: HubBalancer | None,
+        remote_connections: RemoteConnections | None,
+        watchdog_settings: WatchdogSettings | None,
     ) -> Callable[..., WebDriver]:
         """Fixture for webdriver."""
         return functools.partial(
@@ -307,6 +398,9 @@ class SeleniumPlugin:
             driver_kwargs=driver_kwargs,
             window_size=window_size,
             implicitly_wait=implicitly_wait,
+            hub_balancer=hub_balancer,
+            remote_connections=remote_connections,
+            watchdog_settings=watchdog_settings,
         )
 
     def webdriver_factory(
@@ -317,9 +411,30 @@ class SeleniumPlugin:
         driver_kwargs: dict[str, typing.Any],
         window_size: WidthHeight,
         implicitly_wait: int,
+        hub_balancer: HubBalancer | None = None,
+        remote_connections: RemoteConnections | None = None,
+        watchdog_settings: WatchdogSettings | None = None,
     ) -> WebDriver:
         """Return a WebDriver instance based on capabilities."""
-        webdriver = driver_class(**driver_kwargs)
+        if hub_balancer:
+            webdriver = hub_balancer.create_session(
+                lambda hub_url: driver_class(
+                    **{
+                        **driver_kwargs,
+                        "command_executor": (
+                            remote_connections.get(hub_url, driver_kwargs["options"])
+                            if remote_connections
+                            else hub_url
+                        ),
+                    },
+                ),
+            )
+        else:
+            webdriver = driver_class(**driver_kwargs)
+        if watchdog_settings:
+            watchdog = SessionWatchdog(webdriver, request=request, settings=watchdog_settings)
+            watchdog.start()
+            self.watchdogs.append(watchdog)
         webdriver.set_window_size(*window_size)
         webdriver.implicitly_wait(implicitly_wait)
 
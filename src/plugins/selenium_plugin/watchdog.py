@@ -0,0 +1,260 @@
+import base64
+import dataclasses
+import json
+import logging
+import pathlib
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from _pytest.fixtures import SubRequest
+from selenium.common.exceptions import InvalidSessionIdException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from .connection import abort_request
+
+# Hung commands, killed and replaced sessions
+WATCHDOG_COUNTER: Counter[str] = Counter()
+# How long hung commands ran and how long watchdog handled them
+WATCHDOG_TIMINGS: defaultdict[str, list[float]] = defaultdict(list)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BrowserHungError(InvalidSessionIdException):
+    """Raised when command exceeded its deadline and session was killed by watchdog.
+
+    Session is gone, so error isn't retried like other invalid session errors.
+
+    """
+
+
+@dataclasses.dataclass(frozen=True)
+class WatchdogSettings:
+    """Represent deadlines of webdriver commands."""
+
+    # How long single command can run before session is considered hung
+    command_timeout: float
+    # Where diagnostics of hung sessions are saved
+    output_dir: pathlib.Path
+    # How long to wait for diagnostics and session kill
+    diagnostics_timeout: float = 5.0
+
+
+@dataclasses.dataclass(frozen=True)
+class RunningCommand:
+    """Represent command which is being executed by webdriver."""
+
+    name: str
+    thread_id: int
+    started_at: float = dataclasses.field(default_factory=time.monotonic)
+
+
+def run_with_timeout[T](func: Callable[[], T], timeout: float) -> T | None:
+    """Run `func` in background thread, return `None` if it fails or doesn't finish in time.
+
+    Thread which didn't finish is left behind, it's stopped by timeout of connection.
+
+    """
+    results: list[T] = []
+
+    def target() -> None:
+        try:
+            results.append(func())
+        except Exception:
+            LOGGER.warning("Watchdog action failed", exc_info=True)
+
+    thread = threading.Thread(target=target, name="webdriver-watchdog-action", daemon=True)
+    thread.start()
+    thread.join(timeout=timeout)
+    return results[0] if results else None
+
+
+class SessionWatchdog:
+    """Kill session if its command doesn't finish before deadline.
+
+    Commands of webdriver are tracked and background thread checks their
+    duration. When command exceeds `command_timeout`, watchdog captures
+    diagnostics (screenshot, page source, url and browser log) which browser
+    manages to return, kills session and breaks connection of hung command.
+    Hung command and all next ones raise `BrowserHungError`, so only the
+    current test fails and fixture of session is recreated for next tests
+    (see `discard`).
+
+    Remote sessions are killed by `Delete Session` command, local ones by
+    killing of driver process.
+
+    """
+
+    def __init__(
+        self,
+        webdriver: WebDriver,
+        request: SubRequest,
+        settings: WatchdogSettings,
+    ) -> None:
+        self.webdriver = webdriver
+        self.request = request
+        self.settings = settings
+        self.session_id = str(webdriver.session_id)
+        self.hung_command: RunningCommand | None = None
+        self.diagnostics_dir: pathlib.Path | None = None
+        self._execute = webdriver.execute
+        self._command: RunningCommand | None = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._watch,
+            name=f"webdriver-watchdog-{self.session_id}",
+            daemon=True,
+        )
+
+    @property
+    def hung(self) -> bool:
+        return self.hung_command is not None
+
+    @property
+    def running(self) -> bool:
+        return not self._stopped.is_set()
+
+    def start(self) -> None:
+        """Start tracking of commands of webdriver."""
+        self.webdriver.execute = self.execute  # type: ignore[method-assign, assignment]
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def execute(self, driver_command: str, params: dict[str, Any] | None = None) -> Any:
+        """Execute command of webdriver and track its duration."""
+        if self.hung:
+            if driver_command == Command.QUIT:
+                # Session is already killed
+                self.stop()
+                return {"value": None}
+            raise BrowserHungError(self.get_error_message())
+
+        command = RunningCommand(name=driver_command, thread_id=threading.get_ident())
+        self._command = command
+        try:
+            return self._execute(driver_command, params)
+        except Exception as error:
+            if self.hung_command is command:
+                raise BrowserHungError(self.get_error_message()) from error
+            raise
+        finally:
+            self._command = None
+            if driver_command == Command.QUIT:
+                self.stop()
+
+    def get_error_message(self) -> str:
+        assert self.hung_command
+        message = (
+            f"Command `{self.hung_command.name}` didn't finish in "
+            f"{self.settings.command_timeout}s, session {self.session_id} was killed by watchdog"
+        )
+        if self.diagnostics_dir:
+            message += f", diagnostics are saved in {self.diagnostics_dir}"
+        return message
+
+    def _watch(self) -> None:
+        poll_interval = min(self.settings.command_timeout / 10, 1.0)
+        while not self._stopped.wait(poll_interval):
+            command = self._command
+            if command and time.monotonic() - command.started_at > self.settings.command_timeout:
+                self.handle_hang(command)
+                return
+
+    def handle_hang(self, command: RunningCommand) -> None:
+        """Save diagnostics, kill session and unblock hung command."""
+        LOGGER.error(
+            f"Command `{command.name}` of session {self.session_id} didn't finish in "
+            f"{self.settings.command_timeout}s, killing session",
+        )
+        WATCHDOG_COUNTER["hung commands"] += 1
+        WATCHDOG_COUNTER[f"{command.name} hangs"] += 1
+
+        started_at = time.monotonic()
+        self.diagnostics_dir = self.capture_diagnostics()
+        WATCHDOG_TIMINGS["diagnostics capture"].append(time.monotonic() - started_at)
+        # Commands which are sent after this point fail at once
+        self.hung_command = command
+
+        started_at = time.monotonic()
+        self.kill_session()
+        abort_request(command.thread_id)
+        WATCHDOG_COUNTER["killed sessions"] += 1
+        WATCHDOG_TIMINGS["session kill"].append(time.monotonic() - started_at)
+        WATCHDOG_TIMINGS["hung command duration"].append(time.monotonic() - command.started_at)
+        self.stop()
+
+    def capture_diagnostics(self) -> pathlib.Path | None:
+        """Save diagnostics which browser returns in time, all of them are requested at once."""
+        captures: dict[str, Callable[[], bytes]] = {
+            "screenshot.png": lambda: base64.b64decode(self._execute(Command.SCREENSHOT)["value"]),
+            "page_source.html": lambda: self._execute(Command.GET_PAGE_SOURCE)["value"].encode(),
+            "url.txt": lambda: self._execute(Command.GET_CURRENT_URL)["value"].encode(),
+            "browser_log.json": lambda: json.dumps(
+                self._execute("getLog", {"type": "browser"})["value"],
+                indent=2,
+            ).encode(),
+        }
+        results: dict[str, bytes] = {}
+
+        def capture(name: str, get_data: Callable[[], bytes]) -> None:
+            try:
+                results[name] = get_data()
+            except Exception:
+                LOGGER.warning(f"Failed to capture {name} of session {self.session_id}")
+
+        threads = [
+            threading.Thread(
+                target=capture,
+                args=(name, get_data),
+                name=f"webdriver-watchdog-{name}",
+                daemon=True,
+            )
+            for name, get_data in captures.items()
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + self.settings.diagnostics_timeout
+        for thread in threads:
+            thread.join(timeout=max(deadline - time.monotonic(), 0))
+        if not results:
+            LOGGER.warning(f"Failed to capture diagnostics of session {self.session_id}")
+            return None
+
+        diagnostics_dir = self.settings.output_dir / self.session_id
+        diagnostics_dir.mkdir(parents=True, exist_ok=True)
+        for name, data in dict(results).items():
+            (diagnostics_dir / name).write_bytes(data)
+        WATCHDOG_COUNTER["sessions with diagnostics"] += 1
+        return diagnostics_dir
+
+    def kill_session(self) -> None:
+        service = getattr(self.webdriver, "service", None)
+        if service and service.process:
+            # Local driver handles commands of session one by one, so it
+            # can't delete session while command hangs
+            service.process.kill()
+            return
+        run_with_timeout(
+            lambda: self._execute(Command.QUIT),
+            timeout=self.settings.diagnostics_timeout,
+        )
+
+    def discard(self) -> None:
+        """Tear down fixture of hung session, so next tests get a new one."""
+        fixturedef = getattr(self.request, "_fixturedef", None)
+        if not fixturedef:
+            return
+        try:
+            fixturedef.finish(self.request)
+        except Exception:
+            LOGGER.warning(
+                f"Failed to tear down `{fixturedef.argname}` of hung session",
+                exc_info=True,
+            )
+        WATCHDOG_COUNTER["replaced sessions"] += 1
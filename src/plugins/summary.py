@@ -0,0 +1,81 @@
+from collections import Counter
+from typing import Any
+
+import pytest
+from _pytest.terminal import TerminalReporter
+
+
+class StatsSummaryPlugin:
+    """Print counters and timings collected during session in terminal summary.
+
+    In xdist run tests are executed in workers, so stats of each worker are
+    sent to controller in `workeroutput` and merged there.
+
+    Usage:
+
+        config.pluginmanager.register(
+            plugin=StatsSummaryPlugin(
+                name="page_open_paths",
+                title="Page open paths",
+                counter=OPEN_PATHS_COUNTER,
+            ),
+            name="page_open_paths_summary",
+        )
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        title: str,
+        counter: Counter[str] | None = None,
+        timings: dict[str, list[float]] | None = None,
+        top: int = 10,
+    ) -> None:
+        self.name = name
+        self.title = title
+        self.counter = counter if counter is not None else Counter()
+        self.timings = timings if timings is not None else {}
+        self.top = top
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Send stats of worker to controller."""
+        workeroutput = getattr(session.config, "workeroutput", None)  # cspell:disable-line
+        if workeroutput is None:
+            return
+        workeroutput[self.name] = {
+            "counter": dict(self.counter),
+            "timings": dict(self.timings),
+        }
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: Any, error: Any) -> None:
+        """Merge stats of finished worker."""
+        worker_stats = getattr(node, "workeroutput", {}).get(self.name)  # cspell:disable-line
+        if not worker_stats:
+            return
+        self.counter.update(worker_stats["counter"])
+        for key, timings in worker_stats["timings"].items():
+            self.timings.setdefault(key, []).extend(timings)
+
+    def pytest_terminal_summary(self, terminalreporter: TerminalReporter) -> None:
+        """Print the most frequent counters and the slowest timings."""
+        if hasattr(terminalreporter.config, "workerinput"):  # cspell:disable-line
+            return
+        if not self.counter and not self.timings:
+            return
+
+        terminalreporter.write_sep("-", self.title)
+        for key, count in self.counter.most_common(self.top):
+            terminalreporter.write_line(f"{count:>8} {key}")
+
+        slowest_timings = sorted(
+            self.timings.items(),
+            key=lambda item: sum(item[1]),
+            reverse=True,
+        )[: self.top]
+        for key, timings in slowest_timings:
+            terminalreporter.write_line(
+                f"{key}: count={len(timings)} total={sum(timings):.2f}s "
+                f"mean={sum(timings) / len(timings):.3f}s max={max(timings):.3f}s",
+            )
@@ -1,18 +1,69 @@
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 
 import pytest
 from _pytest.fixtures import SubRequest
-from phuongpv_blog_api_client import AuthenticatedClient, Client, models
-from phuongpv_blog_api_client.api.auth import auth_login_create
+from phuongpv_blog_api_client import AuthenticatedClient
 from selenium.webdriver.remote.webdriver import WebDriver
 
-from plugins.selenium_plugin.cache_decorators import get_cache_name
+from api.auth import get_api_client, get_api_token
+from api.decorators import CONSISTENCY_TIMINGS
+from api_factories.post_factory import post_factory
+from plugins.api_plugin.object_pools import get_object_pools
+from plugins.selenium_plugin.cache_decorators import get_cache_name, get_shared_cache_name
+from plugins.summary import StatsSummaryPlugin
 
+from pages import caching
 from pages.auth import SignInPage
 from pages.base_pages import BlogPage
+from pages.common.form_filling import keystroke_typing
+from pages.element_cache import ELEMENT_CACHE_COUNTER
+from pages.network import install_network_tracker
+from pages.utils import RETRY_BUDGET, RETRY_BUDGET_STATE, RETRY_COUNTER, RETRY_TIMINGS
 
-pytest_plugins = ("plugins.selenium_plugin.plugin",)
+pytest_plugins = (
+    "plugins.selenium_plugin.plugin",
+    "plugins.api_plugin.plugin",
+    "plugins.impact_plugin.plugin",
+    "plugins.profiling_plugin.plugin",
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register summaries of project stats."""
+    config.pluginmanager.register(  # cspell:disable-line
+        plugin=StatsSummaryPlugin(
+            name="page_open_paths",
+            title="Page open paths",
+            counter=caching.OPEN_PATHS_COUNTER,
+        ),
+        name="page_open_paths_summary",
+    )
+    config.pluginmanager.register(  # cspell:disable-line
+        plugin=StatsSummaryPlugin(
+            name="api_consistency",
+            title="API consistency time",
+            timings=CONSISTENCY_TIMINGS,
+        ),
+        name="api_consistency_summary",
+    )
+    config.pluginmanager.register(  # cspell:disable-line
+        plugin=StatsSummaryPlugin(
+            name="element_cache",
+            title="Element references cache",
+            counter=ELEMENT_CACHE_COUNTER,
+        ),
+        name="element_cache_summary",
+    )
+    config.pluginmanager.register(  # cspell:disable-line
+        plugin=StatsSummaryPlugin(
+            name="retries",
+            title="Retried actions",
+            counter=RETRY_COUNTER,
+            timings=RETRY_TIMINGS,
+        ),
+        name="retries_summary",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -22,25 +73,45 @@ def phuongpv_api_client(request: SubRequest, worker_id: str) -> AuthenticatedCli
     token = request.config.cache.get(token_cache, None)  # type: ignore
 
     if not request.config.getoption("--use-cache") or not token:
-        token = auth_login_create.sync(
-            client=Client(f"{os.environ['APP_BASE_URL']}"),  # type: ignore
-            body=models.AuthTokenRequest(
-                email=os.environ["SUPER_USER_EMAIL"],
-                password=os.environ["SUPER_USER_PASSWORD"],
-            ),
-        )
-        if not isinstance(token, models.Token):
-            raise ValueError(f"Failed to get a token. Got: {token}")
-        token = token.token
+        token = get_api_token()
 
     request.config.cache.set(token_cache, token)  # type: ignore
 
-    return AuthenticatedClient(
-        base_url=os.environ["APP_BASE_URL"],
-        prefix="token",
-        token=token,
-        raise_on_unexpected_status=True,
-    )
+    return get_api_client(token)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def api_pools(request: SubRequest) -> None:
+    """Start filling pools of pooled API factories at session start."""
+    if not get_object_pools(request):
+        return
+    post_factory.prefill(request, request.getfixturevalue("phuongpv_api_client"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def persistent_page_urls_cache(request: SubRequest) -> None:
+    """Persist page urls cached by `memoize_open` through fixtures cache."""
+    if request.config.getoption("--use-cache"):
+        caching.enable_persistent_urls_cache(
+            storage=request.config.cache,  # type: ignore
+            namespace=get_shared_cache_name("page_urls"),
+        )
+
+
+@pytest.fixture(autouse=True)
+def retry_budget() -> None:
+    """Give each test its own time budget for retries of selenium actions."""
+    RETRY_BUDGET_STATE.reset(RETRY_BUDGET)
+
+
+@pytest.fixture(autouse=True)
+def keystroke_typing_marker(request: SubRequest) -> Iterator[None]:
+    """Disable bulk fill of forms for tests marked with `keystroke_typing`."""
+    if not request.node.get_closest_marker("keystroke_typing"):
+        yield
+        return
+    with keystroke_typing():
+        yield
 
 
 @pytest.fixture
@@ -49,7 +120,9 @@ def webdriver(
     webdriver_getter: Callable[..., WebDriver],
 ) -> WebDriver:
     """Initialize webdriver for unauthorized session."""
-    return webdriver_getter(request)
+    webdriver = webdriver_getter(request)
+    install_network_tracker(webdriver)
+    return webdriver
 
 
 @pytest.fixture(scope="session")
@@ -59,6 +132,7 @@ def superuser_webdriver(
 ) -> WebDriver:
     """Initialize webdriver for `super user` session."""
     webdriver = webdriver_getter(request)
+    install_network_tracker(webdriver)
     blog_page = SignInPage.open(webdriver).sign_in(
         username=os.environ["SUPER_USER_USERNAME"],
         password=os.environ["SUPER_USER_PASSWORD"],
@@ -1,4 +1,8 @@
 import pytest
+from _pytest.fixtures import SubRequest
+from phuongpv_blog_api_client import AuthenticatedClient, models
+
+from api_factories.post_factory import post_factory
 
 from pages.base_pages import BlogPage
 from pages.posts.post_create_page import PostCreatePage
@@ -9,3 +13,12 @@ def post_create_page(blog_page: BlogPage) -> PostCreatePage:
     """Initialize Create Post page for superuser."""
     blog_page.create_post_button.click()
     return PostCreatePage(blog_page.webdriver)
+
+
+@pytest.fixture
+def existing_post(
+    request: SubRequest,
+    phuongpv_api_client: AuthenticatedClient,
+) -> models.Post:
+    """Provide blog post created via API (taken from pool with `--api-pools`)."""
+    return post_factory(request, phuongpv_api_client)
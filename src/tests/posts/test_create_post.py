@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 import pytest
 from phuongpv_blog_api_client import AuthenticatedClient, models
 from slugify import slugify
@@ -22,19 +24,25 @@ def test_create_post(
     phuongpv_api_client: AuthenticatedClient,
     post: models.Post,
     post_create_page: PostCreatePage,
+    api_cleanup: Callable[..., None],
 ):
     """Ensure admin can create post with expected content."""
     post_details_page = post_create_page.create(post)
 
     # Check API data
-    created_post = api.get_post_by_name(phuongpv_api_client, post.title)
+    created_post = api.wait_for_post_by_name(phuongpv_api_client, post.title)
     assert created_post
 
     # Check UI data
-    assert post_details_page.title.get_text() == post.title
-    assert post_details_page.description.get_text() == post.description
-    assert post_details_page.content.get_text() == post.content
+    title, description, content = post_details_page.snapshot(
+        post_details_page.title,
+        post_details_page.description,
+        post_details_page.content,
+    )
+    assert title.text == post.title
+    assert description.text == post.description
+    assert content.text == post.content
     assert slugify(post.title) in post_details_page.current_url
 
     # Cleanup
-    api.delete_post(phuongpv_api_client, created_post.id)
+    api_cleanup(api.delete_post, phuongpv_api_client, created_post.id)
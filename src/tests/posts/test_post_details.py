@@ -0,0 +1,18 @@
+from phuongpv_blog_api_client import models
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.posts.post_details_page import PostDetailsPage
+
+
+def test_post_details(superuser_webdriver: WebDriver, existing_post: models.Post):
+    """Ensure post created via API is shown with expected content."""
+    post_details_page = PostDetailsPage.open(superuser_webdriver, post=existing_post)
+
+    title, description, content = post_details_page.snapshot(
+        post_details_page.title,
+        post_details_page.description,
+        post_details_page.content,
+    )
+    assert title.text == existing_post.title
+    assert description.text == existing_post.description
+    assert content.text == existing_post.content
@@ -4,7 +4,9 @@ import invocations
 from invoke import Collection
 
 ns = Collection(
+    invocations.api,
     invocations.linters,
+    invocations.pages,
     invocations.pre_commit,
     invocations.printing,
     invocations.project,